@@ -0,0 +1,202 @@
+import itertools
+import random
+from contextvars import Token
+from typing import Callable
+
+from locust import TaskSet, events
+from locust.env import Environment
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
+from clients.grpc.gateway.documents.client import (
+    DocumentsGatewayGRPCClient,
+    build_documents_gateway_locust_grpc_client
+)
+from clients.grpc.gateway.operations.client import (
+    OperationsGatewayGRPCClient,
+    build_operations_gateway_locust_grpc_client
+)
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.documents.client import (
+    DocumentsGatewayHTTPClient,
+    build_documents_gateway_locust_http_client
+)
+from clients.http.gateway.operations.client import (
+    OperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client
+)
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.config.sessions import END_STATE, SessionModelConfig
+from tools.metrics.context import set_request_context, reset_request_context
+from tools.sessions import load_session_model
+
+# Протоколы, через которые может работать протоколо-независимый сценарий
+PROTOCOLS = ("http", "grpc")
+
+# Номера пользователей текущего запуска — часть зерна генератора случайных чисел пользователя
+_user_numbers = itertools.count()
+
+
+def get_user_seed(environment: Environment) -> str:
+    """
+    Возвращает зерно генератора случайных чисел для очередного пользователя.
+
+    Зерно зависит только от --scenario-seed, номера воркера и порядкового номера пользователя,
+    поэтому при одинаковом количестве пользователей запуски по HTTP и gRPC получают одинаковые
+    последовательности выбора задач и тестовых данных.
+
+    :param environment: Окружение Locust.
+    :return: Зерно для random.Random.
+    """
+    worker_index = getattr(environment.runner, "worker_index", 0)
+    return f"{environment.parsed_options.scenario_seed}:{worker_index}:{next(_user_numbers)}"
+
+
+class GatewayTaskSet(TaskSet):
+    """
+    Базовый TaskSet для протоколо-независимых сценариев: один и тот же сценарий работает
+    с http-gateway или grpc-gateway в зависимости от --protocol (в v1.0.conf или командной строке).
+
+    API клиентов обоих протоколов совпадает по методам и аргументам, поэтому задачи пишутся один раз.
+    Выбор задач и тестовых данных идёт через self.random — детерминированный генератор пользователя.
+    """
+
+    protocol: str
+    seed: str
+    random: random.Random
+    users_gateway_client: UsersGatewayHTTPClient | UsersGatewayGRPCClient
+    cards_gateway_client: CardsGatewayHTTPClient | CardsGatewayGRPCClient
+    accounts_gateway_client: AccountsGatewayHTTPClient | AccountsGatewayGRPCClient
+    documents_gateway_client: DocumentsGatewayHTTPClient | DocumentsGatewayGRPCClient
+    operations_gateway_client: OperationsGatewayHTTPClient | OperationsGatewayGRPCClient
+
+    def on_start(self) -> None:
+        """
+        Создание API клиентов выбранного протокола и генератора случайных чисел пользователя.
+        """
+        environment = self.user.environment
+        self.protocol = environment.parsed_options.protocol
+        self.seed = get_user_seed(environment)
+        self.random = random.Random(self.seed)
+
+        if self.protocol == "grpc":
+            self.users_gateway_client = build_users_gateway_locust_grpc_client(environment)
+            self.cards_gateway_client = build_cards_gateway_locust_grpc_client(environment)
+            self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(environment)
+            self.documents_gateway_client = build_documents_gateway_locust_grpc_client(environment)
+            self.operations_gateway_client = build_operations_gateway_locust_grpc_client(environment)
+        else:
+            self.users_gateway_client = build_users_gateway_locust_http_client(environment)
+            self.cards_gateway_client = build_cards_gateway_locust_http_client(environment)
+            self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment)
+            self.documents_gateway_client = build_documents_gateway_locust_http_client(environment)
+            self.operations_gateway_client = build_operations_gateway_locust_http_client(environment)
+
+    def get_next_task(self):
+        return self.random.choice(self.tasks)
+
+
+class SessionTaskSet(GatewayTaskSet):
+    """
+    GatewayTaskSet с марковской моделью сессии вместо независимого выбора задач по весам.
+
+    Состояния модели — имена задач TaskSet (get_accounts, get_operations, ...). Следующая задача
+    выбирается по вероятностям переходов из текущей, а пауза перед ней — из распределения перехода,
+    поэтому порядок запросов и повторные обращения к одним и тем же данным внутри сессии
+    (а значит, и попадания в кэши бэкенда) получаются как у реальных пользователей.
+    По переходу "end" сессия завершается: вызывается on_session_start и начинается новая.
+
+    Модель задаётся JSON-файлом --session-model (в v1.0.conf или командной строке; строится по журналу
+    запросов через `python -m tools.sessions`) или атрибутом session_model. Без модели задачи
+    выбираются по весам, как в GatewayTaskSet.
+    """
+
+    session_model: SessionModelConfig | None = None
+
+    model: SessionModelConfig | None
+    state: str | None
+    next_state: str | None
+    session_number: int
+    session_token: Token | None
+    session_tasks: dict[str, Callable]
+
+    def on_start(self) -> None:
+        super().on_start()
+        path = self.user.environment.parsed_options.session_model
+        self.model = load_session_model(path) if path else self.session_model
+        self.state, self.next_state = None, None
+        self.session_number = 0
+        self.session_token = None
+
+        if self.model is not None:
+            self.session_tasks = {task.__name__: task for task in self.tasks}
+            missing = self.model.states - set(self.session_tasks)
+            if missing:
+                raise ValueError(f"{type(self).__name__} has no tasks for session states: {sorted(missing)}")
+
+    def on_stop(self) -> None:
+        self.end_session()
+
+    def on_session_start(self) -> None:
+        """
+        Вызывается перед первым действием каждой сессии (например, чтобы выбрать другого тестового пользователя).
+        """
+
+    def start_session(self) -> str:
+        # Идентификатор сессии попадает в контекст запросов: журнал --record-requests сохраняет его
+        self.end_session()
+        self.session_token = set_request_context(session=f"{self.seed}:{self.session_number}")
+        self.session_number += 1
+        self.on_session_start()
+        return self.model.get_initial_state(self.random)
+
+    def end_session(self) -> None:
+        if self.session_token is not None:
+            reset_request_context(self.session_token)
+            self.session_token = None
+
+    def get_next_task(self):
+        if self.model is None:
+            return super().get_next_task()
+
+        self.state = self.next_state or self.start_session()
+        self.next_state = None
+        return self.session_tasks[self.state]
+
+    def wait_time(self):
+        # Следующее действие выбирается до паузы: пауза зависит от перехода
+        if self.model is None or self.state is None:
+            return super().wait_time()
+
+        state, transition = self.model.get_transition(self.state, self.random)
+        self.next_state = None if state == END_STATE else state
+        if transition.think_time is None:
+            return super().wait_time()
+
+        return transition.think_time.sample(self.random)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--protocol",
+        choices=PROTOCOLS,
+        default="http",
+        env_var="LOCUST_PROTOCOL",
+        help="Протокол протоколо-независимых сценариев (GatewayTaskSet)",
+    )
+    parser.add_argument(
+        "--scenario-seed",
+        type=int,
+        default=0,
+        env_var="LOCUST_SCENARIO_SEED",
+        help="Зерно генераторов случайных чисел пользователей протоколо-независимых сценариев",
+    )
+
+
+@events.test_start.add_listener
+def on_test_start(environment: Environment, **kwargs):
+    global _user_numbers
+    _user_numbers = itertools.count()
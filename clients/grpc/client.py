@@ -1,8 +1,12 @@
+import asyncio
+
+from google.protobuf.message import Message
+
 # Импортируем поддержку работы gRPC с потоками (greenlets)
 import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, Future, UnaryUnaryMultiCallable
 
 # Инициализируем поддержку gevent в gRPC.
 grpc_gevent.init_gevent()
@@ -24,3 +28,63 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient(GRPCClient):
+    """
+    Базовый класс asyncio-варианта gRPC-клиента.
+
+    grpc.aio несовместим с gevent: Locust патчит стандартную библиотеку, и поллер grpc.aio
+    блокирует весь процесс. Поэтому асинхронный клиент работает через тот же канал,
+    что и синхронный (с init_gevent и LocustInterceptor): вызов выполняется через
+    stub.Method.future(...), а его завершение передаётся в asyncio-future.
+    Так корутины одного event loop выполняют вызовы конкурентно и не блокируют друг друга.
+    """
+
+    async def call(self, method: UnaryUnaryMultiCallable, request: Message) -> Message:
+        """
+        Выполняет unary-unary вызов, не блокируя event loop.
+
+        :param method: Метод stub (например, self.stub.GetAccounts).
+        :param request: gRPC-запрос.
+        :return: gRPC-ответ.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(call: Future) -> None:
+            # Корутина могла быть отменена, пока вызов выполнялся
+            if future.done():
+                return
+            try:
+                future.set_result(call.result())
+            except Exception as error:
+                future.set_exception(error)
+
+        call = method.future(request)
+        call.add_done_callback(lambda done: loop.call_soon_threadsafe(resolve, done))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+
+
+def fan_out(*futures: Future) -> list[Message]:
+    """
+    Дожидается нескольких параллельно запущенных gRPC-вызовов.
+
+    Вызовы запускаются заранее через stub.Method.future(...) (методы *_future клиентов),
+    поэтому выполняются одновременно — так, как это делает мобильное приложение при загрузке экрана.
+    Функция ждёт завершения всех вызовов, даже если какой-то из них упал,
+    чтобы каждый попал в статистику Locust, и только затем пробрасывает первую ошибку.
+
+    :param futures: gRPC future-объекты запущенных вызовов.
+    :return: Ответы в том же порядке, что и переданные future.
+    """
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+
+    return [future.result() for future in futures]
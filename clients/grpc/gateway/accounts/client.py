@@ -1,7 +1,7 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -90,6 +90,16 @@ class AccountsGatewayGRPCClient(GRPCClient):
         request = GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
 
+    def get_accounts_future(self, user_id: str) -> Future:
+        """
+        Неблокирующий вариант get_accounts для параллельных вызовов (см. fan_out).
+
+        :param user_id: Идентификатор пользователя.
+        :return: gRPC future, результатом которого будет GetAccountsResponse.
+        """
+        request = GetAccountsRequest(user_id=user_id)
+        return self.stub.GetAccounts.future(request)
+
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
         request = OpenDepositAccountRequest(user_id=user_id)
         return self.open_deposit_account_api(request)
@@ -107,6 +117,88 @@ class AccountsGatewayGRPCClient(GRPCClient):
         return self.open_credit_card_account_api(request)
 
 
+class AccountsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с AccountsGatewayService.
+    Повторяет высокоуровневые методы AccountsGatewayGRPCClient, вызовы выполняются через AsyncGRPCClient.call.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными счетов пользователя.
+        """
+        return await self.call(self.stub.GetAccounts, request)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.call(self.stub.OpenDepositAccount, request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого сберегательного счета.
+        """
+        return await self.call(self.stub.OpenSavingsAccount, request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого дебетового счета.
+        """
+        return await self.call(self.stub.OpenDebitCardAccount, request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого кредитного счета.
+        """
+        return await self.call(self.stub.OpenCreditCardAccount, request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        request = GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
 def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра AccountsGatewayGRPCClient.
@@ -128,3 +220,25 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
     return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_accounts_gateway_async_grpc_client() -> AccountsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AccountsGatewayAsyncGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_accounts_gateway_locust_async_grpc_client(environment: Environment) -> AccountsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Вызовы проходят через LocustInterceptor и попадают в статистику Locust так же, как у синхронного клиента.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AccountsGatewayAsyncGRPCClient с интерцептором сбора метрик.
+    """
+    return AccountsGatewayAsyncGRPCClient(channel=build_gateway_locust_grpc_client(environment))
@@ -1,7 +1,7 @@
 from grpc import Channel
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -80,6 +80,69 @@ class CardsGatewayGRPCClient(GRPCClient):
         return self.issue_physical_card_api(request)
 
 
+class CardsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService.
+    Повторяет высокоуровневые методы CardsGatewayGRPCClient, вызовы выполняются через AsyncGRPCClient.call.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с данными для виртуальной карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return await self.call(self.stub.IssueVirtualCard, request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с данными для физической карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return await self.call(self.stub.IssuePhysicalCard, request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Создание новой виртуальной карты.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с информацией о созданной карте.
+        """
+        request = IssueVirtualCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Создание новой физической карты.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с информацией о созданной карте.
+        """
+        request = IssuePhysicalCardRequest(
+            user_id=user_id,
+            account_id=account_id
+        )
+        return await self.issue_physical_card_api(request)
+
+
 def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра CardsGatewayGRPCClient.
@@ -101,3 +164,25 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
     return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_cards_gateway_async_grpc_client() -> CardsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return CardsGatewayAsyncGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_cards_gateway_locust_async_grpc_client(environment: Environment) -> CardsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Вызовы проходят через LocustInterceptor и попадают в статистику Locust так же, как у синхронного клиента.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр CardsGatewayAsyncGRPCClient с интерцептором сбора метрик.
+    """
+    return CardsGatewayAsyncGRPCClient(channel=build_gateway_locust_grpc_client(environment))
@@ -23,7 +23,8 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
-    locust_interceptor = LocustInterceptor(environment=environment)
+    # Дедлайны, хеджирование и политика повторов берутся из настроек gRPC-клиента
+    locust_interceptor = LocustInterceptor(environment=environment, config=settings.gateway_grpc_client)
 
     # Создаём обычный канал
     channel = insecure_channel(settings.gateway_grpc_client.client_url)
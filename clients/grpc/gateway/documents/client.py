@@ -1,7 +1,7 @@
 from grpc import Channel
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client
@@ -60,6 +60,49 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         return self.get_contract_document_api(request)
 
 
+class DocumentsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с DocumentsGatewayService.
+    Повторяет высокоуровневые методы DocumentsGatewayGRPCClient, вызовы выполняются через AsyncGRPCClient.call.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к DocumentsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = DocumentsGatewayServiceStub(channel)
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа тарифа.
+        """
+        return await self.call(self.stub.GetTariffDocument, request)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа контракта.
+        """
+        return await self.call(self.stub.GetContractDocument, request)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
 def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра DocumentsGatewayGRPCClient.
@@ -80,3 +123,25 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
     return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_documents_gateway_async_grpc_client() -> DocumentsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра DocumentsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return DocumentsGatewayAsyncGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_documents_gateway_locust_async_grpc_client(environment: Environment) -> DocumentsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Вызовы проходят через LocustInterceptor и попадают в статистику Locust так же, как у синхронного клиента.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр DocumentsGatewayAsyncGRPCClient с интерцептором сбора метрик.
+    """
+    return DocumentsGatewayAsyncGRPCClient(channel=build_gateway_locust_grpc_client(environment))
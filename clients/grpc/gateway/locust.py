@@ -1,17 +1,37 @@
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения gRPC API клиентов
-from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
-from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
+from clients.grpc.gateway.accounts.client import (
+    AccountsGatewayGRPCClient,
+    AccountsGatewayAsyncGRPCClient,
+    build_accounts_gateway_locust_grpc_client,
+    build_accounts_gateway_locust_async_grpc_client
+)
+from clients.grpc.gateway.cards.client import (
+    CardsGatewayGRPCClient,
+    CardsGatewayAsyncGRPCClient,
+    build_cards_gateway_locust_grpc_client,
+    build_cards_gateway_locust_async_grpc_client
+)
 from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
-    build_documents_gateway_locust_grpc_client
+    DocumentsGatewayAsyncGRPCClient,
+    build_documents_gateway_locust_grpc_client,
+    build_documents_gateway_locust_async_grpc_client
 )
 from clients.grpc.gateway.operations.client import (
     OperationsGatewayGRPCClient,
-    build_operations_gateway_locust_grpc_client
+    OperationsGatewayAsyncGRPCClient,
+    build_operations_gateway_locust_grpc_client,
+    build_operations_gateway_locust_async_grpc_client
+)
+from clients.grpc.gateway.users.client import (
+    UsersGatewayGRPCClient,
+    UsersGatewayAsyncGRPCClient,
+    build_users_gateway_locust_grpc_client,
+    build_users_gateway_locust_async_grpc_client
 )
-from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from tools.user.async_user import AsyncSession, AsyncSequentialSession
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -63,3 +83,51 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+
+
+class GatewayGRPCAsyncSession(AsyncSession):
+    """
+    Базовая асинхронная сессия для GRPC-сценариев, работающих с grpc-gateway.
+
+    Аналог GatewayGRPCTaskSet для LocustAsyncBaseUser: у каждой сессии свои асинхронные API клиенты.
+    Используется, если порядок выполнения задач внутри сессии не имеет значения.
+    """
+
+    users_gateway_client: UsersGatewayAsyncGRPCClient
+    cards_gateway_client: CardsGatewayAsyncGRPCClient
+    accounts_gateway_client: AccountsGatewayAsyncGRPCClient
+    documents_gateway_client: DocumentsGatewayAsyncGRPCClient
+    operations_gateway_client: OperationsGatewayAsyncGRPCClient
+
+    async def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов с использованием контекста окружения Locust.
+        """
+        self.users_gateway_client = build_users_gateway_locust_async_grpc_client(self.user.environment)
+        self.cards_gateway_client = build_cards_gateway_locust_async_grpc_client(self.user.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_async_grpc_client(self.user.environment)
+        self.documents_gateway_client = build_documents_gateway_locust_async_grpc_client(self.user.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_async_grpc_client(self.user.environment)
+
+
+class GatewayGRPCAsyncSequentialSession(AsyncSequentialSession):
+    """
+    Базовая асинхронная сессия для GRPC-сценариев, где важен порядок выполнения задач.
+    Аналог GatewayGRPCSequentialTaskSet для LocustAsyncBaseUser.
+    """
+
+    users_gateway_client: UsersGatewayAsyncGRPCClient
+    cards_gateway_client: CardsGatewayAsyncGRPCClient
+    accounts_gateway_client: AccountsGatewayAsyncGRPCClient
+    documents_gateway_client: DocumentsGatewayAsyncGRPCClient
+    operations_gateway_client: OperationsGatewayAsyncGRPCClient
+
+    async def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов для последовательного сценария.
+        """
+        self.users_gateway_client = build_users_gateway_locust_async_grpc_client(self.user.environment)
+        self.cards_gateway_client = build_cards_gateway_locust_async_grpc_client(self.user.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_async_grpc_client(self.user.environment)
+        self.documents_gateway_client = build_documents_gateway_locust_async_grpc_client(self.user.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_async_grpc_client(self.user.environment)
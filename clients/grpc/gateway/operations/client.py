@@ -1,7 +1,7 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client
@@ -188,6 +188,26 @@ class OperationsGatewayGRPCClient(GRPCClient):
         request = GetOperationsSummaryRequest(account_id=account_id)
         return self.get_operations_summary_api(request)
 
+    def get_operations_future(self, account_id: str) -> Future:
+        """
+        Неблокирующий вариант get_operations для параллельных вызовов (см. fan_out).
+
+        :param account_id: Идентификатор счета.
+        :return: gRPC future, результатом которого будет GetOperationsResponse.
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return self.stub.GetOperations.future(request)
+
+    def get_operations_summary_future(self, account_id: str) -> Future:
+        """
+        Неблокирующий вариант get_operations_summary для параллельных вызовов (см. fan_out).
+
+        :param account_id: Идентификатор счета.
+        :return: gRPC future, результатом которого будет GetOperationsSummaryResponse.
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return self.stub.GetOperationsSummary.future(request)
+
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
         """
         Создание операции комиссии.
@@ -302,6 +322,277 @@ class OperationsGatewayGRPCClient(GRPCClient):
         return self.make_cash_withdrawal_operation_api(request)
 
 
+class OperationsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Повторяет высокоуровневые методы OperationsGatewayGRPCClient, вызовы выполняются через AsyncGRPCClient.call.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.call(self.stub.GetOperation, request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными о чеке по операции.
+        """
+        return await self.call(self.stub.GetOperationReceipt, request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными об операциях по счету.
+        """
+        return await self.call(self.stub.GetOperations, request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными статистики операций по счету.
+        """
+        return await self.call(self.stub.GetOperationsSummary, request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции комиссии.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeFeeOperation, request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции пополнения.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeTopUpOperation, request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции кэшбэка.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeCashbackOperation, request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции перевода.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeTransferOperation, request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции покупки.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakePurchaseOperation, request)
+
+    async def make_bill_payment_operation_api(
+            self, request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции оплаты по счету.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeBillPaymentOperation, request)
+
+    async def make_cash_withdrawal_operation_api(
+            self, request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода  MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции снятия наличных.
+        :return: Ответ от сервиса с данными о созданной операции.
+        """
+        return await self.call(self.stub.MakeCashWithdrawalOperation, request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """
+        Получение данных об операции по ID.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с информацией об операции.
+        """
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """
+        Получение чека операции по ID.
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с информацией о чеке по операции.
+        """
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """
+        Получение информации об операциях по счету по ID счета.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ с информацией об операциях по счету.
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """
+        Получение статистики операций по по ID счета.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ со статистикой по операциям.
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        """
+        Создание операции комиссии.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeFeeOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        """
+        Создание операции пополнения.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeTopUpOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        """
+        Создание операции кэшбэка.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeCashbackOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        """
+        Создание операции перевода.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeTransferOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        """
+        Создание операции покупки.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakePurchaseOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus),
+            category=fake.category()
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        """
+        Создание операции оплаты по счету.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeBillPaymentOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        """
+        Создание операции снятия наличных.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: ответ с информацией об операции.
+        """
+        request = MakeCashWithdrawalOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
@@ -322,3 +613,25 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
     return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_operations_gateway_async_grpc_client() -> OperationsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return OperationsGatewayAsyncGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_operations_gateway_locust_async_grpc_client(environment: Environment) -> OperationsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Вызовы проходят через LocustInterceptor и попадают в статистику Locust так же, как у синхронного клиента.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр OperationsGatewayAsyncGRPCClient с интерцептором сбора метрик.
+    """
+    return OperationsGatewayAsyncGRPCClient(channel=build_gateway_locust_grpc_client(environment))
@@ -1,7 +1,7 @@
 from grpc import Channel
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import GRPCClient, AsyncGRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -72,6 +72,66 @@ class UsersGatewayGRPCClient(GRPCClient):
         return self.create_user_api(request)
 
 
+class UsersGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService.
+    Повторяет высокоуровневые методы UsersGatewayGRPCClient, вызовы выполняются через AsyncGRPCClient.call.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к UsersGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = UsersGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
+        """
+        Низкоуровневый вызов метода GetUser через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными пользователя.
+        """
+        return await self.call(self.stub.GetUser, request)
+
+    async def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+        """
+        Низкоуровневый вызов метода CreateUser через gRPC.
+
+        :param request: gRPC-запрос с данными нового пользователя.
+        :return: Ответ от сервиса с данными созданного пользователя.
+        """
+        return await self.call(self.stub.CreateUser, request)
+
+    async def get_user(self, user_id: str) -> GetUserResponse:
+        """
+        Получение данных пользователя по его ID.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ с информацией о пользователе.
+        """
+        request = GetUserRequest(id=user_id)
+        return await self.get_user_api(request)
+
+    async def create_user(self) -> CreateUserResponse:
+        """
+        Создание нового пользователя с фейковыми данными.
+
+        :return: Ответ с информацией о созданном пользователе.
+        """
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.create_user_api(request)
+
+
 def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     """
     Фабрика для создания экземпляра UsersGatewayGRPCClient.
@@ -92,3 +152,25 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
     return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_users_gateway_async_grpc_client() -> UsersGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра UsersGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return UsersGatewayAsyncGRPCClient(channel=build_gateway_grpc_client())
+
+
+def build_users_gateway_locust_async_grpc_client(environment: Environment) -> UsersGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Вызовы проходят через LocustInterceptor и попадают в статистику Locust так же, как у синхронного клиента.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр UsersGatewayAsyncGRPCClient с интерцептором сбора метрик.
+    """
+    return UsersGatewayAsyncGRPCClient(channel=build_gateway_locust_grpc_client(environment))
@@ -0,0 +1,154 @@
+import re
+
+from grpc import Call, RpcError, StatusCode
+from locust.env import Environment
+
+from tools.metrics.counters import get_counters
+from tools.metrics.traffic import record_traffic
+
+# Объём трафика по методам и распределение вызовов по gRPC-статусам
+calls_counters = get_counters("grpc_calls")
+status_codes_counters = get_counters("grpc_status_codes")
+
+# Ключ trailing metadata, в котором сервер передаёт время обработки (в формате HTTP Server-Timing):
+# "gateway;dur=12.5, accounts;dur=8.1"
+SERVER_TIMING_METADATA_KEY = "server-timing"
+
+# Типы записей статистики Locust для серверного времени и оставшейся части задержки (сеть, очереди).
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+SERVER_TIMING_TYPE = "gRPC server"
+NETWORK_TIMING_TYPE = "gRPC network"
+
+SERVER_TIMING_PATTERN = re.compile(r"^\s*([^;,\s]+)(?:;[^,]*?\bdur=([0-9.]+))?", re.IGNORECASE)
+
+
+class GRPCStatusError(Exception):
+    """
+    Ошибка gRPC-вызова в виде, удобном для статистики Locust: "<STATUS_CODE>: <details>".
+
+    Исходный RpcError содержит в repr время и отладочную строку, из-за чего каждая ошибка
+    попадает в таблицу Failures отдельной строкой. Эта ошибка группирует их по статусу.
+    """
+
+    def __init__(self, code: StatusCode, details: str | None):
+        super().__init__(f"{code.name}: {details or ''}".rstrip(": "))
+        self.code = code
+        self.details = details
+
+
+class GRPCTimeoutError(GRPCStatusError):
+    """
+    Вызов не уложился в дедлайн (DEADLINE_EXCEEDED).
+
+    Выделен в отдельный класс, чтобы таймауты в таблице Failures не смешивались с остальными ошибками:
+    под перегрузкой именно они показывают реальную долю неуспешных запросов.
+    """
+
+
+def parse_server_timing(value: str) -> dict[str, float]:
+    """
+    Разбирает значение в формате Server-Timing.
+
+    Например, "gateway;dur=12.5, accounts;dur=8.1" превращается в {"gateway": 12.5, "accounts": 8.1}.
+    Метрики без dur пропускаются.
+
+    :param value: Строка Server-Timing.
+    :return: Словарь {имя метрики: длительность в миллисекундах}.
+    """
+    timings: dict[str, float] = {}
+    for item in value.split(","):
+        match = SERVER_TIMING_PATTERN.match(item)
+        if match and match.group(2):
+            timings[match.group(1)] = float(match.group(2))
+
+    return timings
+
+
+def get_status_code(call: Call | None, exception: BaseException | None) -> StatusCode:
+    """
+    Определяет gRPC-статус завершённого вызова.
+
+    :param call: Завершённый вызов (future или поток ответов).
+    :param exception: Ошибка вызова, если была.
+    :return: Статус вызова (OK для успешных).
+    """
+    if exception is None:
+        return StatusCode.OK
+
+    for source in (exception, call):
+        if callable(getattr(source, "code", None)):
+            try:
+                return source.code()
+            except Exception:
+                continue
+
+    return StatusCode.UNKNOWN
+
+
+def get_trailing_metadata(call: Call | None, exception: BaseException | None) -> dict[str, str]:
+    for source in (call, exception):
+        if callable(getattr(source, "trailing_metadata", None)):
+            try:
+                return {key: value for key, value in (source.trailing_metadata() or ()) if isinstance(value, str)}
+            except Exception:
+                continue
+
+    return {}
+
+
+def record_call_metrics(
+        environment: Environment,
+        method: str,
+        call: Call | None,
+        exception: BaseException | None,
+        response_time: float,
+        request_bytes: int,
+        response_bytes: int
+) -> GRPCStatusError | None:
+    """
+    Записывает расширенные метрики завершённого gRPC-вызова.
+
+    - размер запроса и ответа — в счётчики grpc_calls и traffic;
+    - статус вызова — в счётчики grpc_status_codes;
+    - время из Server-Timing trailing metadata — в записи "gRPC server" (по каждой метрике),
+      а оставшаяся часть клиентской задержки — в запись "gRPC network".
+
+    :param environment: Окружение Locust.
+    :param method: Полное имя gRPC-метода.
+    :param call: Завершённый вызов.
+    :param exception: Ошибка вызова, если была.
+    :param response_time: Клиентская длительность вызова в миллисекундах.
+    :param request_bytes: Размер сериализованного запроса (или всех сообщений потока).
+    :param response_bytes: Размер сериализованного ответа (или всех сообщений потока).
+    :return: Ошибка для статистики Locust, сгруппированная по статусу, или None для успешного вызова.
+    """
+    code = get_status_code(call, exception)
+
+    calls_counters.inc(method, "calls")
+    calls_counters.inc(method, "timeouts", int(code == StatusCode.DEADLINE_EXCEEDED))
+    calls_counters.inc(method, "request_bytes", request_bytes)
+    calls_counters.inc(method, "response_bytes", response_bytes)
+    status_codes_counters.inc(method, code.name)
+    # Заголовки (metadata) gRPC сжимаются HPACK внутри grpcio и клиенту недоступны — учитываются только сообщения
+    record_traffic("gRPC", request_bytes, response_bytes)
+
+    server_timing = parse_server_timing(get_trailing_metadata(call, exception).get(SERVER_TIMING_METADATA_KEY, ""))
+    for name, duration in server_timing.items():
+        environment.stats.get(f"{method} [{name}]", SERVER_TIMING_TYPE).log(duration, 0)
+
+    if server_timing:
+        # Самая длинная метрика считается полным временем обработки на сервере
+        network_time = max(response_time - max(server_timing.values()), 0)
+        environment.stats.get(method, NETWORK_TIMING_TYPE).log(network_time, 0)
+
+    if exception is None:
+        return None
+
+    details = None
+    if isinstance(exception, RpcError) and callable(getattr(exception, "details", None)):
+        details = exception.details()
+
+    if code == StatusCode.DEADLINE_EXCEEDED:
+        return GRPCTimeoutError(code, details or str(exception))
+
+    return GRPCStatusError(code, details or str(exception))
@@ -0,0 +1,96 @@
+import math
+from collections import deque
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+
+logger = get_logger("GRPC_HEDGING")
+
+# Итоги хеджирования: логические вызовы, отправленные дубликаты (дополнительная нагрузка), победы дубликатов
+counters = get_counters("grpc_hedging")
+
+# Тип записи статистики Locust с задержкой исходной попытки — так выглядела бы задержка без хеджирования.
+# Запись ведётся напрямую в environment.stats и не попадает в Aggregated
+UNHEDGED_TYPE = "gRPC unhedged"
+
+
+class LatencyTracker:
+    """
+    Скользящее окно последних задержек по каждому методу.
+
+    Используется для выбора момента отправки дубликата: задержка исходной попытки
+    сравнивается с перцентилем её недавних значений. Статистика Locust для этого не подходит:
+    на воркерах она обнуляется после каждой отправки мастеру.
+    """
+
+    def __init__(self, window: int = 1000, refresh_every: int = 50):
+        """
+        :param window: Количество последних замеров, хранимых по каждому методу.
+        :param refresh_every: Через сколько новых замеров пересчитывать перцентиль.
+        """
+        self.window = window
+        self.refresh_every = refresh_every
+        self.samples: dict[str, deque[float]] = {}
+        self.pending: dict[str, int] = {}
+        self.percentiles: dict[tuple[str, float], float] = {}
+
+    def add(self, method: str, latency: float) -> None:
+        """
+        :param method: Полное имя метода.
+        :param latency: Задержка в секундах.
+        """
+        self.samples.setdefault(method, deque(maxlen=self.window)).append(latency)
+        self.pending[method] = self.pending.get(method, 0) + 1
+
+    def get_percentile(self, method: str, percentile: float, min_samples: int) -> float | None:
+        """
+        Возвращает перцентиль задержки метода (с кэшированием между пересчётами).
+
+        :param method: Полное имя метода.
+        :param percentile: Перцентиль в долях (0.95 — p95).
+        :param min_samples: Минимальное количество замеров, при котором значение считается надёжным.
+        :return: Значение в секундах или None, если замеров пока недостаточно.
+        """
+        samples = self.samples.get(method)
+        if not samples or len(samples) < min_samples:
+            return None
+
+        key = (method, percentile)
+        if key not in self.percentiles or self.pending[method] >= self.refresh_every:
+            ordered = sorted(samples)
+            self.percentiles[key] = ordered[min(len(ordered) - 1, math.ceil(percentile * len(ordered)) - 1)]
+            self.pending[method] = 0
+
+        return self.percentiles[key]
+
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    # Итог подводит мастер (или локальный процесс): сравниваем хвост задержки с хеджированием и без него
+    if isinstance(environment.runner, WorkerRunner) or not counters.counters:
+        return
+
+    lines = []
+    for method, values in sorted(counters.counters.items()):
+        hedged = environment.stats.entries.get((method, "gRPC"))
+        unhedged = environment.stats.entries.get((method, UNHEDGED_TYPE))
+        if not values["calls"] or hedged is None or unhedged is None:
+            continue
+
+        lines.append(
+            f"{method}: extra load {values['hedges_sent'] / values['calls']:.1%}, "
+            f"hedge wins {values['hedge_wins']:g}, "
+            + ", ".join(
+                f"p{percentile * 100:g} {unhedged.get_response_time_percentile(percentile):g} -> "
+                f"{hedged.get_response_time_percentile(percentile):g} ms"
+                for percentile in (0.95, 0.99, 0.999)
+            )
+        )
+
+    if lines:
+        logger.info("Hedging summary (unhedged -> hedged):\n" + "\n".join(lines))
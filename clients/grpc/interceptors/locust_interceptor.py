@@ -1,20 +1,103 @@
+import functools
 import time
+from collections import namedtuple
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+import gevent
+from grpc import (
+    ClientCallDetails,
+    Future,
+    FutureCancelledError,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+)
 from locust.env import Environment
 
+from clients.grpc.interceptors.call_metrics import get_status_code, record_call_metrics
+from clients.grpc.interceptors.hedging import LatencyTracker, UNHEDGED_TYPE, counters as hedging_counters
+from clients.grpc.interceptors.locust_stream import LocustStreamMetrics, LocustResponseStream
+from tools.config.grpc import GRPCClientConfig
+from tools.metrics.context import get_request_context
+from tools.replay.recorder import record_grpc_request
+from tools.retries import RetryPolicy
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+# Тип записи статистики Locust для отдельных попыток вызова при включённых повторах.
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+ATTEMPT_TYPE = "gRPC attempt"
+
+# Статусы, при которых по умолчанию выполняется повтор: сервер недоступен, перегружен или не уложился в дедлайн
+DEFAULT_RETRYABLE = {"UNAVAILABLE", "RESOURCE_EXHAUSTED", "DEADLINE_EXCEEDED"}
+
+
+class LocustClientCallDetails(
+    namedtuple(
+        "LocustClientCallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+    ),
+    ClientCallDetails
+):
+    """
+    Детали вызова с изменённым дедлайном (grpc.ClientCallDetails нельзя изменить на месте).
+    """
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+    Поддерживает все четыре типа вызовов: для потоковых дополнительно собираются
+    TTFM, интервалы между сообщениями, количество и объём сообщений (см. LocustStreamMetrics).
+
+    Интерцептор не ждёт ответа сам: метрики регистрируются в done-callback,
+    поэтому вызовы через stub.Method.future(...) остаются неблокирующими,
+    и одна задача может выполнять несколько RPC параллельно.
+
+    Если передана конфигурация клиента, интерцептор также:
+    - проставляет дедлайн вызовам без явного timeout (общий или персональный для метода);
+    - хеджирует блокирующие unary-вызовы: если ответа нет дольше перцентиля задержки метода,
+      отправляет дубликат и возвращает первый успешный ответ;
+    - повторяет неуспешные блокирующие unary-вызовы по политике повторов (см. call_with_retries).
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: Environment, config: GRPCClientConfig | None = None):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param config: Настройки gRPC-клиента (дедлайны, хеджирование, повторы). Без них вызовы не изменяются.
         """
         self.environment = environment
+        self.config = config
+        self.latency_tracker = LatencyTracker()
+        # Политика создаётся на каждый канал: у каждого пользователя свой бюджет повторов
+        self.retry_policy = RetryPolicy(config.retry, DEFAULT_RETRYABLE) if config is not None else None
+
+    def apply_deadline(self, client_call_details: ClientCallDetails) -> ClientCallDetails:
+        """
+        Проставляет дедлайн из настроек, если вызывающий код не указал timeout сам.
+
+        :param client_call_details: Исходные детали вызова.
+        :return: Детали вызова с дедлайном.
+        """
+        if self.config is None or client_call_details.timeout is not None:
+            return client_call_details
+
+        deadline = self.config.get_deadline(client_call_details.method)
+        if deadline is None:
+            return client_call_details
+
+        return LocustClientCallDetails(
+            method=client_call_details.method,
+            timeout=deadline,
+            metadata=client_call_details.metadata,
+            credentials=client_call_details.credentials,
+            wait_for_ready=getattr(client_call_details, "wait_for_ready", None),
+            compression=getattr(client_call_details, "compression", None),
+        )
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,31 +108,233 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
+        client_call_details = self.apply_deadline(client_call_details)
+        method = client_call_details.method
+
         start_time = time.perf_counter()  # Засекаем время начала запроса
+        # Контекст захватываем сейчас: done-callback может выполниться в другом гринлете
+        context = get_request_context()
+        # Размер запроса считаем до отправки, пока объект запроса гарантированно не изменён
+        request_length = request.ByteSize()
+        # Запись запроса в журнал для воспроизведения (только при запуске с --record-requests)
+        record_grpc_request(method, request)
+
+        call = continuation
+        if self.config is not None and self.config.hedging.enabled and self.config.hedging.is_hedged(method):
+            call = functools.partial(self.call_hedged, continuation)
+
+        # Выполняем gRPC вызов и получаем response future.
+        # Для обычного вызова future уже завершён, для stub.Method.future(...) — ещё выполняется
+        if self.retry_policy is not None and self.retry_policy.enabled:
+            response = self.call_with_retries(call, client_call_details, request)
+        else:
+            response = call(client_call_details, request)
+
+        # Логический вызов регистрируется один раз: время включает все попытки и паузы между ними.
+        # Для завершённого future callback вызывается сразу
+        response.add_done_callback(
+            lambda future: self.fire_request_event(method, future, start_time, context, request_length)
+        )
+
+        # Возвращаем результат вызова (future-объект)
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Поток ответов с учётом метрик.
+        """
+        client_call_details = self.apply_deadline(client_call_details)
+        metrics = LocustStreamMetrics(self.environment, client_call_details.method, get_request_context())
+        metrics.on_request(request)
+        record_grpc_request(client_call_details.method, request)
+
+        return LocustResponseStream(continuation(client_call_details, request), metrics)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Поток сообщений, отправляемых на сервер.
+        :return: gRPC response (future объект).
+        """
+        client_call_details = self.apply_deadline(client_call_details)
+        metrics = LocustStreamMetrics(self.environment, client_call_details.method, get_request_context())
+        response = continuation(client_call_details, metrics.wrap_requests(request_iterator))
+
+        def on_done(future: Future) -> None:
+            try:
+                exception = future.exception()
+            except FutureCancelledError as error:
+                exception = error
+
+            if exception is None:
+                metrics.on_response(future.result())
+            metrics.finish(future, exception)
+
+        response.add_done_callback(on_done)
+        return response
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Поток сообщений, отправляемых на сервер.
+        :return: Поток ответов с учётом метрик.
+        """
+        client_call_details = self.apply_deadline(client_call_details)
+        metrics = LocustStreamMetrics(self.environment, client_call_details.method, get_request_context())
+        call = continuation(client_call_details, metrics.wrap_requests(request_iterator))
+
+        return LocustResponseStream(call, metrics)
+
+    def call_hedged(self, continuation, client_call_details, request):
+        """
+        Хеджированный unary-unary вызов.
+
+        Исходная попытка выполняется в отдельном гринлете. Если за p95 (по настройкам) задержки метода
+        ответа нет, отправляется дубликат, и вызывающий код получает первый успешный ответ.
+        Проигравшая попытка не отменяется и завершается в фоне: задержка исходной попытки
+        пишется в запись "gRPC unhedged" — так выглядел бы хвост задержки без хеджирования.
+
+        Вызовы через stub.Method.future(...) не блокируются в continuation, поэтому не хеджируются.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC response (future объект) выигравшей попытки.
+        """
+        method = client_call_details.method
+        hedging = self.config.hedging
+        start_time = time.perf_counter()
+
+        def on_primary_done(greenlet: gevent.Greenlet) -> None:
+            outcome = greenlet.value
+            # Незавершённый future — это вызов через .future(), его задержка здесь неизвестна
+            if outcome is None or not outcome.done():
+                return
+
+            latency = time.perf_counter() - start_time
+            if outcome.exception() is None:
+                self.latency_tracker.add(method, latency)
+            self.environment.stats.get(method, UNHEDGED_TYPE).log(latency * 1000, 0)
+
+        delay = self.latency_tracker.get_percentile(method, hedging.percentile, hedging.min_samples)
+        primary = gevent.spawn(continuation, client_call_details, request)
+        primary.rawlink(on_primary_done)
+        primary.join(timeout=delay)
+
+        attempts = [primary]
+        if not primary.ready():
+            attempts.append(gevent.spawn(continuation, client_call_details, request))
+            hedging_counters.inc(method, "hedges_sent")
+
+        # Ждём первую успешную попытку; если все завершились ошибкой — берём последнюю
+        winner = None
+        pending = list(attempts)
+        while pending:
+            done = gevent.wait(pending, count=1)[0]
+            pending.remove(done)
+            winner = done
+            if not done.successful() or not done.value.done() or done.value.exception() is None:
+                break
+
+        # Вызовы через .future() не хеджируются и в итоги хеджирования не попадают
+        if winner.successful() and winner.value.done():
+            hedging_counters.inc(method, "calls")
+        if winner is not primary:
+            hedging_counters.inc(method, "hedge_wins")
+
+        if not winner.successful():
+            raise winner.exception
+
+        return winner.value
+
+    def call_with_retries(self, call, client_call_details, request):
+        """
+        Unary-unary вызов с повторами по политике GRPCClientConfig.retry.
+
+        Каждая попытка получает полный дедлайн и пишется в запись "gRPC attempt",
+        основная запись "gRPC" учитывает логический вызов.
+        Вызовы через stub.Method.future(...) к моменту возврата ещё не завершены,
+        поэтому не повторяются (выполняется одна попытка).
+
+        :param call: Функция, выполняющая одну попытку (continuation или хеджированный вызов).
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC response (future объект) последней попытки.
+        """
+        method = client_call_details.method
+        self.retry_policy.start(method)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            start_time = time.perf_counter()
+            response = call(client_call_details, request)
+            if not response.done():
+                return response
+
+            exception = response.exception()
+            status = None if exception is None else get_status_code(response, exception).name
+            delay = self.retry_policy.finish_attempt(
+                self.environment, ATTEMPT_TYPE, method, attempt, status, (time.perf_counter() - start_time) * 1000
+            )
+            if delay is None:
+                return response
+
+            gevent.sleep(delay)
+
+    def fire_request_event(
+            self,
+            method: str,
+            future: Future,
+            start_time: float,
+            context: dict,
+            request_length: int
+    ) -> None:
+        """
+        Регистрирует завершённый вызов в системе метрик Locust.
+
+        :param method: Полное имя метода (например, "/users.UsersService/CreateUser").
+        :param future: Завершённый gRPC future.
+        :param start_time: Момент начала вызова (time.perf_counter()).
+        :param context: Контекст запросов, захваченный в момент вызова.
+        :param request_length: Размер сериализованного запроса в байтах.
+        """
+        response_time = (time.perf_counter() - start_time) * 1000  # Время выполнения в миллисекундах
         response_length = 0
 
         try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
-
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
+            exception = future.exception()
+        except FutureCancelledError as error:
+            # Отменённый вызов считаем ошибкой, иначе он пропал бы из статистики
             exception = error
 
+        if exception is None:
+            # Получаем размер ответа (для метрик)
+            response_length = future.result().ByteSize()
+
+        # Размер запроса, статус и server-timing; ошибка для Locust группируется по gRPC-статусу
+        exception = record_call_metrics(
+            self.environment, method, future, exception, response_time, request_length, response_length
+        )
+
         # Регистрируем вызов в системе метрик Locust
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
+            name=method,  # Имя метода (например, "/users.UsersService/CreateUser")
+            context=context,  # Контекст запросов (транзакции и т.д.)
+            response=future,  # Объект ответа (если нужен для контекста)
             exception=exception,  # Если произошла ошибка — передаём её сюда
             request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
+            response_time=response_time,
             response_length=response_length,  # Размер ответа в байтах
         )
-
-        # Возвращаем результат вызова (future-объект)
-        return response
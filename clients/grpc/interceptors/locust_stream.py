@@ -0,0 +1,153 @@
+import time
+from typing import Iterator
+
+from google.protobuf.message import Message
+from grpc import RpcError
+from locust.env import Environment
+
+from clients.grpc.interceptors.call_metrics import record_call_metrics
+from tools.metrics.counters import get_counters
+
+# Итоги по потоковым вызовам: количество сообщений в обе стороны (объём — в счётчиках grpc_calls)
+counters = get_counters("grpc_streams")
+
+# Типы записей статистики Locust для метрик потока.
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated, чтобы не искажать RPS
+TIME_TO_FIRST_MESSAGE_TYPE = "gRPC TTFM"
+INTER_ARRIVAL_TYPE = "gRPC inter-arrival"
+
+
+class LocustStreamMetrics:
+    """
+    Метрики одного потокового gRPC-вызова (unary-stream, stream-unary, stream-stream).
+
+    Собирает время до первого сообщения (TTFM), интервалы между сообщениями,
+    общую длительность потока, количество и размер сообщений в обе стороны.
+    Сам поток регистрируется в Locust одним запросом: время — длительность всего потока,
+    размер — суммарный объём полученных сообщений.
+    """
+
+    def __init__(self, environment: Environment, method: str, context: dict):
+        """
+        :param environment: Окружение Locust.
+        :param method: Полное имя gRPC-метода.
+        :param context: Контекст запросов, захваченный в момент вызова.
+        """
+        self.environment = environment
+        self.method = method
+        self.context = context
+        self.start_time = time.perf_counter()
+        self.last_message_time: float | None = None
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.messages_received = 0
+        self.bytes_received = 0
+        self.finished = False
+
+    def on_request(self, request: Message) -> None:
+        self.messages_sent += 1
+        self.bytes_sent += request.ByteSize()
+
+    def wrap_requests(self, request_iterator: Iterator[Message]) -> Iterator[Message]:
+        """
+        Оборачивает итератор исходящих сообщений, подсчитывая их количество и размер.
+
+        :param request_iterator: Исходящие сообщения клиента.
+        :return: Тот же поток сообщений.
+        """
+        for request in request_iterator:
+            self.on_request(request)
+            yield request
+
+    def on_response(self, response: Message) -> None:
+        """
+        Учитывает очередное входящее сообщение потока.
+
+        :param response: Полученное сообщение.
+        """
+        now = time.perf_counter()
+        if self.last_message_time is None:
+            self.environment.stats.get(self.method, TIME_TO_FIRST_MESSAGE_TYPE).log(
+                (now - self.start_time) * 1000, 0
+            )
+        else:
+            self.environment.stats.get(self.method, INTER_ARRIVAL_TYPE).log(
+                (now - self.last_message_time) * 1000, 0
+            )
+
+        self.last_message_time = now
+        self.messages_received += 1
+        self.bytes_received += response.ByteSize()
+
+    def finish(self, call, exception: BaseException | None) -> None:
+        """
+        Регистрирует завершённый поток в статистике Locust. Повторные вызовы игнорируются.
+
+        :param call: Завершённый вызов (для статуса и trailing metadata).
+        :param exception: Ошибка, которой завершился поток (если была).
+        """
+        if self.finished:
+            return
+        self.finished = True
+        response_time = (time.perf_counter() - self.start_time) * 1000  # Длительность всего потока
+
+        counters.inc(self.method, "streams")
+        counters.inc(self.method, "messages_sent", self.messages_sent)
+        counters.inc(self.method, "messages_received", self.messages_received)
+
+        exception = record_call_metrics(
+            self.environment, self.method, call, exception, response_time, self.bytes_sent, self.bytes_received
+        )
+
+        self.environment.events.request.fire(
+            name=self.method,
+            context=self.context,
+            response=None,
+            exception=exception,
+            request_type="gRPC",
+            response_time=response_time,
+            response_length=self.bytes_received,
+        )
+
+
+class LocustResponseStream:
+    """
+    Обёртка над потоком ответов gRPC (результат unary-stream и stream-stream вызовов).
+
+    Итерируется так же, как исходный объект вызова, и учитывает каждое сообщение в LocustStreamMetrics.
+    Остальные методы (cancel, code, trailing_metadata и т.д.) делегируются исходному вызову.
+    """
+
+    def __init__(self, call, metrics: LocustStreamMetrics):
+        """
+        :param call: Исходный объект потокового вызова (итератор ответов и grpc.Call).
+        :param metrics: Метрики этого вызова.
+        """
+        self.call = call
+        self.metrics = metrics
+
+    def __iter__(self) -> "LocustResponseStream":
+        return self
+
+    def __next__(self) -> Message:
+        try:
+            response = next(self.call)
+        except StopIteration:
+            self.metrics.finish(self.call, None)
+            raise
+        except RpcError as error:
+            self.metrics.finish(self.call, error)
+            raise
+
+        self.metrics.on_response(response)
+        return response
+
+    def cancel(self) -> bool:
+        # Отмена потока клиентом — штатное завершение чтения, а не ошибка сервера.
+        # Сначала отменяем вызов: trailing metadata незавершённого вызова ожидала бы его окончания
+        cancelled = self.call.cancel()
+        self.metrics.finish(self.call, None)
+        return cancelled
+
+    def __getattr__(self, name: str):
+        return getattr(self.call, name)
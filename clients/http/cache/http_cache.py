@@ -0,0 +1,162 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from httpx import Client, Request, Response, Headers, codes
+
+from tools.metrics.counters import get_counters
+
+# Общие счётчики кэша по маршрутам (попадания, ревалидации, промахи, сэкономленные байты)
+counters = get_counters("http_cache")
+
+
+def parse_cache_control(headers: Headers) -> dict[str, str | None]:
+    """
+    Разбирает заголовок Cache-Control в словарь директив.
+
+    Например, "max-age=60, no-cache" превращается в {"max-age": "60", "no-cache": None}.
+
+    :param headers: Заголовки ответа.
+    :return: Словарь директив в нижнем регистре.
+    """
+    directives: dict[str, str | None] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    return directives
+
+
+@dataclass
+class HTTPCacheEntry:
+    """
+    Запись кэша: сохранённый ответ, его валидаторы и момент, до которого он считается свежим.
+    """
+    response: Response
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class HTTPCache:
+    """
+    Клиентский HTTP-кэш для идемпотентных GET-запросов.
+
+    Повторяет поведение реального мобильного клиента:
+    - свежий ответ (в пределах Cache-Control: max-age) отдаётся из кэша без обращения к серверу;
+    - устаревший ответ с ETag/Last-Modified ревалидируется условным запросом
+      (If-None-Match/If-Modified-Since), и при 304 Not Modified используется сохранённое тело;
+    - ответы с Cache-Control: no-store и ответы без валидаторов и max-age не кэшируются.
+
+    Размер кэша ограничен, при переполнении вытесняются давно не использованные записи (LRU).
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        :param max_entries: Максимальное количество записей в кэше.
+        """
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, HTTPCacheEntry] = OrderedDict()
+
+    def build_entry(self, response: Response) -> HTTPCacheEntry | None:
+        """
+        Создаёт запись кэша по ответу сервера с учётом Cache-Control.
+
+        :param response: Ответ сервера со статусом 200.
+        :return: Запись кэша или None, если ответ кэшировать нельзя или бессмысленно.
+        """
+        directives = parse_cache_control(response.headers)
+        if "no-store" in directives:
+            return None
+
+        max_age = 0.0
+        if "max-age" in directives and "no-cache" not in directives:
+            try:
+                max_age = float(directives["max-age"] or 0)
+            except ValueError:
+                max_age = 0.0
+
+        entry = HTTPCacheEntry(
+            response=response,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            expires_at=time.monotonic() + max_age
+        )
+        # Без валидаторов и без времени жизни запись никогда не будет использована
+        if not entry.has_validators and max_age <= 0:
+            return None
+
+        return entry
+
+    def store(self, key: str, route: str, response: Response) -> None:
+        entry = self.build_entry(response)
+        if entry is None:
+            self.entries.pop(key, None)
+            return
+
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        counters.inc(route, "stored")
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            counters.inc(route, "evictions")
+
+    def send(self, client: Client, request: Request) -> Response:
+        """
+        Выполняет GET-запрос с учётом кэша.
+
+        :param client: httpx.Client, через который отправляется запрос (с его event hooks).
+        :param request: Подготовленный GET-запрос.
+        :return: Ответ сервера или сохранённый ранее ответ.
+        """
+        key = str(request.url)
+        route = f"{request.method} {request.extensions.get('route', request.url.path)}"
+
+        entry = self.entries.get(key)
+        if entry is not None and entry.is_fresh:
+            self.entries.move_to_end(key)
+            counters.inc(route, "hits")
+            counters.inc(route, "bytes_saved", len(entry.response.content))
+            return entry.response
+
+        if entry is not None:
+            # Добавляем валидаторы, чтобы сервер мог ответить 304 без тела
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = client.send(request)
+
+        if entry is not None and response.status_code == codes.NOT_MODIFIED:
+            # Сервер может прислать обновлённые Cache-Control/ETag вместе с 304
+            for header in ("cache-control", "etag", "last-modified"):
+                if header in response.headers:
+                    entry.response.headers[header] = response.headers[header]
+
+            refreshed = self.build_entry(entry.response)
+            if refreshed is None:
+                self.entries.pop(key, None)
+            else:
+                self.entries[key] = refreshed
+                self.entries.move_to_end(key)
+
+            counters.inc(route, "revalidated")
+            counters.inc(route, "bytes_saved", len(entry.response.content) - len(response.content))
+            return entry.response
+
+        counters.inc(route, "misses")
+        if response.status_code == codes.OK:
+            self.store(key, route, response)
+
+        return response
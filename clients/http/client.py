@@ -1,5 +1,7 @@
 from typing import Any, TypedDict
-from httpx import Client, Response, QueryParams, URL
+from httpx import Client, AsyncClient, Response, QueryParams, URL
+
+from clients.http.cache.http_cache import HTTPCache
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -11,10 +13,12 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param cache: клиентский HTTP-кэш для GET-запросов (если не задан, кэширование отключено)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, cache: HTTPCache | None = None) -> None:
         self.client = client
+        self.cache = cache
 
     def get(
             self,
@@ -30,7 +34,12 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url=url, params=params, extensions=extensions)  # Передаём extensions в httpx.Client
+        if self.cache is None:
+            return self.client.get(url=url, params=params, extensions=extensions)  # Передаём extensions в httpx.Client
+
+        # С кэшем запрос сначала собирается, чтобы по итоговому URL найти сохранённый ответ
+        request = self.client.build_request("GET", url=url, params=params, extensions=extensions)
+        return self.cache.send(self.client, request)
 
     def post(
             self,
@@ -47,3 +56,54 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но все методы являются корутинами.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    """
+
+    def __init__(self, client: AsyncClient) -> None:
+        self.client = client
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения httpx.AsyncClient. Вызывается при завершении асинхронной сессии.
+        """
+        await self.client.aclose()
@@ -1,17 +1,110 @@
 import time
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, HTTPError, TimeoutException, codes
 from locust.env import Environment
 
+from tools.metrics.context import get_request_context
+from tools.metrics.traffic import record_http_traffic
+from tools.replay.recorder import record_http_request
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
     Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    чтобы потом использовать его для расчёта времени ответа,
+    а контекст запросов (транзакции и т.д.) — в `request.extensions["context"]`.
+    При запуске с --record-requests записывает запрос в журнал для tools.replay.
     """
     request.extensions["start_time"] = time.time()
+    request.extensions["context"] = get_request_context()
+    # Запись запроса в журнал для воспроизведения (только при запуске с --record-requests)
+    record_http_request(request)
+
+
+def fire_locust_response_event(environment: Environment, response: Response) -> None:
+    """
+    Вычисляет метрики по полученному ответу и отправляет их в Locust.
+
+    Общая логика для синхронного и асинхронного response event hook.
+    Тело ответа к моменту вызова уже должно быть прочитано.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response: Ответ сервера.
+    """
+    exception: HTTPError | HTTPStatusError | None = None
+
+    try:
+        # Проверка на статус ошибки (например, 500, 404 и т.д.).
+        # 304 Not Modified — штатный ответ на условный запрос клиентского кэша, а не ошибка
+        if response.status_code != codes.NOT_MODIFIED:
+            response = response.raise_for_status()
+    except (HTTPError, HTTPStatusError) as error:
+        exception = error
+
+    request = response.request
+
+    # Получаем route, если он был передан через extensions, иначе используем raw path
+    route = request.extensions.get("route", request.url.path)
+    # Время начала запроса, установленное в request event hook
+    start_time = request.extensions.get("start_time", time.time())
+    # Вычисляем длительность запроса в миллисекундах
+    response_time = (time.time() - start_time) * 1000
+    # Определяем размер тела ответа (можно заменить на 0, если не нужно)
+    response_length = len(response.read())
+    # Объём трафика запроса (заголовки и тела) — для сравнения протоколов
+    record_http_traffic(request, response)
+
+    # Отправляем событие в Locust
+    environment.events.request.fire(
+        name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+        context=request.extensions.get("context", {}),  # Контекст запросов, захваченный при отправке
+        response=response,  # Объект ответа (опционально)
+        exception=exception,  # Исключение, если оно произошло
+        request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+        response_time=response_time,  # Время выполнения запроса в мс
+        response_length=response_length,  # Размер тела ответа
+    )
+
+
+class HTTPTimeoutError(Exception):
+    """
+    Запрос не уложился в таймаут маршрута.
+
+    Выделен в отдельный класс, чтобы таймауты в таблице Failures не смешивались с остальными ошибками.
+    """
+
+
+def fire_locust_error_event(environment: Environment, request: Request, error: HTTPError) -> None:
+    """
+    Отправляет в Locust запрос, завершившийся без ответа (таймаут, обрыв соединения и т.д.).
+
+    До response event hook такие запросы не доходят, поэтому без этого события
+    они пропадали бы из статистики и скрывали реальную долю ошибок.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param request: Отправленный запрос.
+    :param error: Ошибка транспорта httpx.
+    """
+    route = request.extensions.get("route", request.url.path)
+    start_time = request.extensions.get("start_time", time.time())
+
+    exception: Exception = error
+    if isinstance(error, TimeoutException):
+        exception = HTTPTimeoutError(f"{type(error).__name__}: {error}")
+
+    record_http_traffic(request, None)
+
+    environment.events.request.fire(
+        name=f"{request.method} {route}",
+        context=request.extensions.get("context", {}),
+        response=None,
+        exception=exception,
+        request_type="HTTP",
+        response_time=(time.time() - start_time) * 1000,
+        response_length=0,
+    )
 
 
 def locust_response_event_hook(environment: Environment):
@@ -27,34 +120,34 @@ def locust_response_event_hook(environment: Environment):
     """
 
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+        response.read()
+        fire_locust_response_event(environment, response)
 
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
-        request = response.request
-
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+    return inner
+
+
+async def locust_async_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант `locust_request_event_hook` для httpx.AsyncClient.
+    """
+    request.extensions["start_time"] = time.time()
+    request.extensions["context"] = get_request_context()
+    # Запись запроса в журнал для воспроизведения (только при запуске с --record-requests)
+    record_http_request(request)
+
+
+def locust_async_response_event_hook(environment: Environment):
+    """
+    Возвращает асинхронный HTTPX event hook для httpx.AsyncClient.
+
+    Перед расчётом метрик асинхронно дочитывает тело ответа, чтобы не блокировать event loop.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Корутина-хук для HTTPX response event hook.
+    """
+
+    async def inner(response: Response) -> None:
+        await response.aread()
+        fire_locust_response_event(environment, response)
 
     return inner
@@ -1,7 +1,7 @@
 from httpx import Response, QueryParams
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -15,7 +15,10 @@ from clients.http.gateway.accounts.schema import (
     OpenCreditCardAccountResponseSchema
 )
 from clients.http.gateway.client import (
+    build_gateway_http_cache,
     build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 from tools.routes import APIRoutes
@@ -113,6 +116,99 @@ class AccountsGatewayHTTPClient(HTTPClient):
         return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
 
 
+class AccountsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Повторяет высокоуровневые методы AccountsGatewayHTTPClient на базе httpx.AsyncClient.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema):
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            APIRoutes.ACCOUNTS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-deposit-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-savings-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return GetAccountsResponseSchema.model_validate_json(response.text)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+
+
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -132,4 +228,29 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     :param environment: объект окружения Locust.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        cache=build_gateway_http_cache()
+    )
+
+
+def build_accounts_gateway_async_http_client() -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :return: Готовый к использованию AccountsGatewayAsyncHTTPClient.
+    """
+    return AccountsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_locust_async_http_client(environment: Environment) -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AccountsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return AccountsGatewayAsyncHTTPClient(client=build_gateway_locust_async_http_client(environment))
@@ -1,7 +1,7 @@
 from httpx import Response
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, AsyncHTTPClient
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
@@ -9,7 +9,10 @@ from clients.http.gateway.cards.schema import (
     IssuePhysicalCardResponseSchema
 )
 from clients.http.gateway.client import (
+    build_gateway_http_cache,
     build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 from tools.routes import APIRoutes
@@ -55,6 +58,47 @@ class CardsGatewayHTTPClient(HTTPClient):
         return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
 
 
+class CardsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    Повторяет высокоуровневые методы CardsGatewayHTTPClient на базе httpx.AsyncClient.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-virtual-card",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-physical-card",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+
+
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -74,4 +118,29 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     :param environment: объект окружения Locust.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        cache=build_gateway_http_cache()
+    )
+
+
+def build_cards_gateway_async_http_client() -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :return: Готовый к использованию CardsGatewayAsyncHTTPClient.
+    """
+    return CardsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_locust_async_http_client(environment: Environment) -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр CardsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return CardsGatewayAsyncHTTPClient(client=build_gateway_locust_async_http_client(environment))
@@ -1,12 +1,16 @@
 import logging
 from config import settings
 
-from httpx import Client
+from httpx import Client, AsyncClient
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
+from clients.http.cache.http_cache import HTTPCache
+from clients.http.transports.locust_transport import LocustHTTPTransport, AsyncLocustHTTPTransport
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
-    locust_response_event_hook  # Хук для сбора метрик по завершении запроса
+    locust_response_event_hook,  # Хук для сбора метрик по завершении запроса
+    locust_async_request_event_hook,
+    locust_async_response_event_hook
 )
 
 
@@ -20,6 +24,20 @@ def build_gateway_http_client() -> Client:
                   base_url=settings.gateway_http_client.client_url)
 
 
+def build_gateway_http_cache() -> HTTPCache | None:
+    """
+    Функция создаёт клиентский HTTP-кэш для сервиса http-gateway, если он включён в настройках.
+
+    Кэш создаётся отдельно для каждого клиента, как у реального мобильного приложения.
+
+    :return: Экземпляр HTTPCache или None, если кэширование выключено.
+    """
+    if not settings.gateway_http_client.cache.enabled:
+        return None
+
+    return HTTPCache(max_entries=settings.gateway_http_client.cache.max_entries)
+
+
 def build_gateway_locust_http_client(environment: Environment) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
@@ -42,8 +60,43 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        # Таймауты маршрутов, повторы по политике и учёт запросов, оборвавшихся без ответа
+        transport=LocustHTTPTransport(environment, settings.gateway_http_client),
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
             "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
         }
     )
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(timeout=settings.gateway_http_client.timeout,
+                       base_url=settings.gateway_http_client.client_url)
+
+
+def build_gateway_locust_async_http_client(environment: Environment) -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент для нагрузочного тестирования с помощью Locust.
+
+    Аналог `build_gateway_locust_http_client`, но на базе httpx.AsyncClient
+    и с асинхронными хуками сбора метрик.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        transport=AsyncLocustHTTPTransport(environment, settings.gateway_http_client),
+        event_hooks={
+            "request": [locust_async_request_event_hook],
+            "response": [locust_async_response_event_hook(environment)]
+        }
+    )
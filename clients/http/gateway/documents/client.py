@@ -1,8 +1,11 @@
 from httpx import Response
 from locust.env import Environment
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
+    build_gateway_http_cache,
     build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
     build_gateway_locust_http_client
 )
 from clients.http.gateway.documents.schema import GetContractDocumentResponseSchema, GetTariffDocumentResponseSchema
@@ -55,6 +58,53 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         return GetContractDocumentResponseSchema.model_validate_json(response.text)
 
 
+class DocumentsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Повторяет высокоуровневые методы DocumentsGatewayHTTPClient на базе httpx.AsyncClient.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тариф по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}"))
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракт по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}"))
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        """
+        Получить тариф по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект GetTariffDocumentResponseSchema)
+        """
+        response = await self.get_tariff_document_api(account_id)
+        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        """
+        Получить контракт по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект GetContractDocumentResponseSchema)
+        """
+        response = await self.get_contract_document_api(account_id)
+        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+
+
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -74,4 +124,29 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     :param environment: объект окружения Locust.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        cache=build_gateway_http_cache()
+    )
+
+
+def build_documents_gateway_async_http_client() -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :return: Готовый к использованию DocumentsGatewayAsyncHTTPClient.
+    """
+    return DocumentsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_documents_gateway_locust_async_http_client(environment: Environment) -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр DocumentsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return DocumentsGatewayAsyncHTTPClient(client=build_gateway_locust_async_http_client(environment))
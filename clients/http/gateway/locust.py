@@ -1,17 +1,37 @@
 from locust import TaskSet, SequentialTaskSet
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
-from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.accounts.client import (
+    AccountsGatewayHTTPClient,
+    AccountsGatewayAsyncHTTPClient,
+    build_accounts_gateway_locust_http_client,
+    build_accounts_gateway_locust_async_http_client
+)
+from clients.http.gateway.cards.client import (
+    CardsGatewayHTTPClient,
+    CardsGatewayAsyncHTTPClient,
+    build_cards_gateway_locust_http_client,
+    build_cards_gateway_locust_async_http_client
+)
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
-    build_documents_gateway_locust_http_client
+    DocumentsGatewayAsyncHTTPClient,
+    build_documents_gateway_locust_http_client,
+    build_documents_gateway_locust_async_http_client
 )
 from clients.http.gateway.operations.client import (
     OperationsGatewayHTTPClient,
-    build_operations_gateway_locust_http_client
+    OperationsGatewayAsyncHTTPClient,
+    build_operations_gateway_locust_http_client,
+    build_operations_gateway_locust_async_http_client
 )
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.users.client import (
+    UsersGatewayHTTPClient,
+    UsersGatewayAsyncHTTPClient,
+    build_users_gateway_locust_http_client,
+    build_users_gateway_locust_async_http_client
+)
+from tools.user.async_user import AsyncSession, AsyncSequentialSession
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -64,3 +84,71 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+
+
+class GatewayHTTPAsyncSession(AsyncSession):
+    """
+    Базовая асинхронная сессия для HTTP-сценариев, работающих с http-gateway.
+
+    Аналог GatewayHTTPTaskSet для LocustAsyncBaseUser: у каждой сессии свои асинхронные API клиенты.
+    Используется, если порядок выполнения задач внутри сессии не имеет значения.
+    """
+
+    users_gateway_client: UsersGatewayAsyncHTTPClient
+    cards_gateway_client: CardsGatewayAsyncHTTPClient
+    accounts_gateway_client: AccountsGatewayAsyncHTTPClient
+    documents_gateway_client: DocumentsGatewayAsyncHTTPClient
+    operations_gateway_client: OperationsGatewayAsyncHTTPClient
+
+    async def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов с использованием контекста окружения Locust.
+        """
+        self.users_gateway_client = build_users_gateway_locust_async_http_client(self.user.environment)
+        self.cards_gateway_client = build_cards_gateway_locust_async_http_client(self.user.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_async_http_client(self.user.environment)
+        self.documents_gateway_client = build_documents_gateway_locust_async_http_client(self.user.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_async_http_client(self.user.environment)
+
+    async def on_stop(self) -> None:
+        """
+        Закрытие асинхронных HTTP-клиентов (пулов соединений) сессии.
+        """
+        await self.users_gateway_client.close()
+        await self.cards_gateway_client.close()
+        await self.accounts_gateway_client.close()
+        await self.documents_gateway_client.close()
+        await self.operations_gateway_client.close()
+
+
+class GatewayHTTPAsyncSequentialSession(AsyncSequentialSession):
+    """
+    Базовая асинхронная сессия для HTTP-сценариев, где важен порядок выполнения задач.
+    Аналог GatewayHTTPSequentialTaskSet для LocustAsyncBaseUser.
+    """
+
+    users_gateway_client: UsersGatewayAsyncHTTPClient
+    cards_gateway_client: CardsGatewayAsyncHTTPClient
+    accounts_gateway_client: AccountsGatewayAsyncHTTPClient
+    documents_gateway_client: DocumentsGatewayAsyncHTTPClient
+    operations_gateway_client: OperationsGatewayAsyncHTTPClient
+
+    async def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов для последовательного сценария.
+        """
+        self.users_gateway_client = build_users_gateway_locust_async_http_client(self.user.environment)
+        self.cards_gateway_client = build_cards_gateway_locust_async_http_client(self.user.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_async_http_client(self.user.environment)
+        self.documents_gateway_client = build_documents_gateway_locust_async_http_client(self.user.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_async_http_client(self.user.environment)
+
+    async def on_stop(self) -> None:
+        """
+        Закрытие асинхронных HTTP-клиентов (пулов соединений) сессии.
+        """
+        await self.users_gateway_client.close()
+        await self.cards_gateway_client.close()
+        await self.accounts_gateway_client.close()
+        await self.documents_gateway_client.close()
+        await self.operations_gateway_client.close()
@@ -1,8 +1,11 @@
 from httpx import Response
 from locust.env import Environment  # Импорт окружения Locust
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
+    build_gateway_http_cache,
     build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 from clients.http.gateway.users.schema import (
@@ -56,6 +59,46 @@ class UsersGatewayHTTPClient(HTTPClient):
         return CreateUserResponseSchema.model_validate_json(response.text)
 
 
+class UsersGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Повторяет высокоуровневые методы UsersGatewayHTTPClient на базе httpx.AsyncClient.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"{APIRoutes.USERS}/{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Pydantic-модель с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        # Сериализуем модель в словарь с использованием alias
+        return await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        # Инициализируем модель через валидацию JSON строки
+        return GetUserResponseSchema.model_validate_json(response.text)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        # Инициализируем модель через валидацию JSON строки
+        return CreateUserResponseSchema.model_validate_json(response.text)
+
+
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -75,4 +118,29 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     :param environment: объект окружения Locust.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        cache=build_gateway_http_cache()
+    )
+
+
+def build_users_gateway_async_http_client() -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :return: Готовый к использованию UsersGatewayAsyncHTTPClient.
+    """
+    return UsersGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_locust_async_http_client(environment: Environment) -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется в асинхронных сессиях LocustAsyncBaseUser.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр UsersGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return UsersGatewayAsyncHTTPClient(client=build_gateway_locust_async_http_client(environment))
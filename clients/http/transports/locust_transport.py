@@ -0,0 +1,189 @@
+import asyncio
+import time
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Request,
+    Response,
+    Timeout,
+    TimeoutException,
+    TransportError
+)
+from locust.env import Environment
+
+from clients.http.event_hooks.locust_event_hook import fire_locust_error_event
+from tools.config.http import HTTPClientConfig
+from tools.retries import RetryPolicy
+
+# Тип записи статистики Locust для отдельных попыток запроса при включённых повторах.
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+ATTEMPT_TYPE = "HTTP attempt"
+
+# Статусы, при которых по умолчанию выполняется повтор: ответы перегруженного шлюза,
+# таймауты и обрывы соединения
+DEFAULT_RETRYABLE = {"502", "503", "504", "timeout", "transport"}
+
+
+def apply_route_timeout(request: Request, config: HTTPClientConfig) -> None:
+    """
+    Проставляет запросу таймаут маршрута из настроек (ключ — "<METHOD> <route>").
+
+    :param request: Запрос перед отправкой.
+    :param config: Настройки HTTP-клиента.
+    """
+    route = f"{request.method} {request.extensions.get('route', request.url.path)}"
+    if route in config.timeouts:
+        request.extensions["timeout"] = Timeout(config.timeouts[route]).as_dict()
+
+
+def get_retry_status(response: Response | None, error: TransportError | None) -> str | None:
+    """
+    Определяет статус попытки для политики повторов.
+
+    :param response: Ответ сервера (если получен).
+    :param error: Ошибка транспорта (если ответа нет).
+    :return: Код ответа строкой, "timeout", "transport" или None для успешного ответа.
+    """
+    if error is not None:
+        return "timeout" if isinstance(error, TimeoutException) else "transport"
+
+    return str(response.status_code) if response.status_code >= 400 else None
+
+
+class LocustHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx для нагрузочного тестирования.
+
+    - применяет персональные таймауты маршрутов (HTTPClientConfig.timeouts);
+    - регистрирует в Locust запросы, завершившиеся ошибкой транспорта (таймаут, обрыв соединения):
+      response event hook для них не вызывается. Таймауты попадают в отдельный класс ошибок HTTPTimeoutError;
+    - повторяет неуспешные попытки по политике HTTPClientConfig.retry. Event hooks клиента
+      срабатывают один раз на логический запрос (время включает все попытки и паузы),
+      а каждая попытка дополнительно пишется в запись "HTTP attempt".
+    """
+
+    def __init__(self, environment: Environment, config: HTTPClientConfig, transport: BaseTransport | None = None):
+        """
+        :param environment: Объект окружения Locust.
+        :param config: Настройки HTTP-клиента.
+        :param transport: Транспорт, выполняющий запросы (по умолчанию httpx.HTTPTransport).
+        """
+        self.environment = environment
+        self.config = config
+        self.transport = transport or HTTPTransport()
+        # Политика создаётся на каждый клиент: у каждого пользователя свой бюджет повторов
+        self.retry_policy = RetryPolicy(config.retry, DEFAULT_RETRYABLE)
+
+    def handle_request(self, request: Request) -> Response:
+        apply_route_timeout(request, self.config)
+        if not self.retry_policy.enabled:
+            try:
+                return self.transport.handle_request(request)
+            except TransportError as error:
+                fire_locust_error_event(self.environment, request, error)
+                raise
+
+        key = f"{request.method} {request.extensions.get('route', request.url.path)}"
+        self.retry_policy.start(key)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            start_time = time.perf_counter()
+            response, error = None, None
+            try:
+                response = self.transport.handle_request(request)
+            except TransportError as transport_error:
+                error = transport_error
+
+            delay = self.retry_policy.finish_attempt(
+                self.environment,
+                ATTEMPT_TYPE,
+                key,
+                attempt,
+                get_retry_status(response, error),
+                (time.perf_counter() - start_time) * 1000
+            )
+            if delay is None:
+                if error is not None:
+                    fire_locust_error_event(self.environment, request, error)
+                    raise error
+                return response
+
+            if response is not None:
+                # Дочитываем ответ, чтобы соединение вернулось в пул
+                response.read()
+                response.close()
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncLocustHTTPTransport(AsyncBaseTransport):
+    """
+    Асинхронный вариант LocustHTTPTransport для httpx.AsyncClient.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            config: HTTPClientConfig,
+            transport: AsyncBaseTransport | None = None
+    ):
+        """
+        :param environment: Объект окружения Locust.
+        :param config: Настройки HTTP-клиента.
+        :param transport: Транспорт, выполняющий запросы (по умолчанию httpx.AsyncHTTPTransport).
+        """
+        self.environment = environment
+        self.config = config
+        self.transport = transport or AsyncHTTPTransport()
+        self.retry_policy = RetryPolicy(config.retry, DEFAULT_RETRYABLE)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        apply_route_timeout(request, self.config)
+        if not self.retry_policy.enabled:
+            try:
+                return await self.transport.handle_async_request(request)
+            except TransportError as error:
+                fire_locust_error_event(self.environment, request, error)
+                raise
+
+        key = f"{request.method} {request.extensions.get('route', request.url.path)}"
+        self.retry_policy.start(key)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            start_time = time.perf_counter()
+            response, error = None, None
+            try:
+                response = await self.transport.handle_async_request(request)
+            except TransportError as transport_error:
+                error = transport_error
+
+            delay = self.retry_policy.finish_attempt(
+                self.environment,
+                ATTEMPT_TYPE,
+                key,
+                attempt,
+                get_retry_status(response, error),
+                (time.perf_counter() - start_time) * 1000
+            )
+            if delay is None:
+                if error is not None:
+                    fire_locust_error_event(self.environment, request, error)
+                    raise error
+                return response
+
+            if response is not None:
+                await response.aread()
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -1,12 +1,17 @@
 import locust.stats  # Модуль Locust, отвечающий за сбор и хранение статистики
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.mock import MockGatewayConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.visibility import VisibilityProbeConfig
 
-# Настройка списка процентилей, которые будут попадать в отчёты Locust
-locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
+# Настройка списка процентилей, которые будут попадать в отчёты Locust.
+# Locust считает их по округлённым значениям; точные p99.9 и p99.99 — в {csv}_percentiles.csv (tools.metrics.histograms)
+locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 0.999, 0.9999, 1.0]
 
 # Интервал (в секундах) между записями агрегированной статистики в CSV
 locust.stats.CSV_STATS_INTERVAL_SEC = 5
@@ -34,6 +39,11 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга
+    # Настройки пробы видимости операций
+    visibility_probe: VisibilityProbeConfig = Field(default_factory=VisibilityProbeConfig)
+    # Настройки локального mock gateway (tools.mock)
+    mock_gateway: MockGatewayConfig = Field(default_factory=MockGatewayConfig)
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
@@ -2,8 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.access import SeedsAccess
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
-from seeds.schema.result import SeedUserResult
 from tools.user.user import LocustBaseUser
 
 
@@ -16,26 +16,28 @@ def init(environment: Environment, **kwargs):
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
-    seed_user: SeedUserResult
+    seeds_access: SeedsAccess
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
 
     @task(1)
     def get_accounts(self):
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
 
     @task(3)
     def get_operations(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=account.account_id
         )
 
     @task(2)
     def get_operations_summary(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=account.account_id
         )
 
 
@@ -2,8 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.access import SeedsAccess
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
-from seeds.schema.result import SeedUserResult
 from tools.user.user import LocustBaseUser
 
 
@@ -15,22 +15,24 @@ def init(environment: Environment, **kwargs):
 
 
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
-    seed_user: SeedUserResult
+    seeds_access: SeedsAccess
 
     def on_start(self) -> None:
         super().on_start()
 
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
 
     @task(4)
     def get_accounts(self):
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
 
     @task(1)
     def issue_virtual_card(self):
+        user = self.seeds_access.get_user()
+        account = self.seeds_access.get_account(user.debit_card_accounts)
         self.cards_gateway_client.issue_virtual_card(
-            user_id=self.seed_user.user_id,
-            account_id=self.seed_user.debit_card_accounts[0].account_id
+            user_id=user.user_id,
+            account_id=account.account_id
         )
 
 
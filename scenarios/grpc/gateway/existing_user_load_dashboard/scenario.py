@@ -0,0 +1,41 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.grpc.client import fan_out
+from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from tools.metrics.transactions import transaction
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class LoadDashboardTaskSet(GatewayGRPCTaskSet):
+    seeds_access: SeedsAccess
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
+
+    @task
+    @transaction("load dashboard")
+    def load_dashboard(self):
+        # Главный экран мобильного приложения запрашивает счета, операции и сводку одновременно
+        user = self.seeds_access.get_user()
+        account_id = self.seeds_access.get_account(user.credit_card_accounts).account_id
+        fan_out(
+            self.accounts_gateway_client.get_accounts_future(user_id=user.user_id),
+            self.operations_gateway_client.get_operations_future(account_id=account_id),
+            self.operations_gateway_client.get_operations_summary_future(account_id=account_id)
+        )
+
+
+class LoadDashboardScenarioUser(LocustBaseUser):
+    tasks = [LoadDashboardTaskSet]
@@ -0,0 +1,7 @@
+# TaskSet переиспользуется из сценария с закрытой моделью нагрузки
+from scenarios.grpc.gateway.new_user_issue_physical_card.scenario import IssuePhysicalCardSequentialTaskSet
+from tools.user.arrival_rate_user import LocustArrivalRateUser
+
+
+class IssuePhysicalCardArrivalRateScenarioUser(LocustArrivalRateUser):
+    tasks = [IssuePhysicalCardSequentialTaskSet]
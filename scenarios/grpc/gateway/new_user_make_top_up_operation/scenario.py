@@ -4,6 +4,7 @@ from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet
 from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
 from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.metrics.transactions import transaction
 from tools.user.user import LocustBaseUser
 
 
@@ -15,11 +16,18 @@ class MakeTopUpOperationSequentialTaskSet(GatewayGRPCSequentialTaskSet):
     open_open_debit_card_account_response: OpenDebitCardAccountResponse | None = None
 
     @task
+    @transaction("onboarding")
+    def onboarding(self):
+        # Онбординг — одно действие для пользователя: регистрация, открытие счёта и первое пополнение.
+        # Шаги выполняются подряд без пауз, поэтому сквозное время транзакции не включает wait_time
+        self.create_user()
+        self.open_debit_card_account()
+        self.make_top_up_operation()
+
     def create_user(self):
         # Первый шаг — создать нового пользователя
         self.create_user_response = self.users_gateway_client.create_user()
 
-    @task
     def open_debit_card_account(self):
         # Невозможно открыть счёт без созданного пользователя
         if not self.create_user_response:
@@ -30,7 +38,6 @@ class MakeTopUpOperationSequentialTaskSet(GatewayGRPCSequentialTaskSet):
             user_id=self.create_user_response.user.id
         )
 
-    @task
     def make_top_up_operation(self):
         # Проверяем, что счёт успешно открыт
         if not self.open_open_debit_card_account_response:
@@ -2,8 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.access import SeedsAccess
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
-from seeds.schema.result import SeedUserResult
 from tools.user.user import LocustBaseUser
 
 
@@ -23,33 +23,36 @@ def init(environment: Environment, **kwargs):
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
-    # Типизируем объект пользователя из сидинга
-    seed_user: SeedUserResult
+    # Доступ к данным из сидинга
+    seeds_access: SeedsAccess
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
 
         # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        seeds = self.user.environment.seeds
+        self.seeds_access = SeedsAccess(seeds, user=seeds.get_next_user())
 
     @task(1)
     def get_accounts(self):
         # Запрашиваем список счетов
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
 
     @task(2)
     def get_tariff_document(self):
         # Загружаем тарифный документ по сберегательному счёту
+        account = self.seeds_access.get_account(self.seeds_access.get_user().savings_accounts)
         self.documents_gateway_client.get_tariff_document(
-            account_id=self.seed_user.savings_accounts[0].account_id
+            account_id=account.account_id
         )
 
     @task(2)
     def get_contract_document(self):
         # Загружаем договор по дебетовой карте
+        account = self.seeds_access.get_account(self.seeds_access.get_user().debit_card_accounts)
         self.documents_gateway_client.get_contract_document(
-            account_id=self.seed_user.debit_card_accounts[0].account_id
+            account_id=account.account_id
         )
 
 
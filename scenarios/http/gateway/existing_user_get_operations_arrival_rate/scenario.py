@@ -0,0 +1,7 @@
+# TaskSet и подготовка сидов (events.init) переиспользуются из сценария с закрытой моделью нагрузки
+from scenarios.http.gateway.existing_user_get_operations.scenario import GetOperationsTaskSet
+from tools.user.arrival_rate_user import LocustArrivalRateUser
+
+
+class GetOperationsArrivalRateScenarioUser(LocustArrivalRateUser):
+    tasks = [GetOperationsTaskSet]
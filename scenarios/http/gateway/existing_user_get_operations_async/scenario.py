@@ -0,0 +1,45 @@
+from locust import events
+from locust.env import Environment
+
+from clients.http.gateway.locust import GatewayHTTPAsyncSession
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from tools.user.async_user import LocustAsyncBaseUser, async_task
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class GetOperationsAsyncSession(GatewayHTTPAsyncSession):
+    seeds_access: SeedsAccess
+
+    async def on_start(self) -> None:
+        await super().on_start()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
+
+    @async_task(1)
+    async def get_accounts(self):
+        await self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
+
+    @async_task(3)
+    async def get_operations(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        await self.operations_gateway_client.get_operations(
+            account_id=account.account_id
+        )
+
+    @async_task(2)
+    async def get_operations_summary(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        await self.operations_gateway_client.get_operations_summary(
+            account_id=account.account_id
+        )
+
+
+class GetOperationsAsyncScenarioUser(LocustAsyncBaseUser):
+    session_class = GetOperationsAsyncSession
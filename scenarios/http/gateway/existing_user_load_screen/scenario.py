@@ -0,0 +1,39 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from tools.metrics.transactions import transaction
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class LoadScreenTaskSet(GatewayHTTPTaskSet):
+    seeds_access: SeedsAccess
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
+
+    @task
+    @transaction("screen load")
+    def load_screen(self):
+        # Главный экран — одно действие пользователя: счета, операции и статистика по операциям
+        # запрашиваются подряд, а сквозное время попадает в статистику как транзакция
+        user = self.seeds_access.get_user()
+        account = self.seeds_access.get_account(user.credit_card_accounts)
+        self.accounts_gateway_client.get_accounts(user_id=user.user_id)
+        self.operations_gateway_client.get_operations(account_id=account.account_id)
+        self.operations_gateway_client.get_operations_summary(account_id=account.account_id)
+
+
+class LoadScreenScenarioUser(LocustBaseUser):
+    tasks = [LoadScreenTaskSet]
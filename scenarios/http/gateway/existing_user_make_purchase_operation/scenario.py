@@ -2,8 +2,8 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.access import SeedsAccess
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
-from seeds.schema.result import SeedUserResult
 from tools.user.user import LocustBaseUser
 
 
@@ -20,38 +20,41 @@ def init(environment: Environment, **kwargs):
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class MakePurchaseOperationTaskSet(GatewayHTTPTaskSet):
-    seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seeds_access: SeedsAccess  # Доступ к данным из сидинга
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Пользователь, счёт и карта выбираются по распределению обращений (settings.seeds.access)
+        self.seeds_access = SeedsAccess(self.user.environment.seeds)
 
     @task(1)
     def make_purchase_operation(self):
-        # Совершаем покупку по первой карте пользователя
+        # Совершаем покупку по карте пользователя
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
         self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            card_id=self.seeds_access.get_card(account.physical_cards).card_id,
+            account_id=account.account_id
         )
 
     @task(2)
     def get_accounts(self):
         # Получаем список счетов пользователя
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
 
     @task(2)
     def get_operations(self):
         # Получаем список операций по счёту
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=account.account_id
         )
 
     @task(2)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=account.account_id
         )
 
 
@@ -4,6 +4,7 @@ from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSch
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from clients.http.gateway.operations.schema import MakeTopUpOperationResponseSchema
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.metrics.transactions import transaction
 from tools.user.user import LocustBaseUser
 
 
@@ -15,11 +16,18 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     open_open_debit_card_account_response: OpenDebitCardAccountResponseSchema | None = None
 
     @task
+    @transaction("onboarding")
+    def onboarding(self):
+        # Онбординг — одно действие для пользователя: регистрация, открытие счёта и первое пополнение.
+        # Шаги выполняются подряд без пауз, поэтому сквозное время транзакции не включает wait_time
+        self.create_user()
+        self.open_debit_card_account()
+        self.make_top_up_operation()
+
     def create_user(self):
         # Первый шаг — создать нового пользователя
         self.create_user_response = self.users_gateway_client.create_user()
 
-    @task
     def open_debit_card_account(self):
         # Невозможно открыть счёт без созданного пользователя
         if not self.create_user_response:
@@ -30,7 +38,6 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             user_id=self.create_user_response.user.id
         )
 
-    @task
     def make_top_up_operation(self):
         # Проверяем, что счёт успешно открыт
         if not self.open_open_debit_card_account_response:
@@ -0,0 +1,17 @@
+# Модули сценариев импортируются целиком: классы пользователей, попавшие в пространство имён locustfile,
+# Locust запустил бы сами по себе, в обход смеси
+from scenarios.http.gateway.existing_user_get_documents import scenario as get_documents
+from scenarios.http.gateway.existing_user_get_operations import scenario as get_operations
+from scenarios.http.gateway.existing_user_make_purchase_operation import scenario as make_purchase_operation
+from scenarios.http.gateway.new_user_issue_physical_card import scenario as issue_physical_card
+from tools.user.mix_user import MixEntry, build_mix_users
+
+# Смесь production-трафика: чтение истории операций и документов преобладает, покупки и онбординг
+# (запись) идут параллельно с фиксированной интенсивностью независимо от скорости ответов.
+# Веса и интенсивность переопределяются параметрами mix-weights и mix-arrival-rates в v1.0.conf
+globals().update(build_mix_users([
+    MixEntry(user=get_operations.GetOperationsScenarioUser, weight=5),
+    MixEntry(user=get_documents.GetDocumentsScenarioUser, weight=3),
+    MixEntry(user=make_purchase_operation.MakePurchaseOperationScenarioUser, weight=1, arrival_rate=10),
+    MixEntry(user=issue_physical_card.IssuePhysicalCardScenarioUser, weight=1, arrival_rate=2),
+]))
@@ -0,0 +1,45 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.gateway.locust import GatewayTaskSet
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class GetOperationsTaskSet(GatewayTaskSet):
+    seeds_access: SeedsAccess
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds, self.random)
+
+    @task(1)
+    def get_accounts(self):
+        self.accounts_gateway_client.get_accounts(user_id=self.seeds_access.get_user().user_id)
+
+    @task(3)
+    def get_operations(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        self.operations_gateway_client.get_operations(
+            account_id=account.account_id
+        )
+
+    @task(2)
+    def get_operations_summary(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        self.operations_gateway_client.get_operations_summary(
+            account_id=account.account_id
+        )
+
+
+class GetOperationsScenarioUser(LocustBaseUser):
+    tasks = [GetOperationsTaskSet]
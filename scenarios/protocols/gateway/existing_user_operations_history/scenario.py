@@ -0,0 +1,70 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.gateway.locust import GatewayTaskSet
+from seeds.access import SeedsAccess
+from seeds.dumps import seeds_result_exists
+from seeds.scenarios.operations_history import OperationsHistorySeedsScenario
+from tools.history import parse_cohorts, record_parse_cost
+from tools.metrics.context import request_context
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Каждая когорта — отдельный дамп сидинга: длинные истории генерируются один раз и переиспользуются
+    # в следующих запусках. Пересоздать дампы можно флагом --history-reseed
+    environment.history_cohorts = {}
+    for operations in parse_cohorts(environment.parsed_options.history_cohorts):
+        seeds_scenario = OperationsHistorySeedsScenario(
+            operations=operations,
+            accounts=environment.parsed_options.history_accounts
+        )
+        if environment.parsed_options.history_reseed or not seeds_result_exists(seeds_scenario.scenario):
+            seeds_scenario.build()
+
+        environment.history_cohorts[operations] = seeds_scenario.load()
+
+
+class OperationsHistoryTaskSet(GatewayTaskSet):
+    """
+    Бенчмарк роста данных: get_operations возвращает всю историю счёта без пагинации, поэтому задержка
+    и размер ответа растут с длиной истории. Запросы равномерно распределяются по когортам счетов
+    с историей разной длины (--history-cohorts) и учитываются в записях "History size" по когортам;
+    время разбора ответа — в записях "History parse". Кривые от длины истории сохраняются
+    в {csv}_history.csv и {csv}_history.html (tools.history).
+    """
+
+    cohorts: dict[int, SeedsAccess]
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.cohorts = {
+            operations: SeedsAccess(seeds, self.random)
+            for operations, seeds in self.user.environment.history_cohorts.items()
+        }
+
+    def get_cohort(self) -> tuple[int, str]:
+        operations = self.random.choice(list(self.cohorts))
+        access = self.cohorts[operations]
+        return operations, access.get_account(access.get_user().credit_card_accounts).account_id
+
+    @task(3)
+    def get_operations(self):
+        operations, account_id = self.get_cohort()
+        with request_context(history_method="get_operations", history_size=operations):
+            response = self.operations_gateway_client.get_operations(account_id=account_id)
+
+        record_parse_cost(self.user.environment, "get_operations", operations, response)
+
+    @task(1)
+    def get_operations_summary(self):
+        operations, account_id = self.get_cohort()
+        with request_context(history_method="get_operations_summary", history_size=operations):
+            response = self.operations_gateway_client.get_operations_summary(account_id=account_id)
+
+        record_parse_cost(self.user.environment, "get_operations_summary", operations, response)
+
+
+class OperationsHistoryScenarioUser(LocustBaseUser):
+    tasks = [OperationsHistoryTaskSet]
@@ -0,0 +1,76 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.gateway.locust import SessionTaskSet
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class OperationsSessionTaskSet(SessionTaskSet):
+    seeds_access: SeedsAccess
+    seed_user: SeedUserResult
+    # Счёт и операция, которые пользователь смотрит в текущей сессии: чек запрашивается по той же операции,
+    # что и get_operation перед ним, — это и даёт локальность обращений в рамках сессии
+    account: SeedAccountResult | None = None
+    operation_id: str | None = None
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.seeds_access = SeedsAccess(self.user.environment.seeds, self.random)
+        self.on_session_start()
+
+    def on_session_start(self) -> None:
+        # Пользователь выбирается на всю сессию: при sticky-назначении каждая сессия — визит того же
+        # пользователя, при rotating — другого
+        self.seed_user = self.seeds_access.get_user()
+        self.account, self.operation_id = None, None
+
+    def get_account(self) -> SeedAccountResult:
+        # Счёт выбирается один раз за сессию, первым обращением к операциям
+        if self.account is None:
+            self.account = self.seeds_access.get_account(self.seed_user.credit_card_accounts)
+
+        return self.account
+
+    def choose_operation_id(self) -> str:
+        account = self.get_account()
+        operations = [*account.purchase_operations, *account.top_up_operations, *account.cash_withdrawal_operations]
+        self.operation_id = self.random.choice(operations).operation_id
+        return self.operation_id
+
+    @task(1)
+    def get_accounts(self):
+        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+
+    @task(3)
+    def get_operations(self):
+        self.operations_gateway_client.get_operations(account_id=self.get_account().account_id)
+
+    @task(2)
+    def get_operations_summary(self):
+        self.operations_gateway_client.get_operations_summary(account_id=self.get_account().account_id)
+
+    @task(2)
+    def get_operation(self):
+        # Пользователь открывает новую операцию из списка
+        self.operations_gateway_client.get_operation(operation_id=self.choose_operation_id())
+
+    @task(1)
+    def get_operation_receipt(self):
+        # Чек — по операции, открытой последней (если сессия началась с чека — по новой операции)
+        operation_id = self.operation_id or self.choose_operation_id()
+        self.operations_gateway_client.get_operation_receipt(operation_id=operation_id)
+
+
+class OperationsSessionScenarioUser(LocustBaseUser):
+    tasks = [OperationsSessionTaskSet]
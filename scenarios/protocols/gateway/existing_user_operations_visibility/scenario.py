@@ -0,0 +1,86 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.gateway.locust import GatewayTaskSet
+from clients.grpc.gateway.operations.client import (
+    OperationsGatewayGRPCClient,
+    build_operations_gateway_locust_grpc_client
+)
+from clients.http.gateway.operations.client import (
+    OperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client
+)
+from seeds.access import SeedsAccess
+from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
+from tools.user.user import LocustBaseUser
+from tools.visibility import VisibilityProbe
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class OperationsVisibilityTaskSet(GatewayTaskSet):
+    """
+    Проба видимости операций: операция создаётся через gateway, проходит через Kafka и только потом
+    появляется в списке операций счёта. Каждая задача делает операцию и опрашивает get_operations,
+    пока она не появится; задержка попадает в записи "Visibility lag" (tools.visibility).
+
+    Запись идёт по --protocol, чтение — по --read-protocol: так видно, сходятся ли пути записи и чтения
+    разных протоколов. Статистика по операциям (get_operations_summary) для пробы не подходит:
+    суммы меняются не у всех статусов операции, и видимость конкретной записи по ним не определить.
+    """
+
+    seeds_access: SeedsAccess
+    probe: VisibilityProbe
+    read_protocol: str
+    read_operations_gateway_client: OperationsGatewayHTTPClient | OperationsGatewayGRPCClient
+
+    def on_start(self) -> None:
+        super().on_start()
+        environment = self.user.environment
+        self.seeds_access = SeedsAccess(environment.seeds, self.random)
+        self.probe = VisibilityProbe(environment)
+
+        self.read_protocol = environment.parsed_options.read_protocol or self.protocol
+        if self.read_protocol == self.protocol:
+            self.read_operations_gateway_client = self.operations_gateway_client
+        elif self.read_protocol == "grpc":
+            self.read_operations_gateway_client = build_operations_gateway_locust_grpc_client(environment)
+        else:
+            self.read_operations_gateway_client = build_operations_gateway_locust_http_client(environment)
+
+    def wait_until_visible(self, operation: str, account_id: str, operation_id: str) -> None:
+        self.probe.wait(
+            name=f"{operation} ({self.protocol} → {self.read_protocol})",
+            check=lambda: any(
+                item.id == operation_id
+                for item in self.read_operations_gateway_client.get_operations(account_id=account_id).operations
+            )
+        )
+
+    @task(3)
+    def make_purchase_operation(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        response = self.operations_gateway_client.make_purchase_operation(
+            card_id=self.seeds_access.get_card(account.physical_cards).card_id,
+            account_id=account.account_id
+        )
+        self.wait_until_visible("make_purchase_operation", account.account_id, response.operation.id)
+
+    @task(1)
+    def make_top_up_operation(self):
+        account = self.seeds_access.get_account(self.seeds_access.get_user().credit_card_accounts)
+        response = self.operations_gateway_client.make_top_up_operation(
+            card_id=self.seeds_access.get_card(account.physical_cards).card_id,
+            account_id=account.account_id
+        )
+        self.wait_until_visible("make_top_up_operation", account.account_id, response.operation.id)
+
+
+class OperationsVisibilityScenarioUser(LocustBaseUser):
+    tasks = [OperationsVisibilityTaskSet]
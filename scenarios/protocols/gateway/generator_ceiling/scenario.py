@@ -0,0 +1,34 @@
+import uuid
+from typing import Callable
+
+from locust import task, constant
+
+from clients.gateway.locust import GatewayTaskSet
+from tools.generator_benchmark import get_action
+from tools.user.user import LocustBaseUser
+
+
+class GeneratorCeilingTaskSet(GatewayTaskSet):
+    """
+    Бенчмарк генератора нагрузки: один метод gateway (--ceiling-method) без пауз против mock gateway
+    с нулевой задержкой (tools.generator_benchmark). Сидинг не нужен: mock принимает любые идентификаторы,
+    поэтому они генерируются один раз на пользователя и не тратят процессорное время генератора в задаче.
+    """
+
+    call: Callable
+    ids: dict[str, str]
+
+    def on_start(self) -> None:
+        super().on_start()
+        action = get_action(self.user.environment.parsed_options.ceiling_method)
+        self.call = getattr(getattr(self, action.client), action.name)
+        self.ids = {name: str(uuid.UUID(int=self.random.getrandbits(128), version=4)) for name in action.args}
+
+    @task
+    def call_method(self):
+        self.call(**self.ids)
+
+
+class GeneratorCeilingScenarioUser(LocustBaseUser):
+    wait_time = constant(0)
+    tasks = [GeneratorCeilingTaskSet]
@@ -0,0 +1,47 @@
+from locust import task, events
+from locust.env import Environment
+from locust.exception import StopUser
+from locust.runners import WorkerRunner
+
+from clients.gateway.locust import GatewayTaskSet
+from seeds.scenarios.replay_recorded_traffic import ReplayRecordedTrafficSeedsScenario
+from tools.replay.engine import TrafficReplayer, SeedsMapper, read_records, parse_partition
+from tools.user.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    seeds_scenario = ReplayRecordedTrafficSeedsScenario()
+    seeds_scenario.build()
+
+    environment.seeds = seeds_scenario.load()
+
+
+class ReplayTaskSet(GatewayTaskSet):
+    """
+    Воспроизводит журнал --replay-log через клиенты протокола --protocol и завершает запуск.
+    """
+
+    @task
+    def replay(self):
+        environment = self.user.environment
+        options = environment.parsed_options
+        replayer = TrafficReplayer(
+            target=self,
+            environment=environment,
+            mapper=SeedsMapper(environment.seeds),
+            speedup=options.replay_speedup,
+            lookahead=options.replay_lookahead,
+            max_in_flight=options.replay_max_in_flight,
+        )
+        replayer.run(read_records(options.replay_log, parse_partition(options.replay_partition)))
+
+        if isinstance(environment.runner, WorkerRunner):
+            raise StopUser()
+        environment.runner.quit()
+
+
+class RecordedTrafficScenarioUser(LocustBaseUser):
+    # Журнал воспроизводит один пользователь: параллелизм задаёт сам журнал, а не --users
+    fixed_count = 1
+    tasks = [ReplayTaskSet]
@@ -0,0 +1,147 @@
+import bisect
+import functools
+import itertools
+import random
+from contextvars import Token
+from typing import Any, Sequence, TypeVar
+
+from config import settings
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult
+from tools.config.seeds import KeyAccessConfig, KeyDistributionConfig
+from tools.metrics.cohorts import get_cohort
+from tools.metrics.context import set_request_context, reset_request_context
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=256)
+def get_cumulative_weights(size: int, exponent: float) -> list[float]:
+    """
+    Возвращает накопленные веса распределения Zipf для size ключей (кэшируется по размеру списка).
+    """
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+
+
+def sample_index(size: int, config: KeyDistributionConfig, generator: random.Random) -> int:
+    """
+    Выбирает индекс ключа по распределению обращений.
+
+    :param size: Количество ключей.
+    :param config: Распределение (uniform, zipf или hot_set).
+    :param generator: Генератор случайных чисел.
+    :return: Индекс ключа в списке.
+    """
+    match config.distribution:
+        case "zipf":
+            weights = get_cumulative_weights(size, config.exponent)
+            return min(bisect.bisect_left(weights, generator.random() * weights[-1]), size - 1)
+        case "hot_set":
+            hot = min(max(round(size * config.hot_keys), 1), size)
+            if hot == size or generator.random() < config.hot_traffic:
+                return generator.randrange(hot)
+            return hot + generator.randrange(size - hot)
+
+    return generator.randrange(size)
+
+
+class SeedsAccess:
+    """
+    Доступ виртуального пользователя к сущностям сидинга с заданным распределением обращений.
+
+    Равномерный выбор не воспроизводит конкуренцию за «горячие» счета и эффективность кэшей:
+    здесь пользователь, счёт и карта выбираются по распределению своего уровня (Zipf, hot set и т.д.).
+    При sticky-назначении выбор на каждом уровне делается один раз и сохраняется на всё время жизни
+    виртуального пользователя; при rotating — каждый вызов выбирает заново. Поэтому задача берёт
+    сущности один раз в начале и дальше работает с локальными переменными:
+
+        user = self.seeds_access.get_user()
+        account = self.seeds_access.get_account(user.credit_card_accounts)
+
+    Выбор помечает последующие запросы виртуального пользователя когортой выбранного пользователя
+    или счёта (tools.metrics.cohorts): задержки собираются не только по маршрутам, но и по когортам.
+    Контекст живёт в гринлете виртуального пользователя; следующий выбор снимает предыдущую метку
+    и ставит свою, а метка, поставленная внутри транзакции или request_context, снимается вместе с ним.
+    """
+
+    def __init__(
+            self,
+            seeds: SeedsResult,
+            generator: random.Random | None = None,
+            user: SeedUserResult | None = None,
+            config: KeyAccessConfig | None = None
+    ):
+        """
+        :param seeds: Результат сидинга.
+        :param generator: Генератор случайных чисел пользователя (по умолчанию — модуль random).
+        :param user: Закреплённый за виртуальным пользователем тестовый пользователь (например, get_next_user);
+                     распределение тогда применяется только к счетам и картам.
+        :param config: Распределения обращений (по умолчанию — settings.seeds.access).
+        """
+        self.seeds = seeds
+        self.generator = generator or random.Random()
+        self.user = user
+        self.config = config or settings.seeds.access
+        # Выборы при sticky-назначении: {id списка: элемент}
+        self.sticky: dict[int, object] = {}
+        # Последний выбранный пользователь (владелец счетов в get_account) и когорты: {(id пользователя, id счёта): имя}
+        self.current_user: SeedUserResult | None = None
+        self.cohorts: dict[tuple[int, int], str] = {}
+        # Токен последней метки когорты и контекст, который она установила
+        self.token: Token | None = None
+        self.tagged: dict[str, Any] | None = None
+
+    def choose(self, items: Sequence[T], config: KeyDistributionConfig) -> T:
+        if self.config.assignment == "sticky" and id(items) in self.sticky:
+            return self.sticky[id(items)]
+
+        item = items[sample_index(len(items), config, self.generator)]
+        if self.config.assignment == "sticky":
+            self.sticky[id(items)] = item
+
+        return item
+
+    def tag(self, user: SeedUserResult, account: SeedAccountResult | None = None) -> None:
+        """
+        Помечает последующие запросы когортой пользователя (или его счёта), сняв предыдущую метку.
+
+        Предыдущая метка снимается, только если контекст с тех пор не менялся: если после неё открылась
+        и ещё не закрылась транзакция, сброс удалил бы транзакцию из контекста, а если контекст уже
+        восстановлен закрывшимся блоком, метки в нём нет.
+        """
+        key = (id(user), id(account))
+        if key not in self.cohorts:
+            self.cohorts[key] = get_cohort(user, account)
+
+        if self.token is not None and self.token.var.get() is self.tagged:
+            try:
+                reset_request_context(self.token)
+            except ValueError:
+                # Токен создан в контексте другой asyncio-задачи
+                pass
+
+        self.token = set_request_context(cohort=self.cohorts[key])
+        self.tagged = self.token.var.get()
+
+    def get_user(self) -> SeedUserResult:
+        user = self.user if self.user is not None else self.choose(self.seeds.users, self.config.users)
+        self.current_user = user
+        self.tag(user)
+        return user
+
+    def get_account(self, accounts: list[SeedAccountResult]) -> SeedAccountResult:
+        """
+        :param accounts: Счета одного типа выбранного пользователя (например, user.credit_card_accounts).
+        :return: Счёт.
+        """
+        account = self.choose(accounts, self.config.accounts)
+        if self.current_user is not None:
+            self.tag(self.current_user, account)
+
+        return account
+
+    def get_card(self, cards: list[SeedCardResult]) -> SeedCardResult:
+        """
+        :param cards: Карты одного типа выбранного счёта (например, account.physical_cards).
+        :return: Карта.
+        """
+        return self.choose(cards, self.config.cards)
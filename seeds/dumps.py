@@ -1,10 +1,22 @@
 import os
+
+from config import settings
 from seeds.schema.result import SeedsResult
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
 
+def get_dump_path(scenario: str) -> str:
+    """
+    Возвращает путь к дампу сидинга сценария: {SEEDS.DUMPS_DIR}/{scenario}_seeds.json.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к JSON-файлу.
+    """
+    return os.path.join(settings.seeds.dumps_dir, f"{scenario}_seeds.json")
+
+
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
     Сохраняет результат сидинга (SeedsResult) в JSON-файл.
@@ -13,14 +25,23 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
     """
-    # Убедимся, что папка dumps существует
-    if not os.path.exists("dumps"):
-        os.mkdir("dumps")
+    # Убедимся, что папка дампов существует
+    os.makedirs(settings.seeds.dumps_dir, exist_ok=True)
 
     # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    with open(f"./dumps/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
+    with open(get_dump_path(scenario), 'w+', encoding="utf-8") as file:
         file.write(result.model_dump_json())
-        logger.debug(f"Seeding result saved to file: ./dumps/{scenario}_seeds.json")
+        logger.debug(f"Seeding result saved to file: {get_dump_path(scenario)}")
+
+
+def seeds_result_exists(scenario: str) -> bool:
+    """
+    Проверяет, есть ли сохранённый результат сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: True, если файл дампа существует.
+    """
+    return os.path.exists(get_dump_path(scenario))
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
@@ -31,6 +52,6 @@ def load_seeds_result(scenario: str) -> SeedsResult:
     :return: Объект SeedsResult, восстановленный из файла.
     """
     # Открываем файл и валидируем его как объект SeedsResult
-    with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
-        logger.debug(f"Seeding result loaded from file: ./dumps/{scenario}_seeds.json")
+    with open(get_dump_path(scenario), 'r', encoding="utf-8") as file:
+        logger.debug(f"Seeding result loaded from file: {get_dump_path(scenario)}")
         return SeedsResult.model_validate_json(file.read())
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 
+from config import settings
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.dumps import save_seeds_result, load_seeds_result, seeds_result_exists
 from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
 from tools.logger import get_logger
@@ -60,6 +61,19 @@ class SeedsScenario(ABC):
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
         result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.partition_count > 1:
+            index, count = settings.seeds.partition_index, settings.seeds.partition_count
+            if len(result.users) < count:
+                # Пользователей меньше, чем частей: части без пользователей работают со всем списком
+                logger.warning(
+                    f"[{self.scenario}] {len(result.users)} seeded users for {count} partitions: "
+                    f"partitions {len(result.users)}..{count - 1} share all users. "
+                    f"Lower the worker count or seed more users."
+                )
+            if index < len(result.users):
+                # Процесс работает только со своей частью пользователей
+                result.users = result.users[index::count]
+                logger.info(f"[{self.scenario}] Using seeds partition {index}/{count}: {len(result.users)} users.")
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
@@ -67,7 +81,12 @@ class SeedsScenario(ABC):
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если включено переиспользование дампа (settings.seeds.reuse_dump) и дамп уже есть, генерация пропускается.
         """
+        if settings.seeds.reuse_dump and seeds_result_exists(self.scenario):
+            logger.info(f"[{self.scenario}] Reusing existing seeding result, generation skipped.")
+            return
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
@@ -0,0 +1,49 @@
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedCardsPlan, SeedAccountsPlan, SeedOperationsPlan
+
+
+class OperationsHistorySeedsScenario(SeedsScenario):
+    """
+    Сценарий сидинга когорты счетов с историей операций заданной длины.
+    Создаёт пользователей с кредитным счётом, картой и operations операциями покупки на счёте.
+    Когорты разной длины (10, 100, 1000, ...) и размера сохраняются в отдельные дампы.
+    """
+
+    def __init__(self, operations: int, accounts: int = 10):
+        """
+        :param operations: Количество операций на счёте (длина истории).
+        :param accounts: Количество счетов (пользователей) в когорте.
+        """
+        super().__init__()
+        self.operations = operations
+        self.accounts = accounts
+
+    @property
+    def plan(self) -> SeedsPlan:
+        """
+        План сидинга: accounts пользователей, каждому — кредитный счёт с картой и историей операций.
+        """
+        return SeedsPlan(
+            users=SeedUsersPlan(
+                count=self.accounts,  # Количество пользователей (по одному счёту на пользователя)
+                credit_card_accounts=SeedAccountsPlan(
+                    count=1,  # Количество счётов на пользователя
+                    physical_cards=SeedCardsPlan(count=1),  # Количество физических карт
+                    purchase_operations=SeedOperationsPlan(count=self.operations)  # Длина истории операций
+                )
+            ),
+        )
+
+    @property
+    def scenario(self) -> str:
+        """
+        Название сценария сидинга: у каждой длины истории и количества счетов свой дамп.
+        """
+        return f"operations_history_{self.operations}x{self.accounts}"
+
+
+if __name__ == '__main__':
+    # Если файл запускается напрямую, создаём когорты по умолчанию.
+    for count in (10, 100, 1000, 10000):
+        seeds_scenario = OperationsHistorySeedsScenario(operations=count)
+        seeds_scenario.build()  # Стартуем процесс сидинга
@@ -0,0 +1,42 @@
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedCardsPlan, SeedOperationsPlan
+
+
+class ReplayRecordedTrafficSeedsScenario(SeedsScenario):
+    """
+    Сценарий сидинга для воспроизведения журнала запросов.
+    Создаёт 300 пользователей с кредитным счётом, картами и операциями: на эти сущности
+    отображаются идентификаторы из журнала, поэтому они покрывают все воспроизводимые маршруты.
+    """
+
+    @property
+    def plan(self) -> SeedsPlan:
+        """
+        План сидинга: 300 пользователей, у каждого кредитный счёт с физической и виртуальной картой,
+        операциями покупки, пополнения и снятия наличных.
+        """
+        return SeedsPlan(
+            users=SeedUsersPlan(
+                count=300,
+                credit_card_accounts=SeedAccountsPlan(
+                    count=1,
+                    physical_cards=SeedCardsPlan(count=1),
+                    virtual_cards=SeedCardsPlan(count=1),
+                    purchase_operations=SeedOperationsPlan(count=3),
+                    top_up_operations=SeedOperationsPlan(count=1),
+                    cash_withdrawal_operations=SeedOperationsPlan(count=1),
+                )
+            ),
+        )
+
+    @property
+    def scenario(self) -> str:
+        """
+        Название сценария сидинга, которое будет использоваться для сохранения данных.
+        """
+        return "replay_recorded_traffic"
+
+
+if __name__ == '__main__':
+    seeds_scenario = ReplayRecordedTrafficSeedsScenario()
+    seeds_scenario.build()
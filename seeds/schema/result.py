@@ -85,13 +85,16 @@ class SeedsResult(BaseModel):
         """
         return self.users.pop(0)
 
-    def get_random_user(self) -> SeedUserResult:
+    def get_random_user(self, generator: random.Random | None = None) -> SeedUserResult:
         """
         Возвращает случайного пользователя из списка без удаления.
 
         Используется в ситуациях, когда порядок не имеет значения, и пользователь выбирается случайно.
 
+        Args:
+            generator: Генератор случайных чисел для воспроизводимого выбора (по умолчанию — модуль random).
+
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
+        return (generator or random).choice(self.users)
@@ -0,0 +1,306 @@
+import argparse
+import csv
+import html
+import math
+import os
+from dataclasses import dataclass
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.charts import ChartSeries, render_line_chart
+from tools.logger import get_logger
+
+logger = get_logger("CAPACITY")
+
+# Цвета графиков модели в отчёте
+MODEL_COLORS = {"usl": "#d62728", "amdahl": "#1f77b4"}
+
+
+@dataclass
+class ScalabilityModel:
+    """
+    Модель пропускной способности от конкурентности.
+
+    USL (Universal Scalability Law): X(N) = λN / (1 + σ(N - 1) + κN(N - 1)),
+    где λ — пропускная способность одного пользователя, σ — конкуренция (очереди, блокировки),
+    κ — когерентность (накладные расходы на согласование, из-за которых после пика throughput падает).
+    Закон Амдала — частный случай USL с κ = 0.
+    """
+    name: str
+    lambda_: float
+    sigma: float
+    kappa: float
+    r2: float
+
+    def get_throughput(self, concurrency: float) -> float:
+        return self.lambda_ * concurrency / (
+                1 + self.sigma * (concurrency - 1) + self.kappa * concurrency * (concurrency - 1)
+        )
+
+    @property
+    def peak_concurrency(self) -> float:
+        """
+        Конкурентность, при которой достигается максимум throughput (бесконечность для κ = 0).
+        """
+        if self.kappa <= 0:
+            return math.inf
+
+        return math.sqrt(max(1 - self.sigma, 0) / self.kappa)
+
+    @property
+    def peak_throughput(self) -> float:
+        """
+        Максимальная пропускная способность: в точке пика для USL, асимптота λ / σ для закона Амдала.
+        """
+        if self.kappa > 0:
+            return self.get_throughput(self.peak_concurrency)
+
+        return self.lambda_ / self.sigma if self.sigma > 0 else math.inf
+
+
+def solve_least_squares(rows: list[list[float]], values: list[float]) -> list[float] | None:
+    """
+    Решает линейную задачу наименьших квадратов через нормальные уравнения (метод Гаусса).
+
+    :param rows: Строки матрицы признаков.
+    :param values: Целевые значения.
+    :return: Коэффициенты или None, если система вырождена.
+    """
+    size = len(rows[0])
+    matrix = [
+        [sum(row[i] * row[j] for row in rows) for j in range(size)]
+        + [sum(row[i] * value for row, value in zip(rows, values))]
+        for i in range(size)
+    ]
+
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda index: abs(matrix[index][column]))
+        if abs(matrix[pivot][column]) < 1e-12:
+            return None
+
+        matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+        for index in range(size):
+            if index != column:
+                factor = matrix[index][column] / matrix[column][column]
+                matrix[index] = [a - factor * b for a, b in zip(matrix[index], matrix[column])]
+
+    return [matrix[index][size] / matrix[index][index] for index in range(size)]
+
+
+def fit_model(name: str, points: list[tuple[float, float]], with_kappa: bool) -> ScalabilityModel | None:
+    """
+    Подбирает коэффициенты модели по замерам.
+
+    Используется линеаризация N / X(N) = 1/λ + (σ/λ)(N - 1) + (κ/λ)N(N - 1).
+    Отрицательные коэффициенты физического смысла не имеют: такой коэффициент обнуляется
+    и модель подбирается заново без него.
+
+    :param name: Имя модели ("usl" или "amdahl").
+    :param points: Замеры (конкурентность, throughput).
+    :param with_kappa: Учитывать ли коэффициент когерентности (USL) или нет (Амдал).
+    :return: Модель или None, если замеров недостаточно.
+    """
+    points = [(concurrency, throughput) for concurrency, throughput in points if concurrency > 0 and throughput > 0]
+    features = [("sigma", lambda n: n - 1)] + ([("kappa", lambda n: n * (n - 1))] if with_kappa else [])
+
+    while True:
+        if len(points) < len(features) + 1:
+            return None
+
+        coefficients = solve_least_squares(
+            [[1.0] + [feature(n) for _, feature in features] for n, _ in points],
+            [n / x for n, x in points]
+        )
+        if coefficients is None or coefficients[0] <= 0:
+            return None
+
+        negative = [name for (name, _), value in zip(features, coefficients[1:]) if value < 0]
+        if not negative:
+            break
+        features = [feature for feature in features if feature[0] != negative[-1]]
+
+    lambda_ = 1 / coefficients[0]
+    values = {feature_name: value * lambda_ for (feature_name, _), value in zip(features, coefficients[1:])}
+    model = ScalabilityModel(
+        name=name, lambda_=lambda_, sigma=values.get("sigma", 0.0), kappa=values.get("kappa", 0.0), r2=0.0
+    )
+
+    mean = sum(x for _, x in points) / len(points)
+    total = sum((x - mean) ** 2 for _, x in points)
+    residual = sum((x - model.get_throughput(n)) ** 2 for n, x in points)
+    model.r2 = 1 - residual / total if total else 1.0
+    return model
+
+
+def fit_usl(points: list[tuple[float, float]]) -> ScalabilityModel | None:
+    return fit_model("usl", points, with_kappa=True)
+
+
+def fit_amdahl(points: list[tuple[float, float]]) -> ScalabilityModel | None:
+    return fit_model("amdahl", points, with_kappa=False)
+
+
+def get_plateaus(samples: list[tuple[float, float]], min_samples: int = 2) -> list[tuple[float, float]]:
+    """
+    Выделяет плато (участки с постоянным количеством пользователей) из истории статистики.
+
+    Первый замер каждого участка отбрасывается: он захватывает переходный процесс после разгона.
+
+    :param samples: Замеры (количество пользователей, RPS) в хронологическом порядке.
+    :param min_samples: Минимальное количество замеров плато после отбрасывания первого.
+    :return: Плато (конкурентность, средний RPS), отсортированные по конкурентности.
+    """
+    groups: list[tuple[float, list[float]]] = []
+    for users, rps in samples:
+        if groups and groups[-1][0] == users:
+            groups[-1][1].append(rps)
+        else:
+            groups.append((users, [rps]))
+
+    plateaus: dict[float, list[float]] = {}
+    for users, values in groups:
+        if users > 0 and len(values) - 1 >= min_samples:
+            plateaus.setdefault(users, []).extend(values[1:])
+
+    return sorted((users, sum(values) / len(values)) for users, values in plateaus.items())
+
+
+def render_chart(points: list[tuple[float, float]], models: list[ScalabilityModel]) -> str:
+    """
+    Рисует SVG-график: замеры и кривые моделей.
+
+    :param points: Замеры (конкурентность, throughput).
+    :param models: Подобранные модели.
+    :return: SVG-разметка.
+    """
+    max_n = max(n for n, _ in points)
+    peaks = [model.peak_concurrency for model in models if math.isfinite(model.peak_concurrency)]
+    max_x = max([max_n * 1.2] + [min(peak * 1.2, max_n * 3) for peak in peaks])
+    series = [
+        ChartSeries(
+            name=model.name.upper(),
+            points=[(max_x * step / 100, model.get_throughput(max_x * step / 100)) for step in range(1, 101)],
+            color=MODEL_COLORS[model.name],
+            markers=False
+        )
+        for model in models
+    ]
+    series.append(ChartSeries(name="Measured", points=points, color="#000", line=False))
+    return render_line_chart(series, x_label="Concurrency (users)", y_label="Throughput (RPS)")
+
+
+def render_report(title: str, points: list[tuple[float, float]], models: list[ScalabilityModel]) -> str:
+    """
+    Формирует HTML-отчёт с графиком и коэффициентами моделей.
+
+    :param title: Заголовок отчёта (обычно имя сценария).
+    :param points: Замеры (конкурентность, throughput).
+    :param models: Подобранные модели.
+    :return: HTML-страница.
+    """
+    rows = "\n".join(
+        f'<tr><td style="color:{MODEL_COLORS[model.name]}">{model.name.upper()}</td>'
+        f"<td>{model.lambda_:.3f}</td><td>{model.sigma:.5f}</td><td>{model.kappa:.6f}</td>"
+        f"<td>{model.peak_concurrency:.0f}</td><td>{model.peak_throughput:.1f}</td><td>{model.r2:.3f}</td></tr>"
+        for model in models
+    )
+    measured = "\n".join(f"<tr><td>{n:g}</td><td>{x:.1f}</td></tr>" for n, x in points)
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{html.escape(title)} — scalability</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 4px 12px; text-align: right; }}</style>
+</head>
+<body>
+<h2>{html.escape(title)}: throughput vs concurrency</h2>
+{render_chart(points, models)}
+<h3>Models</h3>
+<table>
+<tr><th>Model</th><th>λ (RPS per user)</th><th>σ (contention)</th><th>κ (coherency)</th>
+<th>Peak concurrency</th><th>Peak throughput</th><th>R²</th></tr>
+{rows}
+</table>
+<h3>Measured plateaus</h3>
+<table><tr><th>Users</th><th>RPS</th></tr>
+{measured}
+</table>
+</body>
+</html>
+"""
+
+
+def build_capacity_report(title: str, points: list[tuple[float, float]], output: str) -> list[ScalabilityModel]:
+    """
+    Подбирает модели USL и Амдала, пишет коэффициенты в лог и сохраняет HTML-отчёт.
+
+    :param title: Заголовок отчёта.
+    :param points: Плато (конкурентность, throughput).
+    :param output: Путь к HTML-файлу отчёта.
+    :return: Подобранные модели (пустой список, если замеров недостаточно).
+    """
+    models = [model for model in (fit_usl(points), fit_amdahl(points)) if model is not None]
+    if not models:
+        logger.info(f"Not enough plateaus to fit scalability models: {len(points)}")
+        return []
+
+    for model in models:
+        peak = (
+            f"peak {model.peak_throughput:.1f} RPS at {model.peak_concurrency:.0f} users"
+            if math.isfinite(model.peak_concurrency) else f"asymptote {model.peak_throughput:.1f} RPS"
+        )
+        logger.info(
+            f"{model.name.upper()}: λ={model.lambda_:.3f} σ={model.sigma:.5f} κ={model.kappa:.6f}, "
+            f"{peak} (R²={model.r2:.3f})"
+        )
+
+    with open(output, "w+", encoding="utf-8") as file:
+        file.write(render_report(title, points, models))
+    logger.info(f"Scalability report saved to file: {output}")
+
+    return models
+
+
+def read_stats_history(path: str) -> list[tuple[float, float]]:
+    """
+    Читает замеры (количество пользователей, RPS) строки Aggregated из `{csv}_stats_history.csv` Locust.
+
+    :param path: Путь к CSV-файлу.
+    :return: Замеры в хронологическом порядке.
+    """
+    with open(path, encoding="utf-8") as file:
+        return [
+            (float(row["User Count"]), float(row["Requests/s"]))
+            for row in csv.DictReader(file) if row["Name"] == "Aggregated"
+        ]
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    # Отчёт строится по истории статистики и кладётся рядом с HTML-отчётом Locust
+    html_file = getattr(environment.parsed_options, "html_file", None)
+    if isinstance(environment.runner, WorkerRunner) or not html_file or not environment.stats.history:
+        return
+
+    samples = [(entry["user_count"][1], entry["current_rps"][1]) for entry in environment.stats.history]
+    points = get_plateaus(samples)
+    if len(points) < 3:
+        return
+
+    base, _ = os.path.splitext(html_file)
+    build_capacity_report(os.path.basename(base), points, f"{base}_scalability.html")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="USL/Amdahl fitting from Locust stats history CSV")
+    parser.add_argument("history", help="Path to {csv}_stats_history.csv")
+    parser.add_argument("--output", help="HTML report path (default: next to the CSV)")
+    parser.add_argument("--min-samples", type=int, default=2, help="Minimum samples per plateau")
+    arguments = parser.parse_args()
+
+    base, _ = os.path.splitext(arguments.history)
+    build_capacity_report(
+        os.path.basename(base),
+        get_plateaus(read_stats_history(arguments.history), arguments.min_samples),
+        arguments.output or f"{base}_scalability.html"
+    )
@@ -0,0 +1,83 @@
+import html
+from dataclasses import dataclass
+
+# Палитра для серий без явно заданного цвета
+PALETTE = ("#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b", "#e377c2", "#17becf")
+
+
+@dataclass
+class ChartSeries:
+    """
+    Серия точек на графике: линия, маркеры или и то и другое.
+    """
+    name: str
+    points: list[tuple[float, float]]
+    color: str | None = None
+    line: bool = True
+    markers: bool = True
+
+
+def render_line_chart(
+        series: list[ChartSeries],
+        x_label: str,
+        y_label: str,
+        width: int = 720,
+        height: int = 400
+) -> str:
+    """
+    Рисует линейный график в виде SVG-разметки для встраивания в HTML-отчёты.
+
+    Графики строятся без сторонних библиотек: отчёты открываются в браузере как есть,
+    а в окружении генератора нагрузки не нужны matplotlib и его зависимости.
+
+    :param series: Серии точек (x, y).
+    :param x_label: Подпись оси X.
+    :param y_label: Подпись оси Y.
+    :return: SVG-разметка.
+    """
+    padding, legend_width = 50, 160
+    points = [point for item in series for point in item.points]
+    max_x = max([x for x, _ in points] + [1e-9])
+    max_y = max([y for _, y in points] + [1e-9]) * 1.1
+    plot_width = width - legend_width
+
+    def scale(x: float, y: float) -> tuple[float, float]:
+        return (
+            padding + x / max_x * (plot_width - 2 * padding),
+            height - padding - y / max_y * (height - 2 * padding),
+        )
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="sans-serif" '
+        f'font-size="11">',
+        f'<line x1="{padding}" y1="{height - padding}" x2="{plot_width - padding}" y2="{height - padding}" '
+        f'stroke="#333"/>',
+        f'<line x1="{padding}" y1="{padding}" x2="{padding}" y2="{height - padding}" stroke="#333"/>',
+        f'<text x="{plot_width / 2}" y="{height - 10}" text-anchor="middle">{html.escape(x_label)}</text>',
+        f'<text x="12" y="{height / 2}" transform="rotate(-90 12 {height / 2})" text-anchor="middle">'
+        f'{html.escape(y_label)}</text>',
+    ]
+    for tick in range(6):
+        x, y = scale(max_x * tick / 5, max_y * tick / 5)
+        parts.append(
+            f'<text x="{x:.1f}" y="{height - padding + 15}" text-anchor="middle">{max_x * tick / 5:.4g}</text>'
+        )
+        parts.append(f'<text x="{padding - 5}" y="{y + 4:.1f}" text-anchor="end">{max_y * tick / 5:.4g}</text>')
+
+    for index, item in enumerate(series):
+        color = item.color or PALETTE[index % len(PALETTE)]
+        scaled = [scale(x, y) for x, y in sorted(item.points)]
+        if item.line and len(scaled) > 1:
+            path = " ".join(f"{x:.1f},{y:.1f}" for x, y in scaled)
+            parts.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2"/>')
+        if item.markers:
+            parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3.5" fill="{color}"/>' for x, y in scaled)
+
+        legend_y = padding + index * 18
+        parts.append(
+            f'<rect x="{plot_width}" y="{legend_y - 9}" width="12" height="12" fill="{color}"/>'
+            f'<text x="{plot_width + 18}" y="{legend_y + 1}">{html.escape(item.name)}</text>'
+        )
+
+    parts.append("</svg>")
+    return "\n".join(parts)
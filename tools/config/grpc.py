@@ -1,4 +1,25 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from tools.config.retries import RetryPolicyConfig
+
+
+class GRPCHedgingConfig(BaseModel):
+    # Включает хеджирование: если ответа нет дольше перцентиля задержки метода, отправляется дубликат
+    enabled: bool = False
+
+    # Перцентиль задержки метода, после которого отправляется дубликат (0.95 — p95)
+    percentile: float = 0.95
+
+    # Минимальное количество замеров метода, после которого начинается хеджирование
+    min_samples: int = 100
+
+    # Методы, которые можно хеджировать (короткие имена, например GetAccounts).
+    # Если список пуст — хеджируются все Get*-методы: повторять можно только идемпотентные вызовы
+    methods: list[str] = Field(default_factory=list)
+
+    def is_hedged(self, method: str) -> bool:
+        name = method.rsplit("/", 1)[-1]
+        return name in self.methods if self.methods else name.startswith("Get")
 
 
 class GRPCClientConfig(BaseModel):
@@ -8,6 +29,19 @@ class GRPCClientConfig(BaseModel):
     # Хост (например, localhost или grpc-gateway.internal)
     host: str
 
+    # Дедлайн вызова по умолчанию в секундах (None — без дедлайна)
+    deadline: float | None = 30.0
+
+    # Дедлайны отдельных методов в секундах, например {"GetAccounts": 2.0}.
+    # Ключ — короткое имя метода или полное имя вида /package.Service/Method
+    deadlines: dict[str, float] = Field(default_factory=dict)
+
+    # Настройки хеджированных запросов
+    hedging: GRPCHedgingConfig = Field(default_factory=GRPCHedgingConfig)
+
+    # Политика повторов неуспешных вызовов (по умолчанию повторы выключены)
+    retry: RetryPolicyConfig = Field(default_factory=RetryPolicyConfig)
+
     @property
     def client_url(self) -> str:
         """
@@ -15,3 +49,12 @@ class GRPCClientConfig(BaseModel):
         который требуется для создания gRPC-канала через insecure_channel().
         """
         return f"{self.host}:{self.port}"
+
+    def get_deadline(self, method: str) -> float | None:
+        """
+        Возвращает дедлайн для метода с учётом персональных настроек.
+
+        :param method: Полное имя метода (например, "/package.Service/GetAccounts").
+        :return: Дедлайн в секундах или None.
+        """
+        return self.deadlines.get(method, self.deadlines.get(method.rsplit("/", 1)[-1], self.deadline))
@@ -1,4 +1,14 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, Field
+
+from tools.config.retries import RetryPolicyConfig
+
+
+class HTTPCacheConfig(BaseModel):
+    # Включает клиентский HTTP-кэш (ETag/If-None-Match, Cache-Control) для GET-запросов
+    enabled: bool = False
+
+    # Максимальное количество записей в кэше одного клиента (LRU-вытеснение)
+    max_entries: int = 1000
 
 
 class HTTPClientConfig(BaseModel):
@@ -8,6 +18,16 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Таймауты отдельных маршрутов в секундах, например {"GET /api/v1/accounts": 2.0}.
+    # Ключ — метод и логическое имя маршрута, как в статистике Locust
+    timeouts: dict[str, float] = Field(default_factory=dict)
+
+    # Настройки клиентского HTTP-кэша
+    cache: HTTPCacheConfig = Field(default_factory=HTTPCacheConfig)
+
+    # Политика повторов неуспешных запросов (по умолчанию повторы выключены)
+    retry: RetryPolicyConfig = Field(default_factory=RetryPolicyConfig)
+
     @property
     def client_url(self) -> str:
         """
@@ -20,4 +40,3 @@ class HTTPClientConfig(BaseModel):
         """
         return str(self.url)
 
-
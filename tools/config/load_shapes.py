@@ -0,0 +1,86 @@
+from pydantic import BaseModel
+
+
+class StepLoadShapeConfig(BaseModel):
+    # Количество ступеней: пользователи добавляются равными порциями до --users
+    steps: int = 5
+
+    # Длительность одной ступени в секундах
+    step_duration: float = 60
+
+
+class SpikeLoadShapeConfig(BaseModel):
+    # Базовая нагрузка до и после всплеска — доля от --users
+    baseline: float = 0.2
+
+    # Длительность базовой нагрузки перед всплеском в секундах
+    warmup: float = 60
+
+    # Длительность всплеска в секундах
+    spike_duration: float = 30
+
+    # Длительность наблюдения за восстановлением после всплеска в секундах
+    recovery: float = 120
+
+    # Скорость запуска пользователей во время всплеска (пользователей в секунду)
+    spike_spawn_rate: float = 100
+
+
+class SinusoidalLoadShapeConfig(BaseModel):
+    # Период колебаний нагрузки в секундах (сжатый «суточный» цикл)
+    period: float = 600
+
+    # Минимальная нагрузка — доля от --users (максимум — --users)
+    min_fraction: float = 0.2
+
+    # Общая длительность теста в секундах
+    duration: float = 1800
+
+
+class SoakLoadShapeConfig(BaseModel):
+    # Общая длительность теста в секундах, включая разгон со --spawn-rate
+    duration: float = 4 * 60 * 60
+
+
+class RampToBreakLoadShapeConfig(BaseModel):
+    # Количество пользователей, добавляемых на каждой ступени
+    step_users: int = 10
+
+    # Длительность ступени в секундах (не меньше окна текущей статистики Locust — 10 секунд)
+    step_duration: float = 30
+
+    # Доля ошибок, при превышении которой тест останавливается
+    max_error_rate: float = 0.05
+
+    # p95 задержки в миллисекундах, при превышении которого тест останавливается
+    max_p95: float = 1000
+
+    # Максимальное количество пользователей (None — без ограничения)
+    max_users: int | None = None
+
+
+class SaturationSearchConfig(BaseModel):
+    # Интенсивность первой ступени (итераций в секунду на весь тест)
+    start_rate: float = 10
+
+    # Минимальная и максимальная интенсивность поиска
+    min_rate: float = 1
+    max_rate: float = 10000
+
+    # Прогрев в начале каждой ступени (не учитывается в метриках) и длительность замера, в секундах
+    warmup: float = 5
+    plateau: float = 20
+
+    # Пауза без нагрузки между ступенями, чтобы система успела разобрать очереди, в секундах
+    cooldown: float = 5
+
+    # Точность поиска: поиск завершается, когда граница известна с этой относительной погрешностью
+    precision: float = 0.05
+
+    # Максимальное количество ступеней
+    max_plateaus: int = 15
+
+    # SLO: p95 и p99 задержки запросов в миллисекундах и допустимая доля ошибок
+    max_p95: float = 500
+    max_p99: float = 1000
+    max_error_rate: float = 0.01
@@ -1,4 +1,30 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class ArrivalRateStageConfig(BaseModel):
+    # Длительность этапа в секундах
+    duration: float
+
+    # Интенсивность (итераций в секунду), к которой линейно приходит этап
+    target: float
+
+
+class ArrivalRateConfig(BaseModel):
+    # Интенсивность запуска итераций (итераций в секунду) в одном процессе-генераторе.
+    # В распределённом режиме каждый воркер создаёт такую нагрузку самостоятельно
+    rate: float = 10
+
+    # Профиль интенсивности: этапы с линейным переходом от предыдущего значения к target,
+    # например [{"duration": 60, "target": 50}, {"duration": 240, "target": 50}].
+    # После окончания профиля сохраняется интенсивность последнего этапа. Пусто — постоянная rate
+    stages: list[ArrivalRateStageConfig] = Field(default_factory=list)
+
+    # Максимальное количество пользователей класса: при нехватке свободных пользователей
+    # пул автоматически расширяется до этого значения, после — итерации отбрасываются
+    max_users: int = 1000
+
+    # Опоздание старта итерации (в секундах), начиная с которого она считается запоздавшей
+    late_threshold: float = 0.01
 
 
 class LocustUserConfig(BaseModel):
@@ -7,3 +33,9 @@ class LocustUserConfig(BaseModel):
 
     # Максимальное время ожидания между задачами (в секундах)
     wait_time_max: float = 3
+
+    # Количество конкурентных сессий на одного асинхронного пользователя (LocustAsyncBaseUser)
+    async_sessions: int = 10
+
+    # Открытая модель нагрузки для LocustArrivalRateUser
+    arrival_rate: ArrivalRateConfig = Field(default_factory=ArrivalRateConfig)
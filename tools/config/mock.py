@@ -0,0 +1,48 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from tools.config.sessions import ThinkTimeConfig
+
+
+class MockMethodConfig(BaseModel):
+    # Распределение задержки ответа (в секундах), как у пауз модели сессии: constant, uniform, exponential, lognormal
+    latency: ThinkTimeConfig = Field(default_factory=lambda: ThinkTimeConfig(mean=0.005))
+
+    # Доля запросов, которые завершаются ошибкой
+    error_rate: float = 0.0
+
+    # HTTP-статус ошибки; для gRPC он переводится в близкий статус (503 — UNAVAILABLE, 504 — DEADLINE_EXCEEDED и т.д.)
+    error_status: int = 503
+
+    # Количество элементов в списках ответа (операции, счета, карты счёта)
+    items: int = 5
+
+    # Размер документов (тарифы, договоры) в байтах
+    document_size: int = 1024
+
+
+class MockGatewayConfig(BaseModel):
+    # Адрес и порты mock-сервера gateway
+    host: str = "localhost"
+    http_port: int = 8003
+    grpc_port: int = 9003
+
+    # Количество потоков обработки gRPC-запросов
+    grpc_workers: int = 32
+
+    # Зерно генератора случайных данных и задержек (None — случайное)
+    seed: int | None = None
+
+    # Настройки методов по умолчанию
+    default: MockMethodConfig = Field(default_factory=MockMethodConfig)
+
+    # Переопределения по методам клиентов gateway (get_operations, make_purchase_operation, ...):
+    # {метод: {поле MockMethodConfig: значение}}, незаданные поля берутся из default
+    methods: dict[str, dict[str, Any]] = Field(default_factory=dict)
+
+    def get_method(self, name: str) -> MockMethodConfig:
+        if name not in self.methods:
+            return self.default
+
+        return MockMethodConfig.model_validate({**self.default.model_dump(), **self.methods[name]})
@@ -0,0 +1,44 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class RetryBudgetConfig(BaseModel):
+    # Включает бюджет повторов: клиент перестаёт повторять запросы, когда бюджет исчерпан
+    enabled: bool = False
+
+    # Доля повторов от логических запросов (0.1 — не больше 10% дополнительной нагрузки)
+    ratio: float = 0.1
+
+    # Минимальное количество повторов в секунду, доступное клиенту независимо от ratio
+    min_retries_per_second: float = 0.1
+
+    # Максимальный запас накопленных повторов
+    max_tokens: float = 10
+
+
+class RetryPolicyConfig(BaseModel):
+    # Стратегия повторов: none — без повторов, fixed — фиксированная пауза, exponential — экспоненциальная
+    strategy: Literal["none", "fixed", "exponential"] = "none"
+
+    # Максимальное количество попыток, включая первую
+    max_attempts: int = 3
+
+    # Пауза перед повтором (для exponential — перед первым повтором), в секундах
+    delay: float = 0.1
+
+    # Множитель паузы для exponential
+    multiplier: float = 2.0
+
+    # Максимальная пауза перед повтором, в секундах
+    max_delay: float = 5.0
+
+    # Случайный разброс паузы (full jitter): пауза выбирается равномерно от 0 до расчётного значения
+    jitter: bool = True
+
+    # Статусы, при которых выполняется повтор: коды HTTP ("503") или gRPC ("UNAVAILABLE"),
+    # а также "timeout" и "transport" для HTTP-запросов без ответа. Пусто — значения по умолчанию протокола
+    retryable: list[str] = Field(default_factory=list)
+
+    # Бюджет повторов
+    budget: RetryBudgetConfig = Field(default_factory=RetryBudgetConfig)
@@ -0,0 +1,46 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class KeyDistributionConfig(BaseModel):
+    # Распределение обращений к ключам (пользователям, счетам, картам): uniform, zipf или hot_set.
+    # «Горячими» считаются первые ключи списка сидинга
+    distribution: Literal["uniform", "zipf", "hot_set"] = "uniform"
+
+    # zipf: вес ключа ранга k пропорционален 1 / k^exponent
+    exponent: float = 1.0
+
+    # hot_set: доля горячих ключей и доля обращений, которая на них приходится
+    hot_keys: float = 0.2
+    hot_traffic: float = 0.8
+
+
+class KeyAccessConfig(BaseModel):
+    # sticky — виртуальный пользователь выбирает ключи один раз и работает с ними всё время;
+    # rotating — ключи выбираются заново при каждом обращении (на каждой итерации задачи)
+    assignment: Literal["sticky", "rotating"] = "sticky"
+
+    # Распределения по уровням: пользователи, счета пользователя, карты счёта
+    users: KeyDistributionConfig = Field(default_factory=KeyDistributionConfig)
+    accounts: KeyDistributionConfig = Field(default_factory=KeyDistributionConfig)
+    cards: KeyDistributionConfig = Field(default_factory=KeyDistributionConfig)
+
+
+class SeedsConfig(BaseModel):
+    # Переиспользовать существующий дамп сидинга ({dumps_dir}/{scenario}_seeds.json) вместо генерации новых данных.
+    # Включается, например, раннером серии запусков (tools.sweep) для всех запусков после первого
+    reuse_dump: bool = False
+
+    # Распределение обращений сценариев к сущностям сидинга (seeds.access.SeedsAccess)
+    access: KeyAccessConfig = Field(default_factory=KeyAccessConfig)
+
+    # Часть пользователей сидинга, которую загружает процесс: пользователи с номерами
+    # partition_index, partition_index + partition_count, ... Задаётся воркерам локального распределённого
+    # запуска (tools.distributed), чтобы воркеры работали с разными пользователями
+    partition_index: int = 0
+    partition_count: int = 1
+
+    # Папка дампов сидинга. Бенчмарк генератора (tools.generator_benchmark) сидит сценарии на mock gateway
+    # и хранит их дампы отдельно, чтобы не перезаписать дампы стенда
+    dumps_dir: str = "./dumps"
@@ -0,0 +1,83 @@
+import math
+import random
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+# Состояние «конец сессии»: после него пользователь начинает новую сессию с начального действия
+END_STATE = "end"
+
+
+class ThinkTimeConfig(BaseModel):
+    # Распределение паузы перед действием: constant, uniform, exponential или lognormal
+    distribution: Literal["constant", "uniform", "exponential", "lognormal"] = "constant"
+
+    # Пауза в секундах (constant) или среднее значение (exponential)
+    mean: float = 0.0
+
+    # Границы паузы в секундах (uniform)
+    low: float = 0.0
+    high: float = 0.0
+
+    # Медиана в секундах и стандартное отклонение логарифма (lognormal)
+    median: float = 0.0
+    sigma: float = 0.0
+
+    def sample(self, generator: random.Random) -> float:
+        """
+        Возвращает случайную паузу в секундах.
+
+        :param generator: Генератор случайных чисел пользователя.
+        :return: Пауза.
+        """
+        match self.distribution:
+            case "uniform":
+                return generator.uniform(self.low, self.high)
+            case "exponential":
+                return generator.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+            case "lognormal":
+                return generator.lognormvariate(math.log(self.median), self.sigma) if self.median > 0 else 0.0
+
+        return self.mean
+
+
+class SessionTransitionConfig(BaseModel):
+    # Вероятность перехода (вероятности переходов из состояния нормируются к сумме)
+    probability: float = 1.0
+
+    # Пауза перед следующим действием (None — wait_time пользователя)
+    think_time: ThinkTimeConfig | None = None
+
+
+class SessionModelConfig(BaseModel):
+    # Вероятности начальных действий сессии: {действие: вероятность}
+    initial: dict[str, float]
+
+    # Переходы между действиями: {действие: {следующее действие или "end": переход}}.
+    # Действие без переходов завершает сессию
+    transitions: dict[str, dict[str, SessionTransitionConfig]] = Field(default_factory=dict)
+
+    @property
+    def states(self) -> set[str]:
+        states = {*self.initial, *self.transitions}
+        states.update(state for transitions in self.transitions.values() for state in transitions)
+        return states - {END_STATE}
+
+    def get_initial_state(self, generator: random.Random) -> str:
+        return generator.choices(list(self.initial), weights=list(self.initial.values()))[0]
+
+    def get_transition(self, state: str, generator: random.Random) -> tuple[str, SessionTransitionConfig]:
+        """
+        Выбирает переход из состояния.
+
+        :param state: Текущее действие.
+        :param generator: Генератор случайных чисел пользователя.
+        :return: Следующее действие (или END_STATE) и параметры перехода.
+        """
+        transitions = self.transitions.get(state)
+        if not transitions:
+            return END_STATE, SessionTransitionConfig()
+
+        names = list(transitions)
+        name = generator.choices(names, weights=[transitions[item].probability for item in names])[0]
+        return name, transitions[name]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class VisibilityProbeConfig(BaseModel):
+    # Пауза перед первым опросом после записи, в секундах
+    delay: float = 0.05
+
+    # Множитель паузы между опросами (экспоненциальная отсрочка)
+    multiplier: float = 1.5
+
+    # Максимальная пауза между опросами, в секундах
+    max_delay: float = 1.0
+
+    # Адаптивный старт: первый опрос откладывается на эту долю от скользящего среднего задержки видимости
+    # (0 — всегда начинать с delay). Под нагрузкой задержка растёт, и частые пустые опросы
+    # только добавляют нагрузку на чтение
+    adaptive_start: float = 0.5
+
+    # Вес нового значения в скользящем среднем задержки видимости
+    smoothing: float = 0.2
+
+    # Время, после которого операция считается потерянной, в секундах
+    timeout: float = 30.0
@@ -0,0 +1,283 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import psutil
+
+from tools.logger import get_logger
+
+logger = get_logger("DISTRIBUTED")
+
+
+@dataclass
+class LocustProcess:
+    """
+    Процесс Locust (мастер или воркер) и замеры его загрузки CPU (в процентах одного ядра).
+    """
+    name: str
+    process: subprocess.Popen
+    cpu: int | None = None
+    samples: list[float] = field(default_factory=list)
+    saturated: int = 0
+
+    @property
+    def summary(self) -> dict:
+        return {
+            "cpu": self.cpu,
+            "avg_cpu_percent": round(sum(self.samples) / len(self.samples), 1) if self.samples else 0.0,
+            "max_cpu_percent": max(self.samples, default=0.0),
+            "saturated_samples": self.saturated,
+        }
+
+
+def read_config(path: str) -> dict[str, str]:
+    """
+    Читает v1.0.conf сценария (строки вида "key = value").
+
+    :param path: Путь к v1.0.conf.
+    :return: Параметры конфига.
+    """
+    options = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        key, separator, value = line.partition("=")
+        if separator and not line.lstrip().startswith(("#", ";")):
+            options[key.strip()] = value.strip()
+
+    return options
+
+
+def get_output_prefix(config: str, options: dict[str, str]) -> tuple[str, str]:
+    """
+    Возвращает префикс CSV-отчётов и путь HTML-отчёта в папке сценария (рядом с v1.0.conf).
+
+    :param config: Путь к v1.0.conf.
+    :param options: Параметры конфига.
+    :return: Префикс CSV и путь HTML.
+    """
+    folder = Path(config).parent
+    csv_prefix = folder / Path(options.get("csv", "locust")).name
+    html = folder / Path(options.get("html", "report.html")).name
+    return str(csv_prefix), str(html)
+
+
+def start_process(name: str, command: list[str], environ: dict[str, str], cpu: int | None) -> LocustProcess:
+    """
+    Запускает процесс Locust и привязывает его к ядру.
+
+    :param name: Имя процесса в логах (master, worker-0, ...).
+    :param command: Команда запуска.
+    :param environ: Переменные окружения процесса.
+    :param cpu: Номер ядра или None — без привязки.
+    :return: Запущенный процесс.
+    """
+    process = subprocess.Popen(command, env=environ)
+    if cpu is not None:
+        try:
+            psutil.Process(process.pid).cpu_affinity([cpu])
+        except (AttributeError, psutil.Error) as error:
+            # Привязка к ядрам поддерживается не везде (например, macOS)
+            logger.warning(f"{name}: CPU affinity is not available: {error}")
+            cpu = None
+
+    logger.info(f"Started {name} (pid {process.pid}" + (f", CPU {cpu})" if cpu is not None else ")"))
+    return LocustProcess(name=name, process=process, cpu=cpu)
+
+
+def watch(master: LocustProcess, workers: list[LocustProcess], interval: float, threshold: float) -> None:
+    """
+    Ждёт завершения мастера, периодически замеряя загрузку CPU процессов.
+
+    Воркер с загрузкой выше threshold два замера подряд считается насыщенным: генератор упирается
+    в своё ядро, и задержки в отчёте начинают включать очередь внутри генератора, а не только систему.
+
+    :param master: Процесс мастера.
+    :param workers: Процессы воркеров.
+    :param interval: Интервал замеров в секундах.
+    :param threshold: Порог насыщения в процентах одного ядра.
+    """
+    handles = {}
+    for item in (master, *workers):
+        try:
+            handles[item.name] = psutil.Process(item.process.pid)
+            handles[item.name].cpu_percent(None)
+        except psutil.Error:
+            continue
+
+    # Замеры подряд выше порога и воркеры, о насыщении которых уже предупредили
+    streaks: dict[str, int] = {}
+    warned: set[str] = set()
+    while master.process.poll() is None:
+        time.sleep(interval)
+        for item in (master, *workers):
+            handle = handles.get(item.name)
+            if handle is None or item.process.poll() is not None:
+                continue
+
+            try:
+                value = handle.cpu_percent(None)
+            except psutil.Error:
+                continue
+
+            item.samples.append(value)
+            if value < threshold or item is master:
+                streaks[item.name] = 0
+                continue
+
+            item.saturated += 1
+            streaks[item.name] = streaks.get(item.name, 0) + 1
+            if streaks[item.name] >= 2 and item.name not in warned:
+                warned.add(item.name)
+                logger.warning(
+                    f"{item.name} is saturated: CPU {value:.0f}% of one core. "
+                    f"Add workers or lower the load per worker, latencies include generator queueing"
+                )
+
+
+def run_distributed(
+        config: str,
+        workers: int,
+        master_port: int,
+        cpu_threshold: float,
+        interval: float,
+        options: list[str],
+        reuse_seeds: bool = False,
+        shared_seeds: bool = False,
+        affinity: bool = True
+) -> int:
+    """
+    Запускает сценарий локально в распределённом режиме: один мастер и workers воркеров.
+
+    1. Сидинг выполняется один раз — коротким запуском сценария без пользователей, —
+       а мастер и воркеры переиспользуют его дамп (SEEDS.REUSE_DUMP=true).
+    2. Каждый воркер получает свою часть пользователей сидинга (SEEDS.PARTITION_INDEX/COUNT),
+       если не задан shared_seeds: воркеры не работают с одними и теми же пользователями.
+       Если пользователей меньше, чем воркеров, сидинг предупреждает об этом, а воркеры без своей части
+       работают со всеми пользователями.
+    3. Мастер привязывается к ядру 0, воркеры — к следующим ядрам.
+    4. Пока идёт тест, загрузка CPU процессов замеряется; насыщенные воркеры попадают в предупреждения.
+    5. Отчёты мастера (CSV и HTML) и загрузка процессов ({csv}_workers.json) сохраняются в папку сценария.
+
+    :param config: Путь к v1.0.conf сценария.
+    :param workers: Количество воркеров.
+    :param master_port: Порт мастера.
+    :param cpu_threshold: Порог насыщения воркера в процентах одного ядра.
+    :param interval: Интервал замеров CPU в секундах.
+    :param options: Дополнительные аргументы Locust мастера (--users, --run-time и т.д.).
+    :param reuse_seeds: Переиспользовать существующий дамп сидинга вместо генерации.
+    :param shared_seeds: Все воркеры работают со всеми пользователями сидинга.
+    :param affinity: Привязывать процессы к ядрам.
+    :return: Код завершения мастера.
+    """
+    cpu_count = os.cpu_count() or 1
+    if workers + 1 > cpu_count:
+        logger.warning(f"{workers} workers and a master on {cpu_count} CPUs: processes will share cores")
+
+    csv_prefix, html = get_output_prefix(config, read_config(config))
+    base = [sys.executable, "-m", "locust", f"--config={config}"]
+
+    with tempfile.TemporaryDirectory() as folder:
+        logger.info("Seeding")
+        seeding = subprocess.run(
+            [*base, "--headless", "--users=0", "--run-time=1s", "--only-summary",
+             f"--csv={folder}/seeding", f"--html={folder}/seeding.html"],
+            env={
+                **os.environ,
+                "SEEDS.REUSE_DUMP": str(reuse_seeds).lower(),
+                # Сидинг загружает дамп с числом частей воркеров: если пользователей меньше, чем воркеров,
+                # предупреждение появится до запуска воркеров
+                **({} if shared_seeds else {"SEEDS.PARTITION_INDEX": "0", "SEEDS.PARTITION_COUNT": str(workers)}),
+            }
+        )
+    if seeding.returncode:
+        logger.error(f"Seeding failed with exit code {seeding.returncode}")
+        return seeding.returncode
+
+    environ = {**os.environ, "SEEDS.REUSE_DUMP": "true"}
+    master = start_process(
+        "master",
+        [*base, "--master", "--headless", f"--master-bind-port={master_port}", f"--expect-workers={workers}",
+         *options, f"--csv={csv_prefix}", f"--html={html}"],
+        environ,
+        cpu=0 if affinity else None
+    )
+
+    processes = []
+    for index in range(workers):
+        partition = {} if shared_seeds else {
+            "SEEDS.PARTITION_INDEX": str(index),
+            "SEEDS.PARTITION_COUNT": str(workers),
+        }
+        processes.append(
+            start_process(
+                f"worker-{index}",
+                [*base, "--worker", "--master-host=127.0.0.1", f"--master-port={master_port}", "--csv=", "--html="],
+                {**environ, **partition},
+                cpu=(index + 1) % cpu_count if affinity else None
+            )
+        )
+
+    try:
+        watch(master, processes, interval, cpu_threshold)
+    except KeyboardInterrupt:
+        logger.info("Interrupted, stopping master")
+        master.process.terminate()
+    finally:
+        exit_code = master.process.wait()
+        for item in processes:
+            try:
+                item.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"{item.name} did not stop after the master, terminating")
+                item.process.terminate()
+
+    with open(f"{csv_prefix}_workers.json", "w+", encoding="utf-8") as file:
+        json.dump({item.name: item.summary for item in (master, *processes)}, file, indent=2)
+
+    logger.info(
+        "CPU by process: " + ", ".join(
+            f"{item.name} avg {item.summary['avg_cpu_percent']:g}% max {item.summary['max_cpu_percent']:g}%"
+            for item in (master, *processes)
+        )
+    )
+    logger.info(f"Reports saved: {csv_prefix}_*.csv, {html}, {csv_prefix}_workers.json")
+    return exit_code
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run a scenario with a local master and one worker per core")
+    parser.add_argument("--config", required=True, help="Scenario v1.0.conf")
+    parser.add_argument("--workers", type=int, default=max((os.cpu_count() or 1) - 1, 1), help="Worker count")
+    parser.add_argument("--users", type=int, help="User count (default: from the config)")
+    parser.add_argument("--spawn-rate", type=float, help="Spawn rate (default: from the config)")
+    parser.add_argument("--run-time", help="Run time (default: from the config)")
+    parser.add_argument("--master-port", type=int, default=5557, help="Master port")
+    parser.add_argument("--cpu-threshold", type=float, default=90, help="Worker saturation threshold, %% of one core")
+    parser.add_argument("--interval", type=float, default=5, help="CPU sampling interval in seconds")
+    parser.add_argument("--reuse-seeds", action="store_true", help="Reuse existing seeds dump")
+    parser.add_argument("--shared-seeds", action="store_true", help="Give every worker all seeded users")
+    parser.add_argument("--no-affinity", action="store_true", help="Do not pin processes to CPU cores")
+    arguments = parser.parse_args()
+
+    sys.exit(
+        run_distributed(
+            config=arguments.config,
+            workers=arguments.workers,
+            master_port=arguments.master_port,
+            cpu_threshold=arguments.cpu_threshold,
+            interval=arguments.interval,
+            options=[
+                *([f"--users={arguments.users}"] if arguments.users is not None else []),
+                *([f"--spawn-rate={arguments.spawn_rate:g}"] if arguments.spawn_rate is not None else []),
+                *([f"--run-time={arguments.run_time}"] if arguments.run_time is not None else []),
+            ],
+            reuse_seeds=arguments.reuse_seeds,
+            shared_seeds=arguments.shared_seeds,
+            affinity=not arguments.no_affinity
+        )
+    )
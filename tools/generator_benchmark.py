@@ -0,0 +1,404 @@
+import argparse
+import csv
+import html
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+
+import psutil
+from locust import events
+
+from clients.gateway.locust import PROTOCOLS
+from config import settings
+from tools.charts import ChartSeries, render_line_chart
+from tools.logger import get_logger
+from tools.mock.locust import STARTUP_TIMEOUT, wait_for_port
+from tools.replay.actions import REPLAY_ACTIONS, ReplayAction
+from tools.sweep import read_aggregated, run_locust
+
+logger = get_logger("GENERATOR_BENCHMARK")
+
+# Сценарий, который вызывает один метод gateway без пауз (--ceiling-method)
+METHOD_CONFIG = "./scenarios/protocols/gateway/generator_ceiling/v1.0.conf"
+
+# Сценарии, которые по умолчанию прогоняются целиком. Сценарии с долгим сидингом (история операций)
+# или с ожиданием данных от gateway (проба видимости) на mock не имеют смысла
+DEFAULT_SCENARIOS = (
+    "./scenarios/protocols/gateway/existing_user_get_operations/v1.0.conf",
+    "./scenarios/protocols/gateway/existing_user_operations_session/v1.0.conf",
+)
+
+# Доля ядра, начиная с которой генератор считается упёршимся в ядро
+SATURATION_THRESHOLD = 0.9
+
+# Падение RPS на ядро относительно прошлого запуска, которое отмечается в отчёте
+REGRESSION_THRESHOLD = 0.1
+
+
+@dataclass
+class CeilingResult:
+    """
+    Потолок генератора для одного метода или сценария по одному протоколу — строка истории замеров.
+    """
+    timestamp: str
+    commit: str
+    kind: str
+    target: str
+    protocol: str
+    users: int
+    requests: int
+    failures: int
+    rps: float
+    cpu_cores: float
+    cpu_ms_per_request: float
+    rps_per_core: float
+    memory_kb_per_user: float
+    p50: float
+    p99: float
+    saturated: bool
+    exit_code: int
+
+
+def get_action(name: str) -> ReplayAction:
+    """
+    Возвращает действие по имени метода клиента gateway (например, "get_operations").
+    """
+    return next(action for action in REPLAY_ACTIONS if action.name == name)
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def read_json(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def collect_result(
+        kind: str,
+        target: str,
+        protocol: str,
+        users: int,
+        prefix: str,
+        exit_code: int,
+        timestamp: str,
+        commit: str
+) -> CeilingResult:
+    """
+    Собирает замер из отчётов Locust ({csv}_stats.csv, {csv}_percentiles.csv, {csv}_generator.json).
+
+    RPS на ядро считается по процессорному времени на запрос (1000 / cpu_ms_per_request), а не по
+    фактическому RPS: так потолок не занижается, если генератор не упёрся в ядро (например, упёрся mock).
+
+    :param kind: "method" или "scenario".
+    :param target: Метод клиента gateway или имя сценария.
+    :param protocol: Протокол.
+    :param users: Количество пользователей.
+    :param prefix: Префикс отчётов запуска.
+    :param exit_code: Код завершения Locust.
+    :param timestamp: Время серии замеров.
+    :param commit: Коммит, на котором выполнен замер.
+    :return: Строка истории.
+    """
+    stats = read_aggregated(f"{prefix}_stats.csv") or {}
+    percentiles = read_aggregated(f"{prefix}_percentiles.csv") or stats
+    generator = read_json(f"{prefix}_generator.json")
+    cpu_ms = generator.get("cpu_ms_per_request") or 0.0
+    cpu_cores = generator.get("cpu_cores") or 0.0
+    # Итоговая строка CSV Locust может не успеть записаться в коротком запуске — тогда RPS считается по замеру CPU
+    requests = int(stats.get("Request Count") or 0) or generator.get("requests") or 0
+    rps = float(stats.get("Requests/s") or 0)
+    if not rps and generator.get("wall_seconds"):
+        rps = requests / generator["wall_seconds"]
+
+    return CeilingResult(
+        timestamp=timestamp,
+        commit=commit,
+        kind=kind,
+        target=target,
+        protocol=protocol,
+        users=users,
+        requests=requests,
+        failures=int(stats.get("Failure Count", 0)),
+        rps=rps,
+        cpu_cores=cpu_cores,
+        cpu_ms_per_request=cpu_ms,
+        rps_per_core=round(1000 / cpu_ms, 1) if cpu_ms else 0.0,
+        memory_kb_per_user=generator.get("memory_kb_per_user") or 0.0,
+        p50=float(percentiles.get("50%", 0)),
+        p99=float(percentiles.get("99%", 0)),
+        saturated=cpu_cores >= SATURATION_THRESHOLD,
+        exit_code=exit_code,
+    )
+
+
+def read_history(path: str) -> list[CeilingResult]:
+    if not os.path.exists(path):
+        return []
+
+    converters = {field.name: field.type for field in fields(CeilingResult)}
+    with open(path, encoding="utf-8") as file:
+        return [
+            CeilingResult(**{
+                name: value == "True" if converters[name] is bool else converters[name](value)
+                for name, value in row.items()
+            })
+            for row in csv.DictReader(file)
+        ]
+
+
+def append_history(results: list[CeilingResult], path: str) -> None:
+    exists = os.path.exists(path)
+    with open(path, "a", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=[field.name for field in fields(CeilingResult)])
+        if not exists:
+            writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+
+def render_report(history: list[CeilingResult]) -> str:
+    """
+    Формирует HTML-отчёт: RPS на ядро по сериям замеров (по протоколам) и таблица последней серии
+    с изменением относительно предыдущей.
+
+    :param history: Все замеры из истории.
+    :return: HTML-страница.
+    """
+    timestamps = sorted({item.timestamp for item in history})
+    runs = {timestamp: index for index, timestamp in enumerate(timestamps, start=1)}
+    latest = [item for item in history if item.timestamp == timestamps[-1]] if timestamps else []
+
+    charts = []
+    for protocol in sorted({item.protocol for item in history}):
+        groups: dict[str, list[CeilingResult]] = {}
+        for item in history:
+            if item.protocol == protocol:
+                groups.setdefault(item.target, []).append(item)
+
+        series = [
+            ChartSeries(name=target, points=[(runs[item.timestamp], item.rps_per_core) for item in items])
+            for target, items in sorted(groups.items())
+        ]
+        charts.append(
+            f"<h3>{html.escape(protocol)}: RPS per core</h3>\n"
+            + render_line_chart(series, x_label="Benchmark run", y_label="RPS per core")
+        )
+
+    previous: dict[tuple[str, str], CeilingResult] = {}
+    for item in history:
+        if item.timestamp != timestamps[-1]:
+            previous[(item.target, item.protocol)] = item
+
+    rows = []
+    for item in latest:
+        before = previous.get((item.target, item.protocol))
+        change = (item.rps_per_core / before.rps_per_core - 1) if before and before.rps_per_core else None
+        flag = " ⚠" if change is not None and change < -REGRESSION_THRESHOLD else ""
+        rows.append(
+            f"<tr><td>{html.escape(item.kind)}</td><td>{html.escape(item.target)}</td>"
+            f"<td>{html.escape(item.protocol)}</td><td>{item.rps:.0f}</td><td>{item.cpu_cores:.2f}</td>"
+            f"<td>{item.cpu_ms_per_request:.3f}</td><td>{item.rps_per_core:.0f}</td>"
+            f"<td>{f'{change:+.1%}' if change is not None else '-'}{flag}</td>"
+            f"<td>{item.memory_kb_per_user:.0f}</td><td>{item.p50:g}</td><td>{item.p99:g}</td>"
+            f"<td>{item.failures}</td></tr>"
+        )
+
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Load generator ceiling</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 4px 12px; text-align: right; }}</style>
+</head>
+<body>
+<h2>Load generator ceiling against a zero-latency mock gateway</h2>
+<p>Latest run: {html.escape(timestamps[-1] if timestamps else "-")}
+({html.escape(latest[0].commit if latest else "-")}), {len(timestamps)} runs in history.</p>
+<table>
+<tr><th>Kind</th><th>Target</th><th>Protocol</th><th>RPS</th><th>CPU cores</th><th>CPU ms/request</th>
+<th>RPS per core</th><th>Change</th><th>KB per user</th><th>p50</th><th>p99</th><th>Failures</th></tr>
+{"".join(rows)}
+</table>
+<p>RPS per core = 1000 / CPU ms per request of the single-core generator process. If a gateway run
+reaches this RPS per generator core, the bottleneck is the generator, not the gateway.
+⚠ — more than {REGRESSION_THRESHOLD:.0%} below the previous run.</p>
+{"".join(charts)}
+</body>
+</html>
+"""
+
+
+def set_affinity(process: psutil.Process, cpus: list[int]) -> None:
+    try:
+        process.cpu_affinity(cpus)
+    except (AttributeError, psutil.Error) as error:
+        # Привязка к ядрам поддерживается не везде (например, macOS)
+        logger.warning(f"CPU affinity is not available: {error}")
+
+
+def start_mock(cpus: list[int] | None) -> subprocess.Popen:
+    """
+    Запускает mock gateway без задержек и ошибок в отдельном процессе.
+
+    :param cpus: Ядра mock-сервера (None — без привязки).
+    :return: Процесс mock-сервера.
+    """
+    default = settings.mock_gateway.default.model_copy(update={"error_rate": 0.0})
+    default.latency = default.latency.model_copy(update={"distribution": "constant", "mean": 0.0})
+    environ = {**os.environ, "MOCK_GATEWAY.DEFAULT": default.model_dump_json(), "MOCK_GATEWAY.METHODS": "{}"}
+
+    process = subprocess.Popen([sys.executable, "-m", "tools.mock.server"], env=environ)
+    if cpus:
+        set_affinity(psutil.Process(process.pid), cpus)
+
+    config = settings.mock_gateway
+    for port in (config.http_port, config.grpc_port):
+        if not wait_for_port(config.host, port, STARTUP_TIMEOUT):
+            process.terminate()
+            raise RuntimeError(f"Mock gateway did not start on {config.host}:{port} in {STARTUP_TIMEOUT}s")
+
+    return process
+
+
+def run_benchmark(
+        methods: list[str],
+        scenarios: list[str],
+        protocols: list[str],
+        users: int,
+        run_time: str,
+        output: str,
+        cpu: int | None = 0
+) -> list[CeilingResult]:
+    """
+    Измеряет потолок генератора нагрузки: каждый метод gateway и каждый сценарий по каждому протоколу
+    запускается против mock gateway с нулевой задержкой, без пауз между запросами.
+
+    1. Mock работает в отдельном процессе на остальных ядрах, генератор (Locust) — на одном ядре cpu.
+    2. Методы вызываются сценарием generator_ceiling, сценарии — целиком, с нулевыми паузами
+       (LOCUST_USER.WAIT_TIME_*) и сидингом на mock в отдельную папку дампов.
+    3. Для каждого запуска сохраняются RPS, загрузка ядра, CPU и память на запрос и пользователя.
+    4. Замеры дописываются в {output}/history.csv, отчёт с динамикой — {output}/history.html,
+       отчёты Locust запусков — в {output}/<время серии>/.
+
+    :param methods: Методы клиентов gateway (get_operations, make_purchase_operation, ...).
+    :param scenarios: Пути к v1.0.conf протоколо-независимых сценариев.
+    :param protocols: Протоколы.
+    :param users: Количество пользователей в каждом запуске.
+    :param run_time: Длительность запуска (как --run-time Locust).
+    :param output: Папка с историей замеров.
+    :param cpu: Ядро генератора (None — без привязки).
+    :return: Замеры серии.
+    """
+    timestamp = time.strftime("%Y-%m-%dT%H-%M-%S")
+    folder = os.path.join(output, timestamp)
+    os.makedirs(folder, exist_ok=True)
+    commit = get_commit()
+
+    cpu_count = os.cpu_count() or 1
+    mock_cpus = [item for item in range(cpu_count) if item != cpu] if cpu is not None and cpu_count > 1 else None
+    mock = start_mock(mock_cpus)
+    if cpu is not None:
+        # Процессы Locust наследуют привязку запускающего процесса
+        set_affinity(psutil.Process(), [cpu])
+
+    config = settings.mock_gateway
+    os.environ.update({
+        "GATEWAY_HTTP_CLIENT.URL": f"http://{config.host}:{config.http_port}",
+        "GATEWAY_GRPC_CLIENT.HOST": config.host,
+        "GATEWAY_GRPC_CLIENT.PORT": str(config.grpc_port),
+        "LOCUST_USER.WAIT_TIME_MIN": "0",
+        "LOCUST_USER.WAIT_TIME_MAX": "0",
+        "SEEDS.DUMPS_DIR": os.path.join(folder, "dumps"),
+        "SEEDS.PARTITION_COUNT": "1",
+    })
+
+    targets = [("method", name, METHOD_CONFIG) for name in methods]
+    targets += [("scenario", Path(path).parent.name, path) for path in scenarios]
+    options = [f"--users={users}", f"--spawn-rate={users}", f"--run-time={run_time}", "--only-summary"]
+
+    results = []
+    try:
+        for kind, target, path in targets:
+            for index, protocol in enumerate(protocols):
+                prefix = os.path.join(folder, f"{target}_{protocol}")
+                extra = [f"--ceiling-method={target}"] if kind == "method" else []
+                exit_code = run_locust(
+                    path, prefix, [f"--protocol={protocol}", *options, *extra], reuse_seeds=index > 0
+                )
+                result = collect_result(kind, target, protocol, users, prefix, exit_code, timestamp, commit)
+                logger.info(
+                    f"{target} ({protocol}): {result.rps:.0f} RPS at {result.cpu_cores:.0%} of a core, "
+                    f"{result.cpu_ms_per_request:g} ms CPU per request, {result.rps_per_core:.0f} RPS per core, "
+                    f"{result.memory_kb_per_user:g} KB per user"
+                )
+                if not result.saturated:
+                    logger.warning(
+                        f"{target} ({protocol}): the generator used {result.cpu_cores:.0%} of its core, "
+                        f"the mock or --users limited the run; RPS per core is derived from CPU per request"
+                    )
+                results.append(result)
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    history_path = os.path.join(output, "history.csv")
+    append_history(results, history_path)
+    with open(os.path.join(output, "history.html"), "w+", encoding="utf-8") as file:
+        file.write(render_report(read_history(history_path)))
+
+    if results:
+        medians = {
+            protocol: statistics.median(item.rps_per_core for item in results if item.protocol == protocol)
+            for protocol in protocols
+        }
+        logger.info("Median RPS per core: " + ", ".join(f"{key} {value:.0f}" for key, value in medians.items()))
+    logger.info(f"Generator ceiling saved: {history_path}, {os.path.join(output, 'history.html')}, {folder}")
+    return results
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--ceiling-method",
+        default="get_operations",
+        choices=[action.name for action in REPLAY_ACTIONS],
+        env_var="LOCUST_CEILING_METHOD",
+        help="Метод клиента gateway, который вызывает сценарий generator_ceiling",
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the load generator ceiling against a zero-latency mock")
+    parser.add_argument(
+        "--methods", nargs="*", default=[action.name for action in REPLAY_ACTIONS], help="Gateway client methods"
+    )
+    parser.add_argument("--scenarios", nargs="*", default=list(DEFAULT_SCENARIOS), help="Scenario v1.0.conf files")
+    parser.add_argument("--protocols", nargs="+", choices=PROTOCOLS, default=list(PROTOCOLS), help="Protocols")
+    parser.add_argument("--users", type=int, default=50, help="User count of each run")
+    parser.add_argument("--run-time", default="30s", help="Run time of each run")
+    parser.add_argument("--cpu", type=int, default=0, help="Generator CPU core")
+    parser.add_argument("--no-affinity", action="store_true", help="Do not pin the generator and the mock to cores")
+    parser.add_argument("--output", default="./reports/generator", help="Output directory with the history")
+    arguments = parser.parse_args()
+
+    run_benchmark(
+        methods=arguments.methods,
+        scenarios=arguments.scenarios,
+        protocols=arguments.protocols,
+        users=arguments.users,
+        run_time=arguments.run_time,
+        output=arguments.output,
+        cpu=None if arguments.no_affinity else arguments.cpu
+    )
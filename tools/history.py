@@ -0,0 +1,293 @@
+import csv
+import html
+import math
+import time
+from dataclasses import dataclass, asdict, fields
+
+from google.protobuf.message import Message
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from pydantic import BaseModel
+
+from tools.charts import ChartSeries, render_line_chart
+from tools.logger import get_logger
+from tools.metrics.histograms import LatencyHistogram, histograms, record_latency
+
+logger = get_logger("HISTORY_GROWTH")
+
+# Типы записей статистики Locust по длине истории операций: задержка и размер ответа запроса ("History size")
+# и время разбора ответа клиентом ("History parse"). Записи ведутся напрямую в environment.stats
+# и не попадают в Aggregated
+HISTORY_SIZE_TYPE = "History size"
+HISTORY_PARSE_TYPE = "History parse"
+
+# Длины истории операций в когортах по умолчанию
+DEFAULT_COHORTS = "10,100,1000,10000"
+
+# Окружение запуска (для статистики по когортам в обработчике events.request)
+_environment: Environment | None = None
+
+
+@dataclass
+class HistoryResult:
+    """
+    Итоги запросов одного метода по счетам одной когорты — точка кривой «задержка от длины истории».
+    """
+    name: str
+    operations: int
+    requests: int
+    failures: int
+    p50: float
+    p95: float
+    p99: float
+    bytes_per_response: float
+    parse_ms: float
+
+
+def parse_cohorts(value: str) -> list[int]:
+    """
+    Разбирает список длин истории вида "10,100,1000".
+
+    :param value: Значение --history-cohorts.
+    :return: Длины истории по возрастанию.
+    """
+    return sorted({int(item) for item in value.split(",") if item.strip()})
+
+
+def get_entry_name(name: str, operations: int) -> str:
+    return f"{name} [{operations}]"
+
+
+def record_parse_cost(environment: Environment, name: str, operations: int, response: Message | BaseModel) -> None:
+    """
+    Записывает время разбора ответа клиентом для когорты.
+
+    Клиенты разбирают ответ внутри вызова, поэтому разбор того же ответа повторяется отдельно:
+    protobuf — из сериализованного сообщения, pydantic-схема — из JSON. Это цена десериализации
+    на стороне клиента (мобильного приложения), которая растёт вместе с историей так же, как размер ответа.
+
+    :param environment: Окружение Locust.
+    :param name: Имя метода (например, "get_operations").
+    :param operations: Длина истории когорты.
+    :param response: Ответ клиента (protobuf-сообщение или pydantic-схема).
+    """
+    if isinstance(response, Message):
+        data = response.SerializeToString()
+        start_time = time.perf_counter()
+        type(response).FromString(data)
+    else:
+        data = response.model_dump_json(by_alias=True)
+        start_time = time.perf_counter()
+        type(response).model_validate_json(data)
+
+    parse_time = (time.perf_counter() - start_time) * 1000
+    environment.stats.get(get_entry_name(name, operations), HISTORY_PARSE_TYPE).log(parse_time, len(data))
+    record_latency(HISTORY_PARSE_TYPE, get_entry_name(name, operations), parse_time)
+
+
+def fit_exponent(points: list[tuple[float, float]]) -> float | None:
+    """
+    Оценивает показатель степени b в зависимости y = a * x^b методом наименьших квадратов в логарифмах.
+
+    b около 0 — задержка не зависит от длины истории, около 1 — растёт линейно (O(n)).
+
+    :param points: Точки (длина истории, задержка).
+    :return: Показатель степени или None, если точек меньше двух.
+    """
+    logs = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(logs) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    variance = sum((x - mean_x) ** 2 for x, _ in logs)
+    if not variance:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / variance
+
+
+def collect_results(environment: Environment) -> list[HistoryResult]:
+    """
+    Собирает итоги по методам и когортам из статистики Locust и точных гистограмм.
+
+    :param environment: Окружение Locust.
+    :return: Итоги, отсортированные по методу и длине истории.
+    """
+    results = []
+    for (name, request_type), entry in environment.stats.entries.items():
+        if request_type != HISTORY_SIZE_TYPE or not name.endswith("]"):
+            continue
+
+        method, _, operations = name[:-1].rpartition(" [")
+        histogram = histograms.total.get((HISTORY_SIZE_TYPE, name), LatencyHistogram())
+        parse = environment.stats.entries.get((name, HISTORY_PARSE_TYPE))
+        results.append(
+            HistoryResult(
+                name=method,
+                operations=int(operations),
+                requests=entry.num_requests,
+                failures=entry.num_failures,
+                p50=histogram.get_percentile(0.5),
+                p95=histogram.get_percentile(0.95),
+                p99=histogram.get_percentile(0.99),
+                bytes_per_response=entry.avg_content_length,
+                parse_ms=parse.avg_response_time if parse else 0.0,
+            )
+        )
+
+    return sorted(results, key=lambda item: (item.name, item.operations))
+
+
+def render_report(results: list[HistoryResult]) -> str:
+    """
+    Формирует HTML-отчёт: задержка, размер ответа и время разбора от длины истории
+    (ось X — десятичный логарифм количества операций) и показатели роста по методам.
+
+    :param results: Итоги по методам и когортам.
+    :return: HTML-страница.
+    """
+    groups: dict[str, list[HistoryResult]] = {}
+    for result in results:
+        groups.setdefault(result.name, []).append(result)
+
+    charts = []
+    for title, getters in (
+            ("Latency (ms)", {"p50": lambda item: item.p50, "p99": lambda item: item.p99}),
+            ("Response size (bytes)", {"": lambda item: item.bytes_per_response}),
+            ("Client parse time (ms)", {"": lambda item: item.parse_ms}),
+    ):
+        series = [
+            ChartSeries(
+                name=f"{name} {label}".strip(),
+                points=[(math.log10(item.operations), getter(item)) for item in items if item.operations > 0]
+            )
+            for name, items in groups.items()
+            for label, getter in getters.items()
+        ]
+        charts.append(
+            f"<h3>{title}</h3>\n" + render_line_chart(series, x_label="log10(operations)", y_label=title)
+        )
+
+    growth = []
+    for name, items in groups.items():
+        exponents = [
+            fit_exponent([(item.operations, getter(item)) for item in items])
+            for getter in (lambda item: item.p50, lambda item: item.bytes_per_response, lambda item: item.parse_ms)
+        ]
+        growth.append(
+            f"<tr><td>{html.escape(name)}</td>"
+            + "".join(f"<td>{exponent:.2f}</td>" if exponent is not None else "<td>-</td>" for exponent in exponents)
+            + "</tr>"
+        )
+
+    rows = "\n".join(
+        f"<tr><td>{html.escape(item.name)}</td><td>{item.operations}</td><td>{item.requests}</td>"
+        f"<td>{item.failures}</td><td>{item.p50:g}</td><td>{item.p95:g}</td><td>{item.p99:g}</td>"
+        f"<td>{item.bytes_per_response:.0f}</td><td>{item.parse_ms:.3f}</td></tr>"
+        for item in results
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Operations history growth</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 4px 12px; text-align: right; }}</style>
+</head>
+<body>
+<h2>Latency vs operations history size</h2>
+{"".join(charts)}
+<h3>Growth exponents (y ~ operations^b)</h3>
+<table>
+<tr><th>Method</th><th>p50 latency</th><th>Response size</th><th>Parse time</th></tr>
+{"".join(growth)}
+</table>
+<p>b ≈ 0 — independent of history size, b ≈ 1 — linear (O(n)) growth.</p>
+<h3>Results</h3>
+<table>
+<tr><th>Method</th><th>Operations</th><th>Requests</th><th>Failures</th><th>p50</th><th>p95</th><th>p99</th>
+<th>Bytes</th><th>Parse ms</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--history-cohorts",
+        default=DEFAULT_COHORTS,
+        env_var="LOCUST_HISTORY_COHORTS",
+        help="Длины истории операций в когортах счетов через запятую, например 10,100,1000,10000",
+    )
+    parser.add_argument(
+        "--history-accounts",
+        type=int,
+        default=10,
+        env_var="LOCUST_HISTORY_ACCOUNTS",
+        help="Количество счетов в каждой когорте",
+    )
+    parser.add_argument(
+        "--history-reseed",
+        action="store_true",
+        default=False,
+        env_var="LOCUST_HISTORY_RESEED",
+        help="Пересоздать дампы когорт, даже если они уже есть",
+    )
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    global _environment
+    _environment = environment
+
+
+@events.request.add_listener
+def on_request(
+        response_time: float,
+        response_length: int,
+        exception: Exception | None,
+        context: dict | None,
+        **kwargs
+):
+    if _environment is None or not context or "history_size" not in context:
+        return
+
+    name = get_entry_name(context["history_method"], context["history_size"])
+    entry = _environment.stats.get(name, HISTORY_SIZE_TYPE)
+    entry.log(response_time, response_length)
+    record_latency(HISTORY_SIZE_TYPE, name, response_time)
+    if exception is not None:
+        entry.log_error(exception)
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    results = collect_results(environment)
+    if not results:
+        return
+
+    lines = [
+        f"{item.name} [{item.operations}]: p50 {item.p50:g} ms, p99 {item.p99:g} ms, "
+        f"{item.bytes_per_response:.0f} bytes, parse {item.parse_ms:.3f} ms"
+        for item in results
+    ]
+    logger.info("Operations history growth:\n" + "\n".join(lines))
+
+    csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+    if not csv_prefix:
+        return
+
+    with open(f"{csv_prefix}_history.csv", "w+", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=[field.name for field in fields(HistoryResult)])
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+    with open(f"{csv_prefix}_history.html", "w+", encoding="utf-8") as file:
+        file.write(render_report(results))
+
+    logger.info(f"History growth report saved to files: {csv_prefix}_history.csv, {csv_prefix}_history.html")
@@ -0,0 +1,225 @@
+import json
+import math
+
+from locust import LoadTestShape, events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from pydantic import BaseModel
+
+from tools.config.load_shapes import (
+    StepLoadShapeConfig,
+    SpikeLoadShapeConfig,
+    SinusoidalLoadShapeConfig,
+    SoakLoadShapeConfig,
+    RampToBreakLoadShapeConfig
+)
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+
+logger = get_logger("LOAD_SHAPES")
+
+# Итоги ramp-to-break: точка отказа и последняя «здоровая» ступень
+counters = get_counters("load_shape")
+
+
+class BaseLoadShape(LoadTestShape):
+    """
+    Базовый профиль нагрузки библиотеки.
+
+    Профили не объявляются в locustfile: их выбирает опция --load-shape (load-shape в v1.0.conf),
+    а параметры задаются JSON-объектом --load-shape-options. Максимальное количество пользователей
+    и скорость разгона берутся из --users и --spawn-rate сценария.
+    """
+    abstract = True
+    use_common_options = True
+
+    def __init__(self, users: int, spawn_rate: float, config: BaseModel):
+        """
+        :param users: Максимальное количество пользователей (--users).
+        :param spawn_rate: Скорость запуска пользователей (--spawn-rate).
+        :param config: Параметры профиля.
+        """
+        super().__init__()
+        self.users = users
+        self.spawn_rate = spawn_rate
+        self.config = config
+
+
+class StepLoadShape(BaseLoadShape):
+    """
+    Лестница: нагрузка растёт ступенями до --users, каждая ступень держится step_duration секунд.
+    """
+    config: StepLoadShapeConfig
+
+    def tick(self) -> tuple[int, float] | None:
+        step = int(self.get_run_time() // self.config.step_duration)
+        if step >= self.config.steps:
+            return None
+
+        return math.ceil(self.users * (step + 1) / self.config.steps), self.spawn_rate
+
+
+class SpikeLoadShape(BaseLoadShape):
+    """
+    Всплеск: базовая нагрузка, резкий скачок до --users, возврат к базовой нагрузке
+    и наблюдение за восстановлением системы.
+    """
+    config: SpikeLoadShapeConfig
+
+    def tick(self) -> tuple[int, float] | None:
+        run_time = self.get_run_time()
+        baseline = max(1, round(self.users * self.config.baseline))
+
+        if run_time < self.config.warmup:
+            return baseline, self.spawn_rate
+        if run_time < self.config.warmup + self.config.spike_duration:
+            return self.users, self.config.spike_spawn_rate
+        if run_time < self.config.warmup + self.config.spike_duration + self.config.recovery:
+            return baseline, self.config.spike_spawn_rate
+
+        return None
+
+
+class SinusoidalLoadShape(BaseLoadShape):
+    """
+    Синусоида: нагрузка плавно колеблется между min_fraction * --users и --users
+    с периодом period — сжатая модель суточного профиля.
+    """
+    config: SinusoidalLoadShapeConfig
+
+    def tick(self) -> tuple[int, float] | None:
+        run_time = self.get_run_time()
+        if run_time >= self.config.duration:
+            return None
+
+        low = self.users * self.config.min_fraction
+        users = low + (self.users - low) * (1 - math.cos(2 * math.pi * run_time / self.config.period)) / 2
+        return max(1, round(users)), self.spawn_rate
+
+
+class SoakLoadShape(BaseLoadShape):
+    """
+    Длительная стабильная нагрузка (soak): разгон до --users и удержание в течение duration.
+    Деградацию во времени показывают интервальные гистограммы и история статистики Locust.
+    """
+    config: SoakLoadShapeConfig
+
+    def tick(self) -> tuple[int, float] | None:
+        if self.get_run_time() >= self.config.duration:
+            return None
+
+        return self.users, self.spawn_rate
+
+
+class RampToBreakLoadShape(BaseLoadShape):
+    """
+    Нагрузка до отказа: каждые step_duration секунд добавляется step_users пользователей.
+    В конце каждой ступени проверяются доля ошибок и p95 за текущее окно статистики Locust;
+    при превышении порога тест останавливается, а точка отказа и последняя ступень,
+    укладывающаяся в пороги, выводятся в лог и сохраняются в счётчики load_shape.
+    """
+    config: RampToBreakLoadShapeConfig
+
+    def __init__(self, users: int, spawn_rate: float, config: RampToBreakLoadShapeConfig):
+        super().__init__(users, spawn_rate, config)
+        self.step = 0
+        self.healthy: dict[str, float] | None = None
+
+    def get_step_metrics(self) -> dict[str, float]:
+        total = self.runner.stats.total
+        rps = total.current_rps
+        return {
+            "users": self.get_current_user_count(),
+            "rps": rps,
+            "error_rate": total.current_fail_per_sec / rps if rps else 0.0,
+            "p95": total.get_current_response_time_percentile(0.95) or 0.0,
+        }
+
+    def report(self, broken: dict[str, float]) -> None:
+        for name, values in (("breaking point", broken), ("last healthy step", self.healthy)):
+            for metric, value in (values or {}).items():
+                counters.inc(name, metric, value)
+
+        logger.info(
+            f"Breaking point: {broken['users']} users, {broken['rps']:.1f} RPS, "
+            f"error rate {broken['error_rate']:.1%}, p95 {broken['p95']:g} ms"
+            + (
+                f"; last healthy step: {self.healthy['users']} users, {self.healthy['rps']:.1f} RPS"
+                if self.healthy else ""
+            )
+        )
+
+    def tick(self) -> tuple[int, float] | None:
+        step = int(self.get_run_time() // self.config.step_duration)
+        if step > self.step:
+            # Ступень завершилась — оцениваем её по текущему окну статистики
+            self.step = step
+            metrics = self.get_step_metrics()
+            if metrics["error_rate"] > self.config.max_error_rate or metrics["p95"] > self.config.max_p95:
+                self.report(metrics)
+                return None
+
+            self.healthy = metrics
+
+        users = self.config.step_users * (self.step + 1)
+        if self.config.max_users is not None and users > self.config.max_users:
+            logger.info(f"Breaking point not reached up to {self.config.max_users} users")
+            return None
+
+        return users, self.spawn_rate
+
+
+# Профили, доступные для --load-shape, и модели их параметров
+LOAD_SHAPES: dict[str, tuple[type[BaseLoadShape], type[BaseModel]]] = {
+    "step": (StepLoadShape, StepLoadShapeConfig),
+    "spike": (SpikeLoadShape, SpikeLoadShapeConfig),
+    "sinusoidal": (SinusoidalLoadShape, SinusoidalLoadShapeConfig),
+    "soak": (SoakLoadShape, SoakLoadShapeConfig),
+    "ramp-to-break": (RampToBreakLoadShape, RampToBreakLoadShapeConfig),
+}
+
+
+def build_load_shape(name: str, users: int, spawn_rate: float, options: str | dict) -> BaseLoadShape:
+    """
+    Создаёт профиль нагрузки по имени.
+
+    :param name: Имя профиля (ключ LOAD_SHAPES).
+    :param users: Максимальное количество пользователей.
+    :param spawn_rate: Скорость запуска пользователей.
+    :param options: Параметры профиля — JSON-строка или словарь.
+    :return: Экземпляр LoadTestShape.
+    """
+    shape_class, config_class = LOAD_SHAPES[name]
+    config = config_class.model_validate(json.loads(options) if isinstance(options, str) else options)
+    return shape_class(users, spawn_rate, config)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--load-shape",
+        choices=["none", *LOAD_SHAPES],
+        default="none",
+        env_var="LOCUST_LOAD_SHAPE",
+        help="Профиль нагрузки из tools.load_shapes (none — линейный разгон до --users)",
+    )
+    parser.add_argument(
+        "--load-shape-options",
+        default="{}",
+        env_var="LOCUST_LOAD_SHAPE_OPTIONS",
+        help="Параметры профиля нагрузки в виде JSON, например {\"steps\": 5, \"step_duration\": 60}",
+    )
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    options = environment.parsed_options
+    name = getattr(options, "load_shape", "none")
+    # Профилем управляет мастер (или локальный процесс)
+    if name == "none" or isinstance(environment.runner, WorkerRunner):
+        return
+
+    shape = build_load_shape(name, options.num_users or 1, options.spawn_rate or 1, options.load_shape_options)
+    shape.runner = environment.runner
+    environment.shape_class = shape
+    logger.info(f"Load shape: {name} {shape.config.model_dump()}")
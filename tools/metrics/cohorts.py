@@ -0,0 +1,129 @@
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+from tools.logger import get_logger
+from tools.metrics.histograms import record_latency
+
+logger = get_logger("METRICS_COHORTS")
+
+# Типы записей статистики Locust по когортам тестовых пользователей: итог по когорте ("Cohort", имя — когорта)
+# и по маршрутам внутри когорты ("Cohort route", имя — "<маршрут> [<когорта>]").
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+COHORT_TYPE = "Cohort"
+COHORT_ROUTE_TYPE = "Cohort route"
+
+# Типы счетов пользователя сидинга (по полям SeedUserResult)
+ACCOUNT_TYPES = ("deposit", "savings", "debit_card", "credit_card")
+
+# Окружение запуска (для статистики по когортам в обработчике events.request)
+_environment: Environment | None = None
+
+
+def get_bucket(count: int) -> str:
+    """
+    Возвращает интервал количества по порядку величины: "0", "1-9", "10-99", "100-999", ...
+
+    :param count: Количество (операций, карт).
+    :return: Интервал.
+    """
+    if count <= 0:
+        return "0"
+
+    low = 10 ** (len(str(count)) - 1)
+    return f"{low}-{low * 10 - 1}"
+
+
+def get_accounts_by_type(user: SeedUserResult) -> dict[str, list[SeedAccountResult]]:
+    return {account_type: getattr(user, f"{account_type}_accounts") for account_type in ACCOUNT_TYPES}
+
+
+def get_operations_count(account: SeedAccountResult) -> int:
+    return sum(
+        len(operations) for operations in (
+            account.top_up_operations,
+            account.purchase_operations,
+            account.transfer_operations,
+            account.cash_withdrawal_operations,
+        )
+    )
+
+
+def get_cohort(user: SeedUserResult, account: SeedAccountResult | None = None) -> str:
+    """
+    Возвращает когорту тестового пользователя (или его счёта): тип счёта, количество операций и карт.
+
+    Для пользователя тип — все типы его счетов через "+", операции и карты — по всем счетам;
+    для счёта — его тип и его операции и карты. Количества округляются до порядка величины,
+    чтобы когорт было немного: "credit_card | ops 100-999 | cards 1-9".
+
+    :param user: Пользователь сидинга.
+    :param account: Счёт пользователя, с которым работает запрос (если выбран).
+    :return: Имя когорты.
+    """
+    accounts_by_type = get_accounts_by_type(user)
+    if account is None:
+        account_types = [account_type for account_type, accounts in accounts_by_type.items() if accounts]
+        accounts = [item for accounts in accounts_by_type.values() for item in accounts]
+    else:
+        account_types = [
+            account_type for account_type, accounts in accounts_by_type.items()
+            if any(item is account for item in accounts)
+        ]
+        accounts = [account]
+
+    operations = sum(get_operations_count(item) for item in accounts)
+    cards = sum(len(item.physical_cards) + len(item.virtual_cards) for item in accounts)
+    return f"{'+'.join(account_types) or 'none'} | ops {get_bucket(operations)} | cards {get_bucket(cards)}"
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    global _environment
+    _environment = environment
+
+
+@events.request.add_listener
+def on_request(
+        name: str,
+        response_time: float,
+        response_length: int,
+        exception: Exception | None,
+        context: dict | None,
+        **kwargs
+):
+    if _environment is None or not context or "cohort" not in context:
+        return
+
+    cohort = context["cohort"]
+    for entry in (
+            _environment.stats.get(cohort, COHORT_TYPE),
+            _environment.stats.get(f"{name} [{cohort}]", COHORT_ROUTE_TYPE),
+    ):
+        entry.log(response_time, response_length)
+        record_latency(entry.method, entry.name, response_time)
+        if exception is not None:
+            entry.log_error(exception)
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    entries = sorted(
+        (entry for (_, request_type), entry in environment.stats.entries.items() if request_type == COHORT_TYPE),
+        key=lambda item: item.name
+    )
+    if not entries:
+        return
+
+    total = environment.stats.total.num_requests or 1
+    lines = [
+        f"{entry.name}: {entry.num_requests} requests ({entry.num_requests / total:.1%}), "
+        f"p50 {entry.get_response_time_percentile(0.5):g} ms, p99 {entry.get_response_time_percentile(0.99):g} ms, "
+        f"failures {entry.fail_ratio:.2%}"
+        for entry in entries
+    ]
+    logger.info("Latency by seeded-entity cohort:\n" + "\n".join(lines))
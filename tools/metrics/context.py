@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Iterator
+
+# Контекст запросов текущего гринлета (или asyncio-задачи).
+# Клиенты захватывают его в момент начала вызова и передают в events.request как context
+_request_context: ContextVar[dict[str, Any]] = ContextVar("request_context", default={})
+
+
+def get_request_context() -> dict[str, Any]:
+    """
+    Возвращает копию текущего контекста запросов.
+
+    HTTP event hook и gRPC-интерцептор вызывают функцию в момент отправки запроса:
+    ответ gRPC future может прийти в другом гринлете, где контекст уже другой.
+
+    :return: Словарь со значениями контекста (например, {"transactions": (...)})
+    """
+    return dict(_request_context.get())
+
+
+def set_request_context(**values: Any) -> Token:
+    """
+    Добавляет значения в контекст запросов.
+
+    :param values: Значения, которые получат все запросы до вызова reset_request_context.
+    :return: Токен для восстановления предыдущего контекста.
+    """
+    return _request_context.set({**_request_context.get(), **values})
+
+
+def reset_request_context(token: Token) -> None:
+    _request_context.reset(token)
+
+
+@contextmanager
+def request_context(**values: Any) -> Iterator[None]:
+    """
+    Контекстный менеджер, добавляющий значения в контекст всех запросов внутри блока.
+
+    :param values: Значения контекста.
+    """
+    token = set_request_context(**values)
+    try:
+        yield
+    finally:
+        reset_request_context(token)
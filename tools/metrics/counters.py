@@ -0,0 +1,132 @@
+import json
+from collections import Counter, defaultdict
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.logger import get_logger
+
+logger = get_logger("METRICS_COUNTERS")
+
+
+class CountersRegistry:
+    """
+    Набор именованных счётчиков, сгруппированных по ключу (например, по маршруту или gRPC-методу).
+
+    Используется для метрик, которые не укладываются в стандартную статистику Locust
+    (попадания в кэш, повторные попытки, хеджированные запросы и т.д.).
+    В распределённом режиме воркеры отправляют накопленные значения мастеру,
+    а мастер объединяет их и сохраняет итог рядом с CSV-отчётами Locust.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: Имя набора счётчиков. Используется в логах и в имени файла с результатами.
+        """
+        self.name = name
+        self.counters: defaultdict[str, Counter] = defaultdict(Counter)
+
+    def inc(self, key: str, counter: str, value: float = 1) -> None:
+        """
+        Увеличивает значение счётчика.
+
+        :param key: Ключ группы (например, "GET /api/v1/accounts").
+        :param counter: Имя счётчика внутри группы (например, "hits").
+        :param value: Величина приращения.
+        """
+        self.counters[key][counter] += value
+
+    def merge(self, data: dict[str, dict[str, float]]) -> None:
+        """
+        Добавляет к текущим значениям счётчики, полученные от другого процесса.
+
+        :param data: Словарь вида {ключ: {счётчик: значение}}.
+        """
+        for key, counters in data.items():
+            self.counters[key].update(counters)
+
+    def reset(self) -> None:
+        self.counters.clear()
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        return {key: dict(counters) for key, counters in sorted(self.counters.items())}
+
+    def log_summary(self) -> None:
+        """
+        Выводит итоговые значения счётчиков в лог в виде таблицы.
+        """
+        if not self.counters:
+            return
+
+        names = sorted({name for counters in self.counters.values() for name in counters})
+        width = max(len(key) for key in self.counters)
+
+        lines = [f"{'Name':<{width}} " + " ".join(f"{name:>14}" for name in names)]
+        for key, counters in sorted(self.counters.items()):
+            lines.append(f"{key:<{width}} " + " ".join(f"{counters.get(name, 0):>14g}" for name in names))
+
+        logger.info(f"[{self.name}] Summary:\n" + "\n".join(lines))
+
+    def save(self, environment: Environment) -> None:
+        """
+        Сохраняет счётчики в JSON-файл `{csv_prefix}_{name}.json`, если Locust запущен с --csv.
+
+        :param environment: Окружение Locust.
+        """
+        csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+        if not csv_prefix or not self.counters:
+            return
+
+        with open(f"{csv_prefix}_{self.name}.json", "w+", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            logger.debug(f"[{self.name}] Counters saved to file: {csv_prefix}_{self.name}.json")
+
+
+# Все созданные наборы счётчиков процесса, по имени
+_registries: dict[str, CountersRegistry] = {}
+
+
+def get_counters(name: str) -> CountersRegistry:
+    """
+    Возвращает набор счётчиков с указанным именем, создавая его при первом обращении.
+
+    :param name: Имя набора счётчиков (например, "http_cache").
+    :return: Объект CountersRegistry, общий для всего процесса.
+    """
+    if name not in _registries:
+        _registries[name] = CountersRegistry(name)
+
+    return _registries[name]
+
+
+@events.test_start.add_listener
+def on_test_start(environment: Environment, **kwargs):
+    # Каждый запуск теста начинается с нулевых значений
+    for registry in _registries.values():
+        registry.reset()
+
+
+@events.report_to_master.add_listener
+def on_report_to_master(client_id: str, data: dict, **kwargs):
+    # Воркер отправляет приращения с момента прошлого отчёта и обнуляет локальные значения
+    data["counters"] = {name: registry.to_dict() for name, registry in _registries.items()}
+    for registry in _registries.values():
+        registry.reset()
+
+
+@events.worker_report.add_listener
+def on_worker_report(client_id: str, data: dict, **kwargs):
+    for name, counters in data.get("counters", {}).items():
+        get_counters(name).merge(counters)
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    # На воркерах данные уже переданы мастеру — итог подводит мастер (или локальный процесс)
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    for registry in _registries.values():
+        registry.log_summary()
+        registry.save(environment)
@@ -0,0 +1,133 @@
+import json
+import time
+
+import psutil
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner, MasterRunner
+
+from tools.logger import get_logger
+
+logger = get_logger("METRICS_GENERATOR")
+
+
+class GeneratorUsage:
+    """
+    Процессорное время, потраченное генераторами нагрузки за запуск.
+
+    Учитывается всё время процесса (пользователи, клиенты, сериализация, сам Locust): именно оно
+    ограничивает, сколько нагрузки способна создать одна машина. В распределённом режиме
+    воркеры отправляют приращения мастеру, процессорное время самого мастера не учитывается.
+    Память на пользователя — прирост RSS процесса от старта теста до запуска всех пользователей,
+    она считается только в локальном запуске: у мастера нет пользователей.
+    """
+
+    def __init__(self):
+        self.cpu_seconds = 0.0
+        self.last: float | None = None
+        self.started: float | None = None
+        self.wall_seconds = 0.0
+        self.base_rss = 0
+        self.rss = 0
+        self.user_count = 0
+
+    def start(self) -> None:
+        self.cpu_seconds = 0.0
+        self.last = time.process_time()
+        self.started = time.monotonic()
+        self.wall_seconds = 0.0
+        # Память процесса до запуска пользователей (Locust, клиенты, загруженный сидинг)
+        self.base_rss = psutil.Process().memory_info().rss
+        self.rss, self.user_count = 0, 0
+
+    def record_memory(self, user_count: int) -> None:
+        """
+        Запоминает память процесса после запуска всех пользователей.
+
+        :param user_count: Количество запущенных пользователей.
+        """
+        self.rss = psutil.Process().memory_info().rss
+        self.user_count = user_count
+
+    def stop(self) -> None:
+        if self.started is not None:
+            self.wall_seconds = time.monotonic() - self.started
+
+    def collect(self) -> float:
+        """
+        Возвращает процессорное время с прошлого вызова.
+
+        :return: Секунды процессорного времени (0, если учёт не запущен).
+        """
+        if self.last is None:
+            return 0.0
+
+        now = time.process_time()
+        delta, self.last = now - self.last, now
+        return delta
+
+    def get_summary(self, environment: Environment) -> dict:
+        requests = environment.stats.total.num_requests
+        local = not isinstance(environment.runner, MasterRunner)
+        return {
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "requests": requests,
+            "cpu_ms_per_request": round(self.cpu_seconds * 1000 / requests, 4) if requests else None,
+            "wall_seconds": round(self.wall_seconds, 3),
+            # Среднее количество занятых ядер: при значении около 1 в локальном запуске генератор упирается в ядро
+            "cpu_cores": round(self.cpu_seconds / self.wall_seconds, 3) if self.wall_seconds else None,
+            "rss_mb": round(self.rss / 2 ** 20, 1) if local and self.rss else None,
+            "memory_kb_per_user": (
+                round((self.rss - self.base_rss) / 1024 / self.user_count, 1)
+                if local and self.rss and self.user_count else None
+            ),
+        }
+
+
+# Процессорное время генераторов текущего запуска
+usage = GeneratorUsage()
+
+
+@events.test_start.add_listener
+def on_test_start(environment: Environment, **kwargs):
+    usage.start()
+
+
+@events.spawning_complete.add_listener
+def on_spawning_complete(user_count: int, **kwargs):
+    usage.record_memory(user_count)
+
+
+@events.report_to_master.add_listener
+def on_report_to_master(client_id: str, data: dict, **kwargs):
+    data["generator_cpu_seconds"] = usage.collect()
+
+
+@events.worker_report.add_listener
+def on_worker_report(client_id: str, data: dict, **kwargs):
+    usage.cpu_seconds += data.get("generator_cpu_seconds", 0.0)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment: Environment, **kwargs):
+    # Локальный процесс сам является генератором; воркеры передают остаток с последним отчётом
+    if not isinstance(environment.runner, (WorkerRunner, MasterRunner)):
+        usage.cpu_seconds += usage.collect()
+    usage.stop()
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or usage.last is None:
+        return
+
+    summary = usage.get_summary(environment)
+    logger.info(
+        f"Generator CPU: {summary['cpu_seconds']:g}s for {summary['requests']} requests, "
+        f"{summary['cpu_ms_per_request']} ms per request"
+    )
+
+    csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+    if csv_prefix:
+        with open(f"{csv_prefix}_generator.json", "w+", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
@@ -0,0 +1,277 @@
+import csv
+import json
+import math
+import time
+from collections import defaultdict
+
+import locust.stats
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.logger import get_logger
+
+logger = get_logger("METRICS_HISTOGRAMS")
+
+# Точность гистограммы: каждая степень двойки делится на 2^(SUB_BUCKET_BITS - 1) = 128 поддиапазонов,
+# относительная погрешность значения не больше 1/256 (~0.4%)
+SUB_BUCKET_BITS = 8
+
+# Перцентили, которые попадают в итоговый CSV и лог
+PERCENTILES = (0.5, 0.9, 0.95, 0.99, 0.999, 0.9999)
+
+# Имя записи с объединённой гистограммой всех запросов (как Aggregated в статистике Locust)
+AGGREGATED_NAME = "Aggregated"
+
+
+class LatencyHistogram:
+    """
+    Лог-линейная гистограмма задержек в стиле HdrHistogram.
+
+    Значения хранятся в микросекундах: до 2^SUB_BUCKET_BITS мкс — точно, дальше каждая степень двойки
+    делится на 2^(SUB_BUCKET_BITS - 1) равных поддиапазонов. Погрешность относительная и не зависит
+    от величины задержки, в отличие от статистики Locust, которая округляет время ответа
+    до двух значащих цифр и не позволяет надёжно посчитать p99.9 и p99.99.
+
+    Счётчики хранятся разреженно и складываются поэлементно, поэтому гистограммы воркеров
+    и интервалов объединяются без потери точности.
+    """
+
+    def __init__(self, counts: dict[int, int] | None = None, max_value: int = 0):
+        """
+        :param counts: Количество значений по индексам поддиапазонов.
+        :param max_value: Максимальное записанное значение в микросекундах.
+        """
+        self.counts: defaultdict[int, int] = defaultdict(int, counts or {})
+        self.max_value = max_value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    @staticmethod
+    def get_index(value: int) -> int:
+        if value < 1 << SUB_BUCKET_BITS:
+            return value
+
+        exponent = value.bit_length() - SUB_BUCKET_BITS
+        half = 1 << (SUB_BUCKET_BITS - 1)
+        return (1 << SUB_BUCKET_BITS) + (exponent - 1) * half + (value >> exponent) - half
+
+    @staticmethod
+    def get_value(index: int) -> float:
+        """
+        Возвращает середину поддиапазона по его индексу.
+
+        :param index: Индекс поддиапазона.
+        :return: Значение в микросекундах.
+        """
+        if index < 1 << SUB_BUCKET_BITS:
+            return index
+
+        half = 1 << (SUB_BUCKET_BITS - 1)
+        exponent, offset = divmod(index - (1 << SUB_BUCKET_BITS), half)
+        exponent += 1
+        return ((offset + half) << exponent) + (1 << exponent) / 2
+
+    def record(self, response_time: float) -> None:
+        """
+        :param response_time: Задержка в миллисекундах.
+        """
+        value = max(int(round(response_time * 1000)), 0)
+        self.counts[self.get_index(value)] += 1
+        self.max_value = max(self.max_value, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] += count
+        self.max_value = max(self.max_value, other.max_value)
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Возвращает значение перцентиля.
+
+        :param percentile: Перцентиль в долях (0.999 — p99.9).
+        :return: Значение в миллисекундах (0 для пустой гистограммы).
+        """
+        total = self.count
+        if not total:
+            return 0.0
+
+        rank, cumulative = max(math.ceil(percentile * total), 1), 0
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            if cumulative >= rank:
+                return min(self.get_value(index), self.max_value) / 1000
+
+        return self.max_value / 1000
+
+    def to_dict(self) -> dict:
+        return {"max": self.max_value, "counts": sorted(self.counts.items())}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        return cls(counts={int(index): count for index, count in data["counts"]}, max_value=data["max"])
+
+
+class HistogramsRegistry:
+    """
+    Гистограммы задержек по записям статистики (тип запроса + имя) — за весь запуск
+    и по интервалам длиной HISTORY_STATS_INTERVAL_SEC (как в CSV с историей Locust).
+
+    В распределённом режиме воркеры отправляют мастеру гистограммы, накопленные с прошлого отчёта,
+    а мастер объединяет их и сохраняет итог рядом с CSV-отчётами Locust.
+    """
+
+    def __init__(self):
+        self.total: dict[tuple[str, str], LatencyHistogram] = {}
+        self.intervals: dict[int, dict[tuple[str, str], LatencyHistogram]] = {}
+
+    def get(self, request_type: str, name: str, interval: int | None = None) -> LatencyHistogram:
+        histograms = self.total if interval is None else self.intervals.setdefault(interval, {})
+        if (request_type, name) not in histograms:
+            histograms[(request_type, name)] = LatencyHistogram()
+
+        return histograms[(request_type, name)]
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        """
+        Записывает задержку в общую и интервальную гистограммы.
+
+        :param request_type: Тип запроса (HTTP, gRPC, Transaction и т.д.).
+        :param name: Имя запроса в статистике Locust.
+        :param response_time: Задержка в миллисекундах.
+        """
+        interval_sec = locust.stats.HISTORY_STATS_INTERVAL_SEC
+        interval = int(time.time() // interval_sec * interval_sec)
+        self.get(request_type, name).record(response_time)
+        self.get(request_type, name, interval).record(response_time)
+
+    def reset(self) -> None:
+        self.total.clear()
+        self.intervals.clear()
+
+    @staticmethod
+    def dump_entries(histograms: dict[tuple[str, str], LatencyHistogram]) -> list[dict]:
+        return [
+            {"type": request_type, "name": name, **histogram.to_dict()}
+            for (request_type, name), histogram in sorted(histograms.items())
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": "us",
+            "sub_bucket_bits": SUB_BUCKET_BITS,
+            "interval": locust.stats.HISTORY_STATS_INTERVAL_SEC,
+            "total": self.dump_entries(self.total),
+            "intervals": [
+                {"start": start, "entries": self.dump_entries(histograms)}
+                for start, histograms in sorted(self.intervals.items())
+            ],
+        }
+
+    def merge(self, data: dict) -> None:
+        """
+        Добавляет гистограммы, полученные от другого процесса (в формате to_dict).
+
+        :param data: Сериализованные гистограммы.
+        """
+        for entry in data["total"]:
+            self.get(entry["type"], entry["name"]).merge(LatencyHistogram.from_dict(entry))
+
+        for interval in data["intervals"]:
+            for entry in interval["entries"]:
+                self.get(entry["type"], entry["name"], interval["start"]).merge(LatencyHistogram.from_dict(entry))
+
+    def log_summary(self) -> None:
+        if not self.total:
+            return
+
+        labels = {key: f"{key[0]} {key[1]}".strip() for key in self.total}
+        width = max(len(label) for label in labels.values())
+        lines = [f"{'Name':<{width}} {'Count':>10} " + " ".join(f"{f'p{p * 100:g}':>10}" for p in PERCENTILES)]
+        for key, histogram in sorted(self.total.items()):
+            lines.append(
+                f"{labels[key]:<{width}} {histogram.count:>10} "
+                + " ".join(f"{histogram.get_percentile(p):>10.2f}" for p in PERCENTILES)
+            )
+
+        logger.info("Latency percentiles, ms:\n" + "\n".join(lines))
+
+    def save(self, environment: Environment) -> None:
+        """
+        Сохраняет гистограммы в `{csv_prefix}_histograms.json`, а перцентили по записям —
+        в `{csv_prefix}_percentiles.csv`, если Locust запущен с --csv.
+
+        :param environment: Окружение Locust.
+        """
+        csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+        if not csv_prefix or not self.total:
+            return
+
+        with open(f"{csv_prefix}_histograms.json", "w+", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+
+        with open(f"{csv_prefix}_percentiles.csv", "w+", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Type", "Name", "Request Count", *(f"{p * 100:g}%" for p in PERCENTILES), "Max"])
+            for (request_type, name), histogram in sorted(self.total.items()):
+                writer.writerow([
+                    request_type,
+                    name,
+                    histogram.count,
+                    *(f"{histogram.get_percentile(p):.3f}" for p in PERCENTILES),
+                    f"{histogram.max_value / 1000:.3f}",
+                ])
+
+        logger.debug(f"Histograms saved to files: {csv_prefix}_histograms.json, {csv_prefix}_percentiles.csv")
+
+
+# Гистограммы процесса
+histograms = HistogramsRegistry()
+
+
+def record_latency(request_type: str, name: str, response_time: float) -> None:
+    """
+    Записывает задержку в гистограммы.
+
+    Запросы, прошедшие через events.request, записываются автоматически;
+    функция нужна для метрик, которые пишутся напрямую в environment.stats (итерации и т.д.).
+
+    :param request_type: Тип записи статистики.
+    :param name: Имя записи статистики.
+    :param response_time: Задержка в миллисекундах.
+    """
+    histograms.record(request_type, name, response_time)
+
+
+@events.request.add_listener
+def on_request(request_type: str, name: str, response_time: float, **kwargs):
+    histograms.record(request_type, name, response_time)
+    histograms.record("", AGGREGATED_NAME, response_time)
+
+
+@events.test_start.add_listener
+def on_test_start(environment: Environment, **kwargs):
+    histograms.reset()
+
+
+@events.report_to_master.add_listener
+def on_report_to_master(client_id: str, data: dict, **kwargs):
+    data["histograms"] = histograms.to_dict()
+    histograms.reset()
+
+
+@events.worker_report.add_listener
+def on_worker_report(client_id: str, data: dict, **kwargs):
+    if "histograms" in data:
+        histograms.merge(data["histograms"])
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    histograms.log_summary()
+    histograms.save(environment)
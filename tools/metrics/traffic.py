@@ -0,0 +1,66 @@
+from httpx import Headers, Request, Response
+
+from tools.metrics.counters import get_counters
+
+# Объём трафика по протоколам: запросы, байты тел/сообщений и заголовков в каждую сторону
+counters = get_counters("traffic")
+
+
+def get_headers_size(headers: Headers) -> int:
+    """
+    Возвращает размер заголовков в байтах так, как они передаются в HTTP/1.1 ("Name: value\\r\\n").
+
+    :param headers: Заголовки httpx.
+    :return: Размер в байтах.
+    """
+    return sum(len(name) + len(value) + 4 for name, value in headers.raw)
+
+
+def get_status_line_size(response: Response) -> int:
+    return len(f"HTTP/1.1 {response.status_code} {response.reason_phrase}\r\n")
+
+
+def record_traffic(
+        protocol: str,
+        sent_bytes: int,
+        received_bytes: int,
+        sent_header_bytes: int = 0,
+        received_header_bytes: int = 0
+) -> None:
+    """
+    Учитывает трафик одного запроса.
+
+    :param protocol: Протокол (тип запроса в статистике Locust: HTTP, gRPC).
+    :param sent_bytes: Размер отправленного тела (сообщений).
+    :param received_bytes: Размер полученного тела (сообщений).
+    :param sent_header_bytes: Размер отправленных заголовков.
+    :param received_header_bytes: Размер полученных заголовков.
+    """
+    counters.inc(protocol, "requests")
+    counters.inc(protocol, "sent_bytes", sent_bytes)
+    counters.inc(protocol, "received_bytes", received_bytes)
+    counters.inc(protocol, "sent_header_bytes", sent_header_bytes)
+    counters.inc(protocol, "received_header_bytes", received_header_bytes)
+
+
+def record_http_traffic(request: Request, response: Response | None) -> None:
+    """
+    Учитывает трафик HTTP-запроса: стартовые строки и заголовки, тело запроса
+    и тело ответа в том виде, в каком оно пришло по сети (до распаковки gzip и т.д.).
+
+    :param request: Отправленный запрос.
+    :param response: Полученный ответ (None, если ответа не было).
+    """
+    request_line = len(f"{request.method} ") + len(request.url.raw_path) + len(" HTTP/1.1\r\n")
+    sent_header_bytes = request_line + get_headers_size(request.headers) + 2
+    if response is None:
+        record_traffic("HTTP", len(request.content), 0, sent_header_bytes)
+        return
+
+    record_traffic(
+        "HTTP",
+        sent_bytes=len(request.content),
+        received_bytes=response.num_bytes_downloaded,
+        sent_header_bytes=sent_header_bytes,
+        received_header_bytes=get_status_line_size(response) + get_headers_size(response.headers) + 2,
+    )
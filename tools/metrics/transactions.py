@@ -0,0 +1,266 @@
+import asyncio
+import functools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from locust import events
+from locust.env import Environment
+from locust.exception import StopUser, InterruptTaskSet, RescheduleTask
+from locust.runners import WorkerRunner
+
+from tools.logger import get_logger
+from tools.metrics.context import get_request_context, set_request_context, reset_request_context
+from tools.metrics.counters import get_counters
+from tools.metrics.histograms import record_latency
+
+logger = get_logger("METRICS_TRANSACTIONS")
+
+# Тип записей статистики Locust со сквозной длительностью транзакций (имя записи — транзакция).
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+TRANSACTION_REQUEST_TYPE = "Transaction"
+
+# Исключения управления ходом теста: остановка пользователя, прерывание или перепланирование задачи.
+# Транзакция, прерванная ими, не является неуспешной и в статистику не попадает
+FLOW_CONTROL_EXCEPTIONS = (StopUser, InterruptTaskSet, RescheduleTask)
+
+# Допуск при построении критического пути: соседние последовательные вызовы
+# могут немного «перекрываться» из-за накладных расходов хуков
+CRITICAL_PATH_TOLERANCE = 0.005
+
+# Итоги по транзакциям (длительность, критический путь, простои) и по шагам внутри транзакций
+transactions_counters = get_counters("transactions")
+steps_counters = get_counters("transaction_steps")
+
+
+class TransactionError(Exception):
+    """
+    Ошибка транзакции: один из вызовов внутри неё завершился неуспешно.
+    """
+
+
+@dataclass
+class TransactionStep:
+    """
+    Один вызов (HTTP-запрос или gRPC-метод) внутри транзакции.
+    """
+    name: str
+    start: float
+    end: float
+    failed: bool
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def build_critical_path(steps: list[TransactionStep], end: float) -> list[TransactionStep]:
+    """
+    Строит критический путь транзакции — цепочку вызовов, определивших её длительность.
+
+    Идём от конца транзакции назад: берём вызов, завершившийся последним,
+    затем вызов, завершившийся последним до его начала, и так далее.
+    Параллельные вызовы, завершившиеся раньше «самого медленного», в путь не попадают.
+
+    :param steps: Вызовы транзакции.
+    :param end: Момент окончания транзакции.
+    :return: Вызовы критического пути в хронологическом порядке.
+    """
+    path: list[TransactionStep] = []
+    cursor = end
+    candidates = sorted(steps, key=lambda step: step.end, reverse=True)
+
+    for step in candidates:
+        if step.end <= cursor + CRITICAL_PATH_TOLERANCE:
+            path.append(step)
+            cursor = step.start
+
+    return list(reversed(path))
+
+
+def get_busy_time(steps: list[TransactionStep]) -> float:
+    """
+    Считает время, когда был активен хотя бы один вызов (объединение интервалов).
+
+    :param steps: Вызовы транзакции.
+    :return: Суммарная длительность в секундах.
+    """
+    busy, cursor = 0.0, float("-inf")
+    for step in sorted(steps, key=lambda step: step.start):
+        start = max(step.start, cursor)
+        if step.end > start:
+            busy += step.end - start
+            cursor = step.end
+
+    return busy
+
+
+class Transaction:
+    """
+    Бизнес-транзакция: группа вызовов, которая для пользователя выглядит как одно действие
+    (загрузка экрана, онбординг и т.д.).
+
+    Все HTTP-запросы и gRPC-вызовы внутри блока собираются как шаги транзакции.
+    При выходе из блока транзакция попадает в статистику Locust отдельной строкой
+    (тип "Transaction", без учёта в Aggregated) со сквозной длительностью, а критический путь
+    и доля каждого шага накапливаются в счётчиках transactions/transaction_steps.
+    Блок, прерванный остановкой теста или пользователя (GreenletExit, StopUser и т.д.), не учитывается.
+
+    Пример:
+        with Transaction(self.user.environment, "screen load"):
+            self.accounts_gateway_client.get_accounts(...)
+            self.operations_gateway_client.get_operations(...)
+
+    Транзакции могут быть вложенными: вызов засчитывается во все активные транзакции.
+    Поддерживается и асинхронный вариант: async with Transaction(...).
+    """
+
+    def __init__(self, environment: Environment, name: str):
+        """
+        :param environment: Окружение Locust, в которое отправляется результат.
+        :param name: Имя транзакции в статистике.
+        """
+        self.environment = environment
+        self.name = name
+        self.steps: list[TransactionStep] = []
+        self.start_time = 0.0
+        self.token = None
+
+    def add_step(self, name: str, response_time: float, exception: Exception | None) -> None:
+        """
+        Добавляет завершившийся вызов в транзакцию.
+
+        :param name: Имя запроса в статистике Locust.
+        :param response_time: Длительность вызова в миллисекундах.
+        :param exception: Ошибка вызова, если он неуспешен.
+        """
+        end = time.perf_counter()
+        self.steps.append(
+            TransactionStep(name=name, start=end - response_time / 1000, end=end, failed=exception is not None)
+        )
+
+    def __enter__(self) -> "Transaction":
+        transactions = get_request_context().get("transactions", ())
+        self.token = set_request_context(transactions=(*transactions, self))
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        end_time = time.perf_counter()
+        reset_request_context(self.token)
+        if exc_value is not None and (
+                not isinstance(exc_value, Exception) or isinstance(exc_value, FLOW_CONTROL_EXCEPTIONS)
+        ):
+            return
+
+        self.report(end_time, exc_value)
+
+    async def __aenter__(self) -> "Transaction":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.__exit__(exc_type, exc_value, traceback)
+
+    def report(self, end_time: float, error: BaseException | None) -> None:
+        """
+        Отправляет транзакцию в статистику Locust и обновляет счётчики шагов.
+
+        :param end_time: Момент окончания транзакции.
+        :param error: Исключение, прервавшее транзакцию (если было).
+        """
+        duration = end_time - self.start_time
+        failed_steps = [step.name for step in self.steps if step.failed]
+        if error is None and failed_steps:
+            error = TransactionError(f"Failed steps: {', '.join(failed_steps)}")
+
+        critical_path = build_critical_path(self.steps, end_time)
+        critical_path_ids = {id(step) for step in critical_path}
+
+        transactions_counters.inc(self.name, "count")
+        transactions_counters.inc(self.name, "failures", int(error is not None))
+        transactions_counters.inc(self.name, "duration_ms", duration * 1000)
+        transactions_counters.inc(self.name, "critical_path_ms", sum(step.duration for step in critical_path) * 1000)
+        transactions_counters.inc(self.name, "idle_ms", (duration - get_busy_time(self.steps)) * 1000)
+
+        for step in self.steps:
+            key = f"{self.name} | {step.name}"
+            steps_counters.inc(key, "calls")
+            steps_counters.inc(key, "duration_ms", step.duration * 1000)
+            if id(step) in critical_path_ids:
+                steps_counters.inc(key, "critical_path_ms", step.duration * 1000)
+
+        entry = self.environment.stats.get(self.name, TRANSACTION_REQUEST_TYPE)
+        entry.log(duration * 1000, 0)
+        record_latency(TRANSACTION_REQUEST_TYPE, self.name, duration * 1000)
+        if error is not None:
+            entry.log_error(error)
+
+
+def transaction(name: str) -> Callable:
+    """
+    Декоратор задачи TaskSet или AsyncSession, оборачивающий её в Transaction.
+
+    Пример:
+        @task
+        @transaction("onboarding")
+        def onboarding(self): ...
+
+    :param name: Имя транзакции в статистике.
+    :return: Декоратор задачи.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
+                async with Transaction(self.user.environment, name):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            with Transaction(self.user.environment, name):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@events.request.add_listener
+def on_request(request_type: str, name: str, response_time: float, exception: Exception | None, context: dict | None,
+               **kwargs):
+    if not context:
+        return
+
+    for active_transaction in context.get("transactions", ()):
+        active_transaction.add_step(name, response_time, exception)
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or not transactions_counters.counters:
+        return
+
+    lines = []
+    for name, counters in sorted(transactions_counters.counters.items()):
+        count, duration = counters["count"], counters["duration_ms"]
+        if not count or not duration:
+            continue
+
+        lines.append(
+            f"{name}: avg {duration / count:.1f} ms, "
+            f"critical path {counters['critical_path_ms'] / duration:.0%}, "
+            f"idle {counters['idle_ms'] / duration:.0%}"
+        )
+        for key, step in sorted(steps_counters.counters.items()):
+            transaction_name, _, step_name = key.partition(" | ")
+            if transaction_name == name:
+                lines.append(
+                    f"    {step_name}: {step['duration_ms'] / duration:.0%} of time, "
+                    f"{step['critical_path_ms'] / duration:.0%} on critical path, "
+                    f"{step['calls'] / count:g} calls per transaction"
+                )
+
+    logger.info("Transactions breakdown:\n" + "\n".join(lines))
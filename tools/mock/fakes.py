@@ -0,0 +1,195 @@
+import datetime
+import enum
+import random
+import re
+import types
+import typing
+import uuid
+from typing import Any
+
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.message import Message
+from pydantic import BaseModel, HttpUrl
+
+from tools.config.mock import MockMethodConfig
+
+# Категории покупок для сгенерированных операций
+CATEGORIES = ("gas", "taxi", "travel", "parking", "internet", "education", "healthcare", "supermarkets")
+
+CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def to_snake_case(value: str) -> str:
+    """
+    Переводит имя из camelCase/CamelCase в snake_case (accountId → account_id, OperationSchema → operation_schema).
+    """
+    return CAMEL_CASE_PATTERN.sub("_", value).lower()
+
+
+def get_entity(name: str) -> str:
+    """
+    Возвращает сущность по имени сообщения или схемы: Operation, OperationSchema → operation.
+    """
+    return to_snake_case(name).removesuffix("_schema")
+
+
+class MockDataFactory:
+    """
+    Генератор схемно-валидных ответов mock-сервера gateway.
+
+    Ответы строятся по описанию контракта — protobuf-дескриптору для gRPC и pydantic-схеме ответа
+    клиента для HTTP, — поэтому новые поля и методы поддерживаются без доработки mock-сервера.
+    Значения выбираются по имени поля (email, card_number, created_at, ...), идентификаторы берутся
+    из запроса: ответ get_operations содержит операции запрошенного счёта, а карты в ответе — id своего счёта.
+    """
+
+    def __init__(self, generator: random.Random):
+        """
+        :param generator: Генератор случайных чисел (с зерном — для воспроизводимых ответов).
+        """
+        self.generator = generator
+
+    def get_id(self) -> str:
+        return str(uuid.UUID(int=self.generator.getrandbits(128), version=4))
+
+    def get_digits(self, count: int) -> str:
+        return "".join(self.generator.choice("0123456789") for _ in range(count))
+
+    def get_string(self, name: str, context: dict[str, str], config: MockMethodConfig) -> str:
+        """
+        Возвращает значение строкового поля по его имени.
+
+        :param name: Имя поля в snake_case.
+        :param context: Идентификаторы запроса и родительских сущностей ({"account_id": ...}).
+        :param config: Настройки метода.
+        :return: Значение.
+        """
+        if name.endswith("_id"):
+            return context.get(name) or self.get_id()
+        if name == "email":
+            return f"{self.get_id()[:12]}@example.com"
+        if name == "url":
+            return f"http://localhost/documents/{self.get_id()}.pdf"
+        if name == "phone_number":
+            return f"+7{self.get_digits(10)}"
+        if name == "category":
+            return self.generator.choice(CATEGORIES)
+        if name == "card_number":
+            return self.get_digits(16)
+        if name in ("cvv", "pin"):
+            return self.get_digits(3 if name == "cvv" else 4)
+        if name == "document":
+            return self.generator.randbytes(config.document_size // 2 + 1).hex()[:config.document_size]
+        if name.endswith("_date"):
+            return (datetime.date.today() + datetime.timedelta(days=self.generator.randint(365, 1825))).isoformat()
+        if name.endswith("_at"):
+            return datetime.datetime.now().isoformat()
+
+        return f"{name}-{self.get_id()[:8]}"
+
+    def get_float(self) -> float:
+        return round(self.generator.uniform(1, 10000), 2)
+
+    def build_message(self, descriptor: Descriptor, message: Message, context: dict[str, str],
+                      config: MockMethodConfig) -> Message:
+        """
+        Заполняет protobuf-сообщение случайными данными.
+
+        :param descriptor: Дескриптор сообщения.
+        :param message: Сообщение, которое нужно заполнить.
+        :param context: Идентификаторы запроса и родительских сущностей.
+        :param config: Настройки метода (количество элементов в списках, размер документов).
+        :return: Заполненное сообщение.
+        """
+        entity = get_entity(descriptor.name)
+        if "id" in descriptor.fields_by_name:
+            message.id = context.get(f"{entity}_id") or self.get_id()
+            context = {**context, f"{entity}_id": message.id}
+
+        for field in descriptor.fields:
+            if field.name == "id":
+                continue
+
+            repeated = field.label == FieldDescriptor.LABEL_REPEATED
+            if field.type == FieldDescriptor.TYPE_MESSAGE:
+                if repeated:
+                    for _ in range(config.items):
+                        self.build_message(field.message_type, getattr(message, field.name).add(), context, config)
+                else:
+                    self.build_message(field.message_type, getattr(message, field.name), context, config)
+                continue
+
+            values = [self.get_scalar(field, context, config) for _ in range(config.items if repeated else 1)]
+            if repeated:
+                getattr(message, field.name).extend(values)
+            else:
+                setattr(message, field.name, values[0])
+
+        return message
+
+    def get_scalar(self, field: FieldDescriptor, context: dict[str, str], config: MockMethodConfig) -> Any:
+        match field.type:
+            case FieldDescriptor.TYPE_STRING:
+                return self.get_string(field.name, context, config)
+            case FieldDescriptor.TYPE_BYTES:
+                return self.generator.randbytes(config.document_size)
+            case FieldDescriptor.TYPE_ENUM:
+                return self.generator.choice([value.number for value in field.enum_type.values if value.number])
+            case FieldDescriptor.TYPE_DOUBLE | FieldDescriptor.TYPE_FLOAT:
+                return self.get_float()
+            case FieldDescriptor.TYPE_BOOL:
+                return self.generator.random() < 0.5
+
+        return self.generator.randint(1, 1000)
+
+    def build_model(self, model: type[BaseModel], context: dict[str, str], config: MockMethodConfig) -> dict:
+        """
+        Строит JSON-ответ по pydantic-схеме (ключи — алиасы полей, как в ответах gateway).
+
+        :param model: Схема ответа.
+        :param context: Идентификаторы запроса и родительских сущностей.
+        :param config: Настройки метода.
+        :return: Словарь, который проходит валидацию схемой.
+        """
+        entity = get_entity(model.__name__)
+        result = {}
+        if "id" in model.model_fields:
+            result["id"] = context.get(f"{entity}_id") or self.get_id()
+            context = {**context, f"{entity}_id": result["id"]}
+
+        for name, field in model.model_fields.items():
+            if name != "id":
+                result[field.alias or name] = self.get_value(field.annotation, name, context, config)
+
+        return result
+
+    def get_value(self, annotation: Any, name: str, context: dict[str, str], config: MockMethodConfig) -> Any:
+        origin = typing.get_origin(annotation)
+        if origin is typing.Annotated:
+            return self.get_value(typing.get_args(annotation)[0], name, context, config)
+        if origin in (typing.Union, types.UnionType):
+            argument = next(item for item in typing.get_args(annotation) if item is not type(None))
+            return self.get_value(argument, name, context, config)
+        if origin is list:
+            argument = typing.get_args(annotation)[0]
+            return [self.get_value(argument, name, context, config) for _ in range(config.items)]
+
+        if isinstance(annotation, type):
+            if issubclass(annotation, BaseModel):
+                return self.build_model(annotation, context, config)
+            if issubclass(annotation, enum.Enum):
+                return self.generator.choice(list(annotation)).value
+            if issubclass(annotation, bool):
+                return self.generator.random() < 0.5
+            if issubclass(annotation, int):
+                return self.generator.randint(1, 1000)
+            if issubclass(annotation, float):
+                return self.get_float()
+            if issubclass(annotation, HttpUrl):
+                return self.get_string("url", context, config)
+            if issubclass(annotation, datetime.datetime):
+                return self.get_string("created_at", context, config)
+            if issubclass(annotation, datetime.date):
+                return self.get_string("expiry_date", context, config)
+
+        return self.get_string(name, context, config)
@@ -0,0 +1,83 @@
+import socket
+import subprocess
+import sys
+import time
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("MOCK_GATEWAY")
+
+# Время ожидания запуска mock-сервера в секундах
+STARTUP_TIMEOUT = 30
+
+# Процесс mock-сервера, запущенный для прогона (--mock-gateway)
+_process: subprocess.Popen | None = None
+
+
+def wait_for_port(host: str, port: int, timeout: float) -> bool:
+    """
+    Ждёт, пока порт начнёт принимать соединения.
+
+    :param host: Адрес.
+    :param port: Порт.
+    :param timeout: Время ожидания в секундах.
+    :return: True, если порт доступен.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+
+    return False
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--mock-gateway",
+        action="store_true",
+        default=False,
+        env_var="LOCUST_MOCK_GATEWAY",
+        help="Запустить локальный mock gateway (MOCK_GATEWAY.*) на время прогона",
+    )
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    """
+    Запускает mock gateway до сидинга сценария.
+
+    Mock работает в отдельном процессе, а не в процессе Locust: gRPC-сервер под gevent блокирует
+    цикл событий генератора, а обработка запросов mock отнимала бы у генератора его ядро.
+    """
+    global _process
+    if isinstance(environment.runner, WorkerRunner) or not getattr(environment.parsed_options, "mock_gateway", False):
+        return
+
+    config = settings.mock_gateway
+    _process = subprocess.Popen([sys.executable, "-m", "tools.mock.server"])
+    for port in (config.http_port, config.grpc_port):
+        if not wait_for_port(config.host, port, STARTUP_TIMEOUT):
+            _process.terminate()
+            raise RuntimeError(f"Mock gateway did not start on {config.host}:{port} in {STARTUP_TIMEOUT}s")
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if _process is None:
+        return
+
+    _process.terminate()
+    try:
+        _process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        _process.kill()
+    logger.info("Mock gateway stopped")
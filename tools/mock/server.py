@@ -0,0 +1,303 @@
+# Mock использует настройки проекта, а config импортирует Locust, который патчит стандартную библиотеку gevent'ом.
+# Патч применяется до импорта http.server: иначе его цикл обработки останется блокирующим и остановит весь процесс
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import typing
+from concurrent import futures
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import grpc
+# Импортируем поддержку работы gRPC с потоками (greenlets)
+import grpc.experimental.gevent as grpc_gevent
+from google.protobuf.descriptor import ServiceDescriptor
+from google.protobuf.message_factory import GetMessageClass
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from config import settings
+from contracts.services.gateway.accounts import accounts_gateway_service_pb2, accounts_gateway_service_pb2_grpc
+from contracts.services.gateway.cards import cards_gateway_service_pb2, cards_gateway_service_pb2_grpc
+from contracts.services.gateway.documents import documents_gateway_service_pb2, documents_gateway_service_pb2_grpc
+from contracts.services.gateway.operations import operations_gateway_service_pb2, operations_gateway_service_pb2_grpc
+from contracts.services.gateway.users import users_gateway_service_pb2, users_gateway_service_pb2_grpc
+from tools.config.mock import MockGatewayConfig, MockMethodConfig
+from tools.logger import get_logger
+from tools.mock.fakes import MockDataFactory, to_snake_case
+from tools.replay.actions import GRPC_ACTIONS, PATH_PARAMETER_PATTERN, REPLAY_ACTIONS, ReplayAction
+
+# Без поддержки gevent gRPC-сервер блокирует процесс при запуске
+grpc_gevent.init_gevent()
+
+logger = get_logger("MOCK_GATEWAY")
+
+# HTTP-клиенты gateway по атрибуту GatewayTaskSet (ReplayAction.client): схемы ответов берутся из их методов
+HTTP_CLIENTS = {
+    "users_gateway_client": UsersGatewayHTTPClient,
+    "accounts_gateway_client": AccountsGatewayHTTPClient,
+    "cards_gateway_client": CardsGatewayHTTPClient,
+    "documents_gateway_client": DocumentsGatewayHTTPClient,
+    "operations_gateway_client": OperationsGatewayHTTPClient,
+}
+
+# gRPC-сервисы gateway: базовый класс сервиса, функция регистрации и дескриптор
+GRPC_SERVICES = (
+    (
+        users_gateway_service_pb2_grpc.UsersGatewayServiceServicer,
+        users_gateway_service_pb2_grpc.add_UsersGatewayServiceServicer_to_server,
+        users_gateway_service_pb2.DESCRIPTOR.services_by_name["UsersGatewayService"],
+    ),
+    (
+        accounts_gateway_service_pb2_grpc.AccountsGatewayServiceServicer,
+        accounts_gateway_service_pb2_grpc.add_AccountsGatewayServiceServicer_to_server,
+        accounts_gateway_service_pb2.DESCRIPTOR.services_by_name["AccountsGatewayService"],
+    ),
+    (
+        cards_gateway_service_pb2_grpc.CardsGatewayServiceServicer,
+        cards_gateway_service_pb2_grpc.add_CardsGatewayServiceServicer_to_server,
+        cards_gateway_service_pb2.DESCRIPTOR.services_by_name["CardsGatewayService"],
+    ),
+    (
+        documents_gateway_service_pb2_grpc.DocumentsGatewayServiceServicer,
+        documents_gateway_service_pb2_grpc.add_DocumentsGatewayServiceServicer_to_server,
+        documents_gateway_service_pb2.DESCRIPTOR.services_by_name["DocumentsGatewayService"],
+    ),
+    (
+        operations_gateway_service_pb2_grpc.OperationsGatewayServiceServicer,
+        operations_gateway_service_pb2_grpc.add_OperationsGatewayServiceServicer_to_server,
+        operations_gateway_service_pb2.DESCRIPTOR.services_by_name["OperationsGatewayService"],
+    ),
+)
+
+# Статусы gRPC, соответствующие HTTP-статусам ошибок (MockMethodConfig.error_status)
+GRPC_STATUSES = {
+    400: grpc.StatusCode.INVALID_ARGUMENT,
+    404: grpc.StatusCode.NOT_FOUND,
+    429: grpc.StatusCode.RESOURCE_EXHAUSTED,
+    500: grpc.StatusCode.INTERNAL,
+    503: grpc.StatusCode.UNAVAILABLE,
+    504: grpc.StatusCode.DEADLINE_EXCEEDED,
+}
+
+
+def get_response_schema(action: ReplayAction) -> type[BaseModel]:
+    """
+    Возвращает схему ответа метода HTTP-клиента (по аннотации возвращаемого значения).
+
+    :param action: Действие (метод клиента gateway).
+    :return: Pydantic-схема ответа.
+    """
+    method = getattr(HTTP_CLIENTS[action.client], action.name)
+    return typing.get_type_hints(method)["return"]
+
+
+class MockGateway:
+    """
+    Локальный mock gateway: все пять сервисов по HTTP (маршруты /api/v1/*) и по gRPC.
+
+    Ответы строятся по контрактам (см. MockDataFactory) и проходят валидацию клиентов; задержка,
+    доля ошибок и размер ответа задаются по методам в MOCK_GATEWAY.*. Mock нужен, чтобы отлаживать
+    сценарии и инструменты без стенда и измерять потолок самого генератора нагрузки: при нулевой задержке
+    mock все задержки в отчёте — стоимость клиента, Locust и сети.
+    """
+
+    def __init__(self, config: MockGatewayConfig):
+        """
+        :param config: Настройки mock-сервера.
+        """
+        self.config = config
+        self.generator = random.Random(config.seed)
+        self.factory = MockDataFactory(self.generator)
+        self.http_server: ThreadingHTTPServer | None = None
+        self.grpc_server: grpc.Server | None = None
+
+        # HTTP-маршруты: (метод, шаблон пути, действие, схема ответа). Маршруты без параметров проверяются первыми,
+        # чтобы /operations/operations-summary не совпал с /operations/{operation_id}
+        self.routes = [
+            (
+                action.method,
+                re.compile(PATH_PARAMETER_PATTERN.sub(r"(?P<\1>[^/]+)", action.route)),
+                action,
+                get_response_schema(action),
+            )
+            for action in sorted(REPLAY_ACTIONS, key=lambda item: item.route.count("{"))
+        ]
+
+    def handle(self, name: str) -> tuple[MockMethodConfig, bool]:
+        """
+        Выдерживает задержку метода и решает, завершится ли запрос ошибкой.
+
+        :param name: Метод клиента gateway (например, "get_operations").
+        :return: Настройки метода и признак ошибки.
+        """
+        config = self.config.get_method(name)
+        delay = config.latency.sample(self.generator)
+        if delay > 0:
+            time.sleep(delay)
+
+        return config, self.generator.random() < config.error_rate
+
+    def handle_http(self, method: str, target: str, body: bytes) -> tuple[int, bytes]:
+        """
+        Обрабатывает HTTP-запрос.
+
+        Идентификаторы из пути, query-параметров и тела (accountId → account_id) попадают в ответ.
+
+        :param method: HTTP-метод.
+        :param target: Путь запроса с query-параметрами.
+        :param body: Тело запроса.
+        :return: Статус и JSON-тело ответа.
+        """
+        url = urlsplit(target)
+        for route_method, pattern, action, schema in self.routes:
+            match = pattern.fullmatch(url.path)
+            if route_method != method or match is None:
+                continue
+
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                payload = {}
+
+            context = {to_snake_case(key): value for key, value in parse_qsl(url.query)}
+            if isinstance(payload, dict):
+                context.update((to_snake_case(key), value) for key, value in payload.items() if isinstance(value, str))
+            context.update(match.groupdict())
+
+            config, failed = self.handle(action.name)
+            if failed:
+                detail = {"detail": f"Mock error for {action.name}"}
+                return config.error_status, json.dumps(detail).encode()
+
+            return HTTPStatus.OK, json.dumps(self.factory.build_model(schema, context, config)).encode()
+
+        return HTTPStatus.NOT_FOUND, json.dumps({"detail": "Not Found"}).encode()
+
+    def build_servicer(self, base: type, descriptor: ServiceDescriptor) -> object:
+        """
+        Создаёт реализацию gRPC-сервиса: наследника *GatewayServiceServicer с методами по дескриптору сервиса.
+
+        :param base: Базовый класс сервиса из *_pb2_grpc.
+        :param descriptor: Дескриптор сервиса.
+        :return: Экземпляр сервиса.
+        """
+        mock = self
+
+        def build_method(method_name: str, response_class: type) -> Any:
+            action = GRPC_ACTIONS[method_name]
+            response_descriptor = response_class.DESCRIPTOR
+
+            def call(_, request, context: grpc.ServicerContext):
+                config, failed = mock.handle(action.name)
+                if failed:
+                    status = GRPC_STATUSES.get(config.error_status, grpc.StatusCode.UNAVAILABLE)
+                    context.abort(status, f"Mock error for {action.name}")
+
+                ids = {field.name: value for field, value in request.ListFields() if isinstance(value, str)}
+                return mock.factory.build_message(response_descriptor, response_class(), ids, config)
+
+            return call
+
+        methods = {
+            method.name: build_method(method.name, GetMessageClass(method.output_type))
+            for method in descriptor.methods
+        }
+        return type(f"Mock{base.__name__}", (base,), methods)()
+
+    def start(self) -> None:
+        """
+        Запускает HTTP- и gRPC-серверы в фоновых потоках.
+        """
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive соединения, как у gateway: клиенты переиспользуют их между запросами
+            protocol_version = "HTTP/1.1"
+            # Заголовки и тело пишутся отдельно: с алгоритмом Нейгла каждый ответ ждал бы отложенного ACK клиента
+            disable_nagle_algorithm = True
+
+            def respond(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, data = mock.handle_http(self.command, self.path, body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = respond
+            do_POST = respond
+
+            def handle(self):
+                try:
+                    super().handle()
+                except ConnectionError:
+                    # Генератор закрывает keep-alive соединения в конце прогона
+                    pass
+
+            def log_message(self, format, *args):
+                # Журнал каждого запроса замедляет mock под нагрузкой
+                pass
+
+        self.http_server = ThreadingHTTPServer((self.config.host, self.config.http_port), Handler)
+        self.http_server.daemon_threads = True
+        threading.Thread(target=self.http_server.serve_forever, daemon=True).start()
+
+        self.grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=self.config.grpc_workers))
+        for base, add_servicer, descriptor in GRPC_SERVICES:
+            add_servicer(self.build_servicer(base, descriptor), self.grpc_server)
+        self.grpc_server.add_insecure_port(f"{self.config.host}:{self.config.grpc_port}")
+        self.grpc_server.start()
+
+        logger.info(
+            f"Mock gateway started: HTTP on {self.config.host}:{self.config.http_port}, "
+            f"gRPC on {self.config.host}:{self.config.grpc_port}"
+        )
+
+    def stop(self) -> None:
+        if self.http_server is not None:
+            self.http_server.shutdown()
+            self.http_server.server_close()
+        if self.grpc_server is not None:
+            self.grpc_server.stop(grace=None)
+
+        logger.info("Mock gateway stopped")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run a local mock of the gateway HTTP and gRPC APIs")
+    parser.add_argument("--host", default=settings.mock_gateway.host, help="Bind host")
+    parser.add_argument("--http-port", type=int, default=settings.mock_gateway.http_port, help="HTTP port")
+    parser.add_argument("--grpc-port", type=int, default=settings.mock_gateway.grpc_port, help="gRPC port")
+    parser.add_argument("--seed", type=int, default=settings.mock_gateway.seed, help="Random seed")
+    arguments = parser.parse_args()
+
+    gateway = MockGateway(
+        settings.mock_gateway.model_copy(
+            update={
+                "host": arguments.host,
+                "http_port": arguments.http_port,
+                "grpc_port": arguments.grpc_port,
+                "seed": arguments.seed,
+            }
+        )
+    )
+    gateway.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        gateway.stop()
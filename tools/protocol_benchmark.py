@@ -0,0 +1,230 @@
+import argparse
+import csv
+import html
+import json
+import os
+import time
+from dataclasses import dataclass, asdict, fields
+
+from clients.gateway.locust import PROTOCOLS
+from tools.charts import ChartSeries, render_line_chart
+from tools.logger import get_logger
+from tools.sweep import read_aggregated, run_locust
+
+logger = get_logger("PROTOCOL_BENCHMARK")
+
+# Тип записей статистики Locust по протоколу сценария
+REQUEST_TYPES = {"http": "HTTP", "grpc": "gRPC"}
+
+
+@dataclass
+class ProtocolResult:
+    """
+    Итоги запуска сценария по одному протоколу — строка сравнительной таблицы.
+    """
+    protocol: str
+    requests: int
+    failures: int
+    rps: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    p999: float
+    p9999: float
+    sent_bytes_per_request: float
+    received_bytes_per_request: float
+    header_bytes_per_request: float
+    cpu_ms_per_request: float
+    exit_code: int
+
+
+def read_json(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def collect_result(protocol: str, prefix: str, exit_code: int) -> ProtocolResult:
+    """
+    Собирает итоги запуска из отчётов Locust и дополнительных метрик
+    ({csv}_percentiles.csv, {csv}_traffic.json, {csv}_generator.json).
+
+    :param protocol: Протокол (http или grpc).
+    :param prefix: Префикс CSV-отчётов запуска.
+    :param exit_code: Код завершения Locust.
+    :return: Строка сравнительной таблицы.
+    """
+    stats = read_aggregated(f"{prefix}_stats.csv") or {}
+    percentiles = read_aggregated(f"{prefix}_percentiles.csv") or stats
+    traffic = read_json(f"{prefix}_traffic.json").get(REQUEST_TYPES[protocol], {})
+    generator = read_json(f"{prefix}_generator.json")
+    calls = traffic.get("requests") or 1
+
+    return ProtocolResult(
+        protocol=protocol,
+        requests=int(stats.get("Request Count", 0)),
+        failures=int(stats.get("Failure Count", 0)),
+        rps=float(stats.get("Requests/s", 0)),
+        p50=float(percentiles.get("50%", 0)),
+        p90=float(percentiles.get("90%", 0)),
+        p95=float(percentiles.get("95%", 0)),
+        p99=float(percentiles.get("99%", 0)),
+        p999=float(percentiles.get("99.9%", 0)),
+        p9999=float(percentiles.get("99.99%", 0)),
+        sent_bytes_per_request=traffic.get("sent_bytes", 0) / calls,
+        received_bytes_per_request=traffic.get("received_bytes", 0) / calls,
+        header_bytes_per_request=(
+                traffic.get("sent_header_bytes", 0) + traffic.get("received_header_bytes", 0)
+        ) / calls,
+        cpu_ms_per_request=generator.get("cpu_ms_per_request") or 0.0,
+        exit_code=exit_code,
+    )
+
+
+def read_history(prefix: str) -> list[dict]:
+    path = f"{prefix}_stats_history.csv"
+    if not os.path.exists(path):
+        return []
+
+    with open(path, encoding="utf-8") as file:
+        return [row for row in csv.DictReader(file) if row["Name"] == "Aggregated"]
+
+
+def render_report(results: list[ProtocolResult], histories: dict[str, list[dict]]) -> str:
+    """
+    Формирует HTML-отчёт сравнения протоколов: таблица итогов и графики RPS и p95 по времени.
+
+    :param results: Итоги запусков по протоколам.
+    :param histories: Строки Aggregated из {csv}_stats_history.csv по протоколам.
+    :return: HTML-страница.
+    """
+    charts = []
+    for title, column in (("Throughput (RPS)", "Requests/s"), ("p95 latency (ms)", "95%")):
+        series = []
+        for protocol, rows in histories.items():
+            start = int(rows[0]["Timestamp"]) if rows else 0
+            points = [
+                (int(row["Timestamp"]) - start, float(row[column]))
+                for row in rows if row[column] not in ("", "N/A")
+            ]
+            series.append(ChartSeries(name=protocol, points=points, markers=False))
+
+        if any(item.points for item in series):
+            charts.append(f"<h3>{title}</h3>\n" + render_line_chart(series, x_label="Time (s)", y_label=title))
+
+    columns = [field.name for field in fields(ProtocolResult) if field.name != "protocol"]
+    header = "".join(f"<th>{html.escape(result.protocol)}</th>" for result in results)
+    rows = "\n".join(
+        f"<tr><td>{column}</td>" + "".join(f"<td>{getattr(result, column):.6g}</td>" for result in results) + "</tr>"
+        for column in columns
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Protocol comparison</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 4px 12px; text-align: right; }}</style>
+</head>
+<body>
+<h2>HTTP vs gRPC on an identical workload</h2>
+<table>
+<tr><th>Metric</th>{header}</tr>
+{rows}
+</table>
+<p>Latency in ms. HTTP bytes include request/status lines and headers (reported separately), gRPC bytes
+are serialized messages only: metadata is HPACK-compressed inside grpcio and not visible to the client.
+CPU is the whole generator process time divided by the number of requests.</p>
+{"".join(charts)}
+</body>
+</html>
+"""
+
+
+def run_benchmark(
+        config: str,
+        protocols: list[str],
+        output: str,
+        cool_down: float,
+        seed: int,
+        options: list[str],
+        reuse_seeds: bool = False
+) -> list[ProtocolResult]:
+    """
+    Последовательно запускает протоколо-независимый сценарий по каждому протоколу
+    с одинаковыми параметрами нагрузки и зерном и сохраняет сравнительный отчет.
+
+    Сидинг выполняется только в первом запуске, остальные переиспользуют дамп —
+    оба протокола работают с одними и теми же тестовыми пользователями.
+
+    :param config: Путь к v1.0.conf протоколо-независимого сценария.
+    :param protocols: Протоколы в порядке запуска.
+    :param output: Папка для отчётов запусков, comparison.csv и comparison.html.
+    :param cool_down: Пауза между запусками в секундах.
+    :param seed: Зерно генераторов случайных чисел пользователей (--scenario-seed).
+    :param options: Дополнительные аргументы Locust (--users, --run-time и т.д.).
+    :param reuse_seeds: Переиспользовать существующий дамп сидинга уже в первом запуске.
+    :return: Итоги по протоколам.
+    """
+    os.makedirs(output, exist_ok=True)
+
+    results, histories = [], {}
+    for index, protocol in enumerate(protocols):
+        if index:
+            logger.info(f"Cooling down for {cool_down:g}s")
+            time.sleep(cool_down)
+
+        prefix = os.path.join(output, protocol)
+        exit_code = run_locust(
+            config,
+            prefix,
+            [f"--protocol={protocol}", f"--scenario-seed={seed}", *options],
+            reuse_seeds=reuse_seeds or index > 0
+        )
+        result = collect_result(protocol, prefix, exit_code)
+        logger.info(
+            f"{protocol}: {result.rps:.1f} RPS, p99 {result.p99:g} ms, "
+            f"{result.sent_bytes_per_request + result.received_bytes_per_request:.0f} body bytes "
+            f"and {result.cpu_ms_per_request:g} ms CPU per request"
+        )
+        results.append(result)
+        histories[protocol] = read_history(prefix)
+
+    with open(os.path.join(output, "comparison.csv"), "w+", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=[field.name for field in fields(ProtocolResult)])
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+    with open(os.path.join(output, "comparison.html"), "w+", encoding="utf-8") as file:
+        file.write(render_report(results, histories))
+
+    logger.info(f"Protocol comparison saved to directory: {output} (comparison.csv, comparison.html)")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run a protocol-agnostic scenario over HTTP and gRPC and compare")
+    parser.add_argument("--config", required=True, help="v1.0.conf of a scenario from scenarios/protocols")
+    parser.add_argument("--protocols", nargs="+", choices=PROTOCOLS, default=list(PROTOCOLS), help="Protocols")
+    parser.add_argument("--users", type=int, help="User count (default: from the config)")
+    parser.add_argument("--spawn-rate", type=float, help="Spawn rate (default: from the config)")
+    parser.add_argument("--run-time", help="Run time of each protocol (default: from the config)")
+    parser.add_argument("--seed", type=int, default=0, help="Scenario seed shared by all protocols")
+    parser.add_argument("--cool-down", type=float, default=30, help="Pause between runs in seconds")
+    parser.add_argument("--output", default="./reports/protocols", help="Output directory")
+    parser.add_argument("--reuse-seeds", action="store_true", help="Reuse existing seeds dump in the first run too")
+    arguments = parser.parse_args()
+
+    run_benchmark(
+        config=arguments.config,
+        protocols=arguments.protocols,
+        output=arguments.output,
+        cool_down=arguments.cool_down,
+        seed=arguments.seed,
+        options=[
+            *([f"--users={arguments.users}"] if arguments.users is not None else []),
+            *([f"--spawn-rate={arguments.spawn_rate:g}"] if arguments.spawn_rate is not None else []),
+            *([f"--run-time={arguments.run_time}"] if arguments.run_time is not None else []),
+        ],
+        reuse_seeds=arguments.reuse_seeds
+    )
@@ -0,0 +1,120 @@
+import re
+from dataclasses import dataclass
+
+from tools.routes import APIRoutes
+
+
+@dataclass(frozen=True)
+class ReplayAction:
+    """
+    Действие, которым воспроизводится запрос журнала: метод API клиента gateway.
+
+    Методы HTTP и gRPC клиентов совпадают по именам и аргументам (см. GatewayTaskSet),
+    поэтому одно действие воспроизводится по любому протоколу.
+
+    :param method: HTTP-метод.
+    :param route: Логический HTTP-маршрут.
+    :param client: Атрибут GatewayTaskSet с клиентом (например, "operations_gateway_client").
+    :param name: Метод клиента (например, "get_operations").
+    :param args: Идентификаторы, которые передаются в метод аргументами.
+    """
+    method: str
+    route: str
+    client: str
+    name: str
+    args: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.route}"
+
+    @property
+    def grpc_method(self) -> str:
+        """
+        Имя gRPC-метода сервиса (get_operations → GetOperations).
+        """
+        return "".join(part.capitalize() for part in self.name.split("_"))
+
+
+def build_card_operation_action(name: str) -> ReplayAction:
+    route = f"{APIRoutes.OPERATIONS}/{name.replace('_', '-')}"
+    return ReplayAction("POST", route, "operations_gateway_client", name, ("card_id", "account_id"))
+
+
+REPLAY_ACTIONS = (
+    ReplayAction("GET", f"{APIRoutes.USERS}/{{user_id}}", "users_gateway_client", "get_user", ("user_id",)),
+    ReplayAction("POST", APIRoutes.USERS, "users_gateway_client", "create_user"),
+    ReplayAction("GET", APIRoutes.ACCOUNTS, "accounts_gateway_client", "get_accounts", ("user_id",)),
+    *(
+        ReplayAction(
+            "POST", f"{APIRoutes.ACCOUNTS}/{name.replace('_', '-')}", "accounts_gateway_client", name, ("user_id",)
+        )
+        for name in (
+            "open_deposit_account",
+            "open_savings_account",
+            "open_debit_card_account",
+            "open_credit_card_account",
+        )
+    ),
+    *(
+        ReplayAction(
+            "POST", f"{APIRoutes.CARDS}/{name.replace('_', '-')}", "cards_gateway_client", name,
+            ("user_id", "account_id")
+        )
+        for name in ("issue_virtual_card", "issue_physical_card")
+    ),
+    ReplayAction(
+        "GET", f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}", "documents_gateway_client",
+        "get_tariff_document", ("account_id",)
+    ),
+    ReplayAction(
+        "GET", f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}", "documents_gateway_client",
+        "get_contract_document", ("account_id",)
+    ),
+    ReplayAction(
+        "GET", f"{APIRoutes.OPERATIONS}/{{operation_id}}", "operations_gateway_client", "get_operation",
+        ("operation_id",)
+    ),
+    ReplayAction(
+        "GET", f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}", "operations_gateway_client",
+        "get_operation_receipt", ("operation_id",)
+    ),
+    ReplayAction("GET", APIRoutes.OPERATIONS, "operations_gateway_client", "get_operations", ("account_id",)),
+    ReplayAction(
+        "GET", f"{APIRoutes.OPERATIONS}/operations-summary", "operations_gateway_client", "get_operations_summary",
+        ("account_id",)
+    ),
+    *(
+        build_card_operation_action(name)
+        for name in (
+            "make_fee_operation",
+            "make_top_up_operation",
+            "make_cashback_operation",
+            "make_transfer_operation",
+            "make_purchase_operation",
+            "make_bill_payment_operation",
+            "make_cash_withdrawal_operation",
+        )
+    ),
+)
+
+# Действия по ключу "METHOD route" (HTTP) и по имени gRPC-метода
+ACTIONS = {action.key: action for action in REPLAY_ACTIONS}
+GRPC_ACTIONS = {action.grpc_method: action for action in REPLAY_ACTIONS}
+
+PATH_PARAMETER_PATTERN = re.compile(r"\{(\w+)}")
+
+
+def get_path_parameters(route: str, path: str) -> dict[str, str]:
+    """
+    Извлекает значения параметров пути по шаблону маршрута.
+
+    Например, для /api/v1/users/{user_id} и /api/v1/users/42 возвращает {"user_id": "42"}.
+
+    :param route: Шаблон маршрута.
+    :param path: Фактический путь запроса.
+    :return: Параметры пути (пустой словарь, если путь не соответствует шаблону).
+    """
+    pattern = PATH_PARAMETER_PATTERN.sub(r"(?P<\1>[^/]+)", route)
+    match = re.fullmatch(pattern, path)
+    return match.groupdict() if match else {}
@@ -0,0 +1,282 @@
+import time
+import zlib
+from typing import Any, Iterator, Sequence
+
+import gevent
+from gevent.pool import Pool
+from locust import events
+from locust.env import Environment
+from pydantic import ValidationError
+
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+from tools.replay.actions import ACTIONS, ReplayAction
+from tools.replay.schema import ReplayRecord
+
+logger = get_logger("REPLAY")
+
+# Итоги воспроизведения по маршрутам: отправленные, пропущенные и завершившиеся ошибкой записи
+counters = get_counters("replay")
+
+# Тип записей статистики Locust с опозданием отправки относительно расписания журнала (мс).
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+REPLAY_LAG_TYPE = "Replay lag"
+
+# Идентификаторы в порядке приоритета для разбиения журнала между процессами
+PARTITION_KEYS = ("user_id", "account_id", "card_id", "operation_id")
+
+
+def get_accounts(user: SeedUserResult) -> list[SeedAccountResult]:
+    return [
+        *user.deposit_accounts,
+        *user.savings_accounts,
+        *user.debit_card_accounts,
+        *user.credit_card_accounts,
+    ]
+
+
+def get_card_ids(account: SeedAccountResult) -> list[str]:
+    return [card.card_id for card in (*account.physical_cards, *account.virtual_cards)]
+
+
+def get_operation_ids(account: SeedAccountResult) -> list[str]:
+    operations = (
+        *account.top_up_operations,
+        *account.purchase_operations,
+        *account.transfer_operations,
+        *account.cash_withdrawal_operations,
+    )
+    return [operation.operation_id for operation in operations]
+
+
+def pick(items: Sequence[Any], value: str) -> Any | None:
+    """
+    Выбирает элемент по хэшу значения: одно и то же значение всегда даёт один и тот же элемент.
+
+    :param items: Элементы для выбора.
+    :param value: Исходное значение (например, идентификатор из журнала).
+    :return: Элемент или None, если выбирать не из чего.
+    """
+    if not items:
+        return None
+
+    return items[zlib.crc32(value.encode()) % len(items)]
+
+
+class SeedsMapper:
+    """
+    Отображение идентификаторов из журнала на сущности сидинга.
+
+    Отображение детерминированное: один и тот же исходный идентификатор всегда переходит
+    в одну и ту же сущность, поэтому «горячие» пользователи и счета журнала остаются горячими.
+    Вложенность сохраняется: счёт выбирается среди счетов выбранного пользователя,
+    карта и операция — среди карт и операций выбранного счёта (если они есть в записи).
+    """
+
+    def __init__(self, seeds: SeedsResult):
+        self.users = seeds.users
+        self.accounts = [account for user in self.users for account in get_accounts(user)]
+        self.card_ids = [card_id for account in self.accounts for card_id in get_card_ids(account)]
+        self.operation_ids = [
+            operation_id for account in self.accounts for operation_id in get_operation_ids(account)
+        ]
+
+    def map_ids(self, ids: dict[str, str]) -> dict[str, str] | None:
+        """
+        :param ids: Идентификаторы записи журнала.
+        :return: Идентификаторы сущностей сидинга или None, если подходящих сущностей нет.
+        """
+        mapped = dict(ids)
+        user = account = None
+        if "user_id" in ids:
+            user = pick(self.users, ids["user_id"])
+            if user is None:
+                return None
+            mapped["user_id"] = user.user_id
+
+        if "account_id" in ids:
+            account = pick(get_accounts(user) if user else self.accounts, ids["account_id"])
+            if account is None:
+                return None
+            mapped["account_id"] = account.account_id
+
+        if "card_id" in ids:
+            mapped["card_id"] = pick(get_card_ids(account) if account else self.card_ids, ids["card_id"])
+        if "operation_id" in ids:
+            operation_ids = get_operation_ids(account) if account else self.operation_ids
+            mapped["operation_id"] = pick(operation_ids, ids["operation_id"])
+
+        if any(value is None for value in mapped.values()):
+            return None
+
+        return mapped
+
+
+def parse_partition(value: str) -> tuple[int, int]:
+    """
+    Разбирает номер части журнала в формате "index/count" (например, "0/4").
+    """
+    index, count = (int(part) for part in value.split("/"))
+    if not 0 <= index < count:
+        raise ValueError(f"Invalid replay partition: {value}")
+
+    return index, count
+
+
+def read_records(path: str, partition: tuple[int, int] = (0, 1)) -> Iterator[ReplayRecord]:
+    """
+    Читает журнал запросов построчно, не загружая файл целиком.
+
+    При разбиении журнала на части записи распределяются по хэшу первого идентификатора
+    (user_id, account_id, ...): все запросы одной сущности попадают в один процесс и сохраняют порядок.
+
+    :param path: Путь к JSONL-журналу.
+    :param partition: Номер части и количество частей.
+    :return: Итератор записей.
+    """
+    index, count = partition
+    with open(path, encoding="utf-8") as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                record = ReplayRecord.model_validate_json(line)
+            except ValidationError as error:
+                logger.warning(f"Skipping invalid record at line {number}: {error.errors()[0]['msg']}")
+                counters.inc("invalid", "skipped")
+                continue
+
+            if count > 1:
+                key = next((record.ids[name] for name in PARTITION_KEYS if name in record.ids), str(number))
+                if zlib.crc32(key.encode()) % count != index:
+                    continue
+
+            yield record
+
+
+class TrafficReplayer:
+    """
+    Воспроизведение журнала запросов с сохранением интервалов между ними.
+
+    Запрос отправляется в момент (timestamp - timestamp первой записи) / speedup от начала воспроизведения,
+    независимо от того, завершились ли предыдущие запросы (открытая модель) — так сохраняется
+    всплесковость реального трафика, которую не дают веса задач.
+
+    Планировщик читает журнал с опережением не более lookahead секунд: каждая прочитанная запись
+    ждёт своего момента в отдельном гринлете, поэтому в памяти находятся только ближайшие записи.
+    Количество одновременно выполняемых запросов ограничено max_in_flight; если генератор не успевает,
+    опоздание каждой отправки пишется в записи статистики "Replay lag".
+    """
+
+    def __init__(
+            self,
+            target: Any,
+            environment: Environment,
+            mapper: SeedsMapper,
+            speedup: float = 1.0,
+            lookahead: float = 1.0,
+            max_in_flight: int = 1000
+    ):
+        """
+        :param target: Объект с клиентами gateway (GatewayTaskSet), через которые выполняются действия.
+        :param environment: Окружение Locust.
+        :param mapper: Отображение идентификаторов журнала на сущности сидинга.
+        :param speedup: Ускорение воспроизведения (2 — вдвое быстрее записанного трафика).
+        :param lookahead: Опережение чтения журнала в секундах воспроизведения.
+        :param max_in_flight: Максимальное количество одновременно выполняемых запросов.
+        """
+        self.target = target
+        self.environment = environment
+        self.mapper = mapper
+        self.speedup = speedup
+        self.lookahead = lookahead
+        self.pool = Pool(max_in_flight)
+
+    def dispatch(self, record: ReplayRecord, action: ReplayAction, ids: dict[str, str], due: float) -> None:
+        delay = due - time.monotonic()
+        if delay > 0:
+            gevent.sleep(delay)
+
+        lag = max(time.monotonic() - due, 0) * 1000
+        self.environment.stats.get(record.name, REPLAY_LAG_TYPE).log(lag, 0)
+
+        client = getattr(self.target, action.client)
+        try:
+            getattr(client, action.name)(**{name: ids[name] for name in action.args})
+        except Exception as error:
+            # Сам запрос уже учтён в статистике Locust клиентом, здесь — только итог воспроизведения
+            counters.inc(record.name, "errors")
+            logger.debug(f"{record.name} failed: {error}")
+
+    def run(self, records: Iterator[ReplayRecord]) -> None:
+        """
+        Воспроизводит записи и дожидается завершения всех отправленных запросов.
+
+        :param records: Записи журнала в хронологическом порядке.
+        """
+        start, origin, dispatched = time.monotonic(), None, 0
+        try:
+            for record in records:
+                action = ACTIONS.get(record.name)
+                ids = self.mapper.map_ids(record.ids) if action is not None else None
+                if action is None or ids is None or any(name not in ids for name in action.args):
+                    counters.inc(record.name, "skipped")
+                    continue
+
+                origin = record.timestamp if origin is None else origin
+                # Записи с меньшим timestamp, чем у первой, отправляются сразу
+                due = start + max(record.timestamp - origin, 0) / self.speedup
+
+                wait = due - self.lookahead - time.monotonic()
+                if wait > 0:
+                    gevent.sleep(wait)
+
+                # При исчерпании лимита одновременных запросов spawn ждёт освобождения места
+                self.pool.spawn(self.dispatch, record, action, ids, due)
+                counters.inc(record.name, "dispatched")
+                dispatched += 1
+
+            self.pool.join()
+        finally:
+            self.pool.kill()
+
+        logger.info(f"Replay finished: {dispatched} requests in {time.monotonic() - start:.1f}s")
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--replay-log",
+        default="",
+        env_var="LOCUST_REPLAY_LOG",
+        help="JSONL-журнал запросов для воспроизведения (записывается с --record-requests)",
+    )
+    parser.add_argument(
+        "--replay-speedup",
+        type=float,
+        default=1.0,
+        env_var="LOCUST_REPLAY_SPEEDUP",
+        help="Ускорение воспроизведения журнала относительно записанного времени",
+    )
+    parser.add_argument(
+        "--replay-lookahead",
+        type=float,
+        default=1.0,
+        env_var="LOCUST_REPLAY_LOOKAHEAD",
+        help="Опережение чтения журнала в секундах воспроизведения",
+    )
+    parser.add_argument(
+        "--replay-max-in-flight",
+        type=int,
+        default=1000,
+        env_var="LOCUST_REPLAY_MAX_IN_FLIGHT",
+        help="Максимальное количество одновременно выполняемых запросов воспроизведения",
+    )
+    parser.add_argument(
+        "--replay-partition",
+        default="0/1",
+        env_var="LOCUST_REPLAY_PARTITION",
+        help="Часть журнала для этого процесса в формате index/count (для запуска в нескольких процессах)",
+    )
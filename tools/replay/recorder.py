@@ -0,0 +1,123 @@
+import json
+import os
+import re
+import time
+from typing import Any, TextIO
+
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+from httpx import Request
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.logger import get_logger
+from tools.metrics.context import get_request_context
+from tools.replay.actions import GRPC_ACTIONS, get_path_parameters
+from tools.replay.schema import ReplayRecord
+
+logger = get_logger("REPLAY_RECORDER")
+
+CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Открытый журнал записи запросов (None — запись выключена)
+_file: TextIO | None = None
+
+
+def to_snake_case(name: str) -> str:
+    return CAMEL_CASE_PATTERN.sub("_", name).lower()
+
+
+def write_record(method: str, route: str, fields: dict[str, Any]) -> None:
+    """
+    Записывает запрос в журнал: поля *_id попадают в ids, остальные — в body.
+    Идентификатор сессии берётся из контекста запросов (его задаёт SessionTaskSet).
+
+    :param method: HTTP-метод.
+    :param route: Логический маршрут.
+    :param fields: Параметры пути, query и поля тела запроса.
+    """
+    fields = {to_snake_case(name): value for name, value in fields.items()}
+    record = ReplayRecord(
+        timestamp=time.time(),
+        method=method,
+        route=route,
+        ids={name: str(value) for name, value in fields.items() if name.endswith("_id")},
+        body={name: value for name, value in fields.items() if not name.endswith("_id")} or None,
+        session=get_request_context().get("session"),
+    )
+    _file.write(record.model_dump_json(exclude_none=True) + "\n")
+
+
+def record_http_request(request: Request) -> None:
+    """
+    Записывает отправляемый HTTP-запрос в журнал, если запуск идёт с --record-requests.
+
+    :param request: Запрос httpx (вызывается из request event hook в момент отправки).
+    """
+    if _file is None:
+        return
+
+    route = request.extensions.get("route", request.url.path)
+    fields: dict[str, Any] = {**get_path_parameters(route, request.url.path), **dict(request.url.params)}
+    if request.content and request.headers.get("content-type", "").startswith("application/json"):
+        body = json.loads(request.content)
+        if isinstance(body, dict):
+            fields.update(body)
+
+    write_record(request.method, route, fields)
+
+
+def record_grpc_request(method: str, request: Message) -> None:
+    """
+    Записывает отправляемый gRPC-запрос в журнал под логическим HTTP-маршрутом метода.
+
+    Методы без HTTP-аналога записываются с методом "GRPC" и полным именем метода вместо маршрута:
+    журнал остаётся полным, а при воспроизведении такие записи пропускаются.
+
+    :param method: Полное имя gRPC-метода (/package.Service/Method).
+    :param request: Сообщение запроса.
+    """
+    if _file is None:
+        return
+
+    fields = MessageToDict(request, preserving_proto_field_name=True)
+    action = GRPC_ACTIONS.get(method.rsplit("/", 1)[-1])
+    if action is None:
+        write_record("GRPC", method, fields)
+    else:
+        write_record(action.method, action.route, fields)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--record-requests",
+        default="",
+        env_var="LOCUST_RECORD_REQUESTS",
+        help="Путь к JSONL-журналу, в который записываются все отправленные запросы (для tools.replay)",
+    )
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    global _file
+    path = getattr(environment.parsed_options, "record_requests", "")
+    if not path:
+        return
+
+    # Воркеры пишут свои журналы: индекс воркера в этот момент ещё неизвестен, поэтому суффикс — pid
+    if isinstance(environment.runner, WorkerRunner):
+        base, extension = path.rsplit(".", 1) if "." in path else (path, "jsonl")
+        path = f"{base}_{os.getpid()}.{extension}"
+
+    _file = open(path, "w+", encoding="utf-8")
+    logger.info(f"Recording requests to file: {path}")
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    global _file
+    if _file is not None:
+        _file.close()
+        _file = None
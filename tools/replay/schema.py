@@ -0,0 +1,30 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ReplayRecord(BaseModel):
+    """
+    Запись журнала запросов (одна строка JSONL).
+
+    Формат не зависит от протокола: gRPC-вызовы записываются под логическим HTTP-маршрутом
+    соответствующего метода, поэтому журнал, записанный по одному протоколу, воспроизводится по любому.
+
+    Attributes:
+        timestamp (float): Время отправки запроса (Unix time в секундах).
+        method (str): HTTP-метод.
+        route (str): Логический маршрут с параметрами пути в виде шаблона (например, /api/v1/users/{user_id}).
+        ids (dict[str, str]): Идентификаторы сущностей запроса из пути, query и тела (user_id, account_id и т.д.).
+        body (dict[str, Any] | None): Остальные поля тела запроса (имена в snake_case).
+        session (str | None): Идентификатор сессии пользователя, отправившего запрос (если известен).
+    """
+    timestamp: float
+    method: str
+    route: str
+    ids: dict[str, str] = Field(default_factory=dict)
+    body: dict[str, Any] | None = None
+    session: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}"
@@ -0,0 +1,182 @@
+import random
+import time
+
+from locust import events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.config.retries import RetryPolicyConfig
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+
+logger = get_logger("RETRIES")
+
+# Логические запросы, попытки, повторы и отказы в повторе по маршрутам/методам обоих протоколов
+counters = get_counters("retries")
+
+
+class RetryBudget:
+    """
+    Бюджет повторов (token bucket).
+
+    Каждый логический запрос пополняет бюджет на ratio токена, кроме того бюджет
+    равномерно пополняется на min_retries_per_second токенов в секунду. Повтор расходует один токен.
+    Когда сервер деградирует и ошибок становится много, повторы упираются в бюджет,
+    и дополнительная нагрузка не превышает ratio от исходной.
+    """
+
+    def __init__(self, ratio: float, min_retries_per_second: float, max_tokens: float):
+        """
+        :param ratio: Пополнение бюджета за каждый логический запрос.
+        :param min_retries_per_second: Пополнение бюджета в секунду независимо от запросов.
+        :param max_tokens: Максимальный запас токенов.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.tokens = 0.0
+        self.refilled_at = time.monotonic()
+
+    def deposit(self) -> None:
+        self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        """
+        Пытается списать токен на повтор.
+
+        :return: True, если повтор разрешён.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self.refilled_at) * self.min_retries_per_second, self.max_tokens)
+        self.refilled_at = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Политика повторов клиента: сколько раз, с какой паузой и при каких ошибках повторять запрос.
+
+    Создаётся на каждый клиент (как у реального мобильного приложения), поэтому бюджет повторов
+    у каждого виртуального пользователя свой. Учитывает логические запросы и попытки в счётчиках retries:
+    отношение attempts / requests — это коэффициент усиления нагрузки повторами.
+    """
+
+    def __init__(self, config: RetryPolicyConfig, default_retryable: set[str]):
+        """
+        :param config: Настройки политики.
+        :param default_retryable: Статусы для повтора по умолчанию (если в настройках не заданы).
+        """
+        self.config = config
+        self.retryable = set(config.retryable) or default_retryable
+        self.budget = None
+        if config.budget.enabled:
+            self.budget = RetryBudget(
+                ratio=config.budget.ratio,
+                min_retries_per_second=config.budget.min_retries_per_second,
+                max_tokens=config.budget.max_tokens
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.strategy != "none" and self.config.max_attempts > 1
+
+    def get_delay(self, retry: int) -> float:
+        """
+        Возвращает паузу перед повтором.
+
+        :param retry: Номер повтора, начиная с 1.
+        :return: Пауза в секундах.
+        """
+        delay = self.config.delay
+        if self.config.strategy == "exponential":
+            delay = self.config.delay * self.config.multiplier ** (retry - 1)
+
+        delay = min(delay, self.config.max_delay)
+        return random.uniform(0, delay) if self.config.jitter else delay
+
+    def start(self, key: str) -> None:
+        """
+        Отмечает начало логического запроса.
+
+        :param key: Маршрут или метод, по которому ведутся счётчики.
+        """
+        counters.inc(key, "requests")
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def finish_attempt(
+            self,
+            environment: Environment,
+            request_type: str,
+            key: str,
+            attempt: int,
+            status: str | None,
+            response_time: float
+    ) -> float | None:
+        """
+        Учитывает завершившуюся попытку и решает, нужно ли повторять запрос.
+
+        Каждая попытка пишется напрямую в environment.stats под типом request_type
+        (например, "HTTP attempt"): так видна фактическая нагрузка на сервер, а основная запись
+        и Aggregated по-прежнему считают логические запросы.
+
+        :param environment: Окружение Locust.
+        :param request_type: Тип записи статистики для попыток.
+        :param key: Маршрут или метод.
+        :param attempt: Номер завершившейся попытки, начиная с 1.
+        :param status: Статус попытки или None для успеха.
+        :param response_time: Длительность попытки в миллисекундах.
+        :return: Пауза перед повтором в секундах или None, если повторять не нужно.
+        """
+        counters.inc(key, "attempts")
+        entry = environment.stats.get(key, request_type)
+        entry.log(response_time, 0)
+        if status is not None:
+            entry.log_error(None)
+
+        if not self.should_retry(key, attempt, status):
+            return None
+
+        return self.get_delay(attempt)
+
+    def should_retry(self, key: str, attempt: int, status: str | None) -> bool:
+        """
+        Решает, нужно ли повторять запрос после неудачной попытки.
+
+        :param key: Маршрут или метод.
+        :param attempt: Номер завершившейся попытки, начиная с 1.
+        :param status: Статус попытки (код HTTP, код gRPC, "timeout", "transport") или None для успеха.
+        :return: True, если нужно повторить запрос.
+        """
+        if status is None or status not in self.retryable:
+            return False
+
+        if attempt >= self.config.max_attempts:
+            counters.inc(key, "exhausted")
+            return False
+
+        if self.budget is not None and not self.budget.withdraw():
+            counters.inc(key, "budget_denied")
+            return False
+
+        counters.inc(key, "retries")
+        return True
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or not counters.counters:
+        return
+
+    lines = [
+        f"{key}: amplification x{values['attempts'] / values['requests']:.2f} "
+        f"({values['requests']:g} requests, {values['attempts']:g} attempts, "
+        f"{values['budget_denied']:g} denied by budget)"
+        for key, values in sorted(counters.counters.items()) if values["requests"]
+    ]
+    logger.info("Retry amplification:\n" + "\n".join(lines))
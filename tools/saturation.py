@@ -0,0 +1,201 @@
+import json
+
+from locust.runners import MasterRunner
+
+from tools.config.load_shapes import SaturationSearchConfig
+from tools.load_shapes import BaseLoadShape, LOAD_SHAPES
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+from tools.metrics.histograms import LatencyHistogram, AGGREGATED_NAME, histograms
+from tools.user.arrival_rate_control import set_arrival_rate_scale
+
+logger = get_logger("SATURATION_SEARCH")
+
+# Итоги работы планировщиков открытой модели: отброшенные итерации означают, что нагрузка не подана
+arrival_rate_counters = get_counters("arrival_rate")
+
+
+class SaturationSearchShape(BaseLoadShape):
+    """
+    Поиск точки насыщения за один запуск: максимальная интенсивность, при которой выполняется SLO.
+
+    Работает со сценариями на LocustArrivalRateUser (открытая модель). Нагрузка подаётся короткими
+    ступенями постоянной интенсивности: после прогрева замеряются p95/p99 и доля ошибок запросов.
+    Пока ступени укладываются в SLO, интенсивность удваивается; после первой неудачи граница
+    уточняется двоичным поиском между последней успешной и первой неуспешной ступенью.
+    Ступень считается неуспешной и тогда, когда генератор отбросил итерации (не хватило пользователей).
+
+    Итог — максимальная устойчивая интенсивность и RPS, а также кривая задержки по всем ступеням —
+    выводится в лог и сохраняется в `{csv_prefix}_saturation.json`.
+    Количество пользователей (--users) — начальный пул, он расширяется автоматически.
+    """
+    config: SaturationSearchConfig
+
+    def __init__(self, users: int, spawn_rate: float, config: SaturationSearchConfig):
+        super().__init__(users, spawn_rate, config)
+        self.rate = config.start_rate
+        self.passed_rate: float | None = None
+        self.failed_rate: float | None = None
+        self.phase_start: float | None = None
+        self.cooling_down = False
+        self.snapshot: dict | None = None
+        self.plateaus: list[dict] = []
+
+    def get_base_rate(self) -> float:
+        """
+        Возвращает суммарную интенсивность классов открытой модели при множителе 1 во всех генераторах.
+        """
+        workers = self.runner.worker_count if isinstance(self.runner, MasterRunner) else 1
+        rates = [
+            user_class.arrival_rate.rate for user_class in self.runner.environment.user_classes
+            if hasattr(user_class, "arrival_rate")
+        ]
+        return sum(rates) * workers
+
+    def take_snapshot(self) -> dict:
+        histogram = histograms.total.get(("", AGGREGATED_NAME), LatencyHistogram())
+        return {
+            "time": self.get_run_time(),
+            "requests": self.runner.stats.total.num_requests,
+            "failures": self.runner.stats.total.num_failures,
+            "dropped": sum(values["dropped"] for values in arrival_rate_counters.counters.values()),
+            "counts": dict(histogram.counts),
+            "max": histogram.max_value,
+        }
+
+    def evaluate(self, start: dict, end: dict) -> dict:
+        """
+        Считает метрики ступени по разнице снимков и проверяет SLO.
+
+        :param start: Снимок после прогрева.
+        :param end: Снимок в конце ступени.
+        :return: Результат ступени.
+        """
+        histogram = LatencyHistogram(
+            counts={index: count - start["counts"].get(index, 0) for index, count in end["counts"].items()},
+            max_value=end["max"],
+        )
+        requests = end["requests"] - start["requests"]
+        failures = end["failures"] - start["failures"]
+        dropped = end["dropped"] - start["dropped"]
+        result = {
+            "rate": self.rate,
+            "rps": requests / (end["time"] - start["time"]),
+            "requests": requests,
+            "error_rate": failures / requests if requests else 0.0,
+            "dropped": dropped,
+            **{f"p{p * 100:g}": histogram.get_percentile(p) for p in (0.5, 0.95, 0.99)},
+        }
+        result["passed"] = (
+                requests > 0
+                and dropped == 0
+                and result["error_rate"] <= self.config.max_error_rate
+                and result["p95"] <= self.config.max_p95
+                and result["p99"] <= self.config.max_p99
+        )
+        return result
+
+    def get_next_rate(self, passed: bool) -> float | None:
+        """
+        Выбирает интенсивность следующей ступени.
+
+        :param passed: Уложилась ли текущая ступень в SLO.
+        :return: Интенсивность или None, если поиск завершён.
+        """
+        if passed:
+            self.passed_rate = self.rate
+        else:
+            self.failed_rate = self.rate
+
+        if len(self.plateaus) >= self.config.max_plateaus:
+            return None
+
+        if self.failed_rate is None:
+            return min(self.rate * 2, self.config.max_rate) if self.rate < self.config.max_rate else None
+
+        if self.passed_rate is None:
+            return self.rate / 2 if self.rate / 2 >= self.config.min_rate else None
+
+        if self.failed_rate - self.passed_rate <= self.config.precision * self.failed_rate:
+            return None
+
+        return (self.passed_rate + self.failed_rate) / 2
+
+    def report(self) -> None:
+        passed = [plateau for plateau in self.plateaus if plateau["passed"]]
+        best = max(passed, key=lambda plateau: plateau["rate"]) if passed else None
+
+        lines = [
+            f"{plateau['rate']:>10.1f} it/s {plateau['rps']:>10.1f} RPS "
+            f"p50 {plateau['p50']:>8.1f} p95 {plateau['p95']:>8.1f} p99 {plateau['p99']:>8.1f} ms "
+            f"errors {plateau['error_rate']:>6.1%} dropped {plateau['dropped']:>6g} "
+            f"{'OK' if plateau['passed'] else 'SLO violated'}"
+            for plateau in sorted(self.plateaus, key=lambda plateau: plateau["rate"])
+        ]
+        logger.info("Latency curve:\n" + "\n".join(lines))
+        if best is None:
+            logger.info(f"SLO is not met even at {self.rate:g} it/s")
+        else:
+            logger.info(f"Max sustainable arrival rate: {best['rate']:.1f} it/s ({best['rps']:.1f} RPS)")
+
+        csv_prefix = getattr(self.runner.environment.parsed_options, "csv_prefix", None)
+        if not csv_prefix:
+            return
+
+        with open(f"{csv_prefix}_saturation.json", "w+", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "max_sustainable_rate": best["rate"] if best else None,
+                    "max_sustainable_rps": best["rps"] if best else None,
+                    "slo": self.config.model_dump(include={"max_p95", "max_p99", "max_error_rate"}),
+                    "plateaus": sorted(self.plateaus, key=lambda plateau: plateau["rate"]),
+                },
+                file,
+                indent=2
+            )
+
+    def start_plateau(self, run_time: float) -> None:
+        self.cooling_down = False
+        self.phase_start = run_time
+        self.snapshot = None
+        logger.info(f"Plateau {len(self.plateaus) + 1}: {self.rate:.1f} it/s")
+
+    def tick(self) -> tuple[int, float] | None:
+        base_rate = self.get_base_rate()
+        if not base_rate:
+            logger.error("Saturation search requires LocustArrivalRateUser scenarios")
+            return None
+
+        run_time = self.get_run_time()
+        if self.phase_start is None:
+            self.start_plateau(run_time)
+        elapsed = run_time - self.phase_start
+
+        if self.cooling_down:
+            if elapsed >= self.config.cooldown:
+                self.start_plateau(run_time)
+        else:
+            if self.snapshot is None and elapsed >= self.config.warmup:
+                self.snapshot = self.take_snapshot()
+
+            if elapsed >= self.config.warmup + self.config.plateau:
+                result = self.evaluate(self.snapshot, self.take_snapshot())
+                self.plateaus.append(result)
+
+                next_rate = self.get_next_rate(result["passed"])
+                if next_rate is None:
+                    self.report()
+                    return None
+
+                self.rate = next_rate
+                if self.config.cooldown > 0:
+                    self.cooling_down, self.phase_start = True, run_time
+                else:
+                    self.start_plateau(run_time)
+
+        # Множитель отправляется на каждом тике: воркеры, подключившиеся позже, тоже его получат
+        set_arrival_rate_scale(self.runner.environment, 0 if self.cooling_down else self.rate / base_rate)
+        return self.users, self.spawn_rate
+
+
+LOAD_SHAPES["saturation"] = (SaturationSearchShape, SaturationSearchConfig)
@@ -0,0 +1,148 @@
+import argparse
+import json
+import math
+import statistics
+from collections import Counter, defaultdict
+from typing import Iterator
+
+from locust import events
+
+from tools.config.sessions import END_STATE, SessionModelConfig, SessionTransitionConfig, ThinkTimeConfig
+from tools.logger import get_logger
+from tools.replay.actions import ACTIONS
+from tools.replay.engine import PARTITION_KEYS, read_records
+from tools.replay.schema import ReplayRecord
+
+logger = get_logger("SESSIONS")
+
+# Минимальная пауза, учитываемая при подборе логнормального распределения (секунды)
+MIN_THINK_TIME = 0.001
+
+
+def load_session_model(path: str) -> SessionModelConfig:
+    with open(path, encoding="utf-8") as file:
+        return SessionModelConfig.model_validate_json(file.read())
+
+
+def get_session_key(record: ReplayRecord) -> str | None:
+    """
+    Возвращает ключ сессии записи: идентификатор сессии, а если его нет — первый идентификатор сущности.
+
+    Журналы, записанные из SessionTaskSet, содержат session. Для остальных журналов сессии собираются
+    по user_id, account_id и т.д.: цепочки между действиями с разными сущностями при этом теряются.
+
+    :param record: Запись журнала.
+    :return: Ключ или None, если записать к сессии нельзя.
+    """
+    if record.session:
+        return record.session
+
+    return next((f"{name}:{record.ids[name]}" for name in PARTITION_KEYS if name in record.ids), None)
+
+
+def fit_think_time(samples: list[float]) -> ThinkTimeConfig:
+    """
+    Подбирает распределение паузы по замерам: логнормальное (медиана и σ логарифма),
+    а при единственном или одинаковых замерах — постоянное.
+
+    :param samples: Паузы между действиями в секундах.
+    :return: Параметры распределения.
+    """
+    logs = [math.log(max(sample, MIN_THINK_TIME)) for sample in samples]
+    if len(samples) < 2 or max(logs) - min(logs) < 1e-9:
+        return ThinkTimeConfig(mean=round(statistics.fmean(samples), 3))
+
+    return ThinkTimeConfig(
+        distribution="lognormal",
+        median=round(math.exp(statistics.fmean(logs)), 3),
+        sigma=round(statistics.stdev(logs), 3),
+    )
+
+
+def learn_session_model(records: Iterator[ReplayRecord], session_gap: float = 300.0) -> SessionModelConfig:
+    """
+    Строит марковскую модель сессии по журналу запросов (формат tools.replay).
+
+    Состояния — методы клиентов gateway (get_accounts, get_operations, ...). Сессия заканчивается,
+    если следующий запрос с тем же ключом пришёл позже чем через session_gap секунд.
+    Пауза перехода — интервал между отправками запросов, то есть включает время ответа предыдущего.
+    Журнал читается потоком, в памяти — только последнее действие каждой открытой сессии.
+
+    :param records: Записи журнала в хронологическом порядке.
+    :param session_gap: Пауза, после которой следующий запрос начинает новую сессию (секунды).
+    :return: Модель сессии.
+    """
+    last: dict[str, tuple[str, float]] = {}
+    initial: Counter = Counter()
+    counts: defaultdict[str, Counter] = defaultdict(Counter)
+    think_times: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+
+    for record in records:
+        action, key = ACTIONS.get(record.name), get_session_key(record)
+        if action is None or key is None:
+            continue
+
+        previous = last.get(key)
+        if previous is None or record.timestamp - previous[1] > session_gap:
+            if previous is not None:
+                counts[previous[0]][END_STATE] += 1
+            initial[action.name] += 1
+        else:
+            counts[previous[0]][action.name] += 1
+            think_times[(previous[0], action.name)].append(record.timestamp - previous[1])
+
+        last[key] = (action.name, record.timestamp)
+
+    for state, _ in last.values():
+        counts[state][END_STATE] += 1
+
+    total = sum(initial.values()) or 1
+    transitions = {}
+    for state, targets in sorted(counts.items()):
+        state_total = sum(targets.values())
+        transitions[state] = {
+            target: SessionTransitionConfig(
+                probability=round(count / state_total, 4),
+                think_time=fit_think_time(think_times[(state, target)]) if target != END_STATE else None
+            )
+            for target, count in targets.most_common()
+        }
+
+    return SessionModelConfig(
+        initial={state: round(count / total, 4) for state, count in initial.most_common()},
+        transitions=transitions
+    )
+
+
+def format_session_model(model: SessionModelConfig) -> str:
+    lines = ["Initial: " + ", ".join(f"{state} {probability:.1%}" for state, probability in model.initial.items())]
+    for state, transitions in model.transitions.items():
+        lines.append(
+            f"{state} → " + ", ".join(f"{target} {item.probability:.1%}" for target, item in transitions.items())
+        )
+
+    return "\n".join(lines)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--session-model",
+        default="",
+        env_var="LOCUST_SESSION_MODEL",
+        help="JSON-файл марковской модели сессии для SessionTaskSet (пусто — выбор задач по весам)",
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Learn a Markov session model from a recorded request log")
+    parser.add_argument("log", help="Request log in JSONL format (see --record-requests)")
+    parser.add_argument("--output", default="./session_model.json", help="Output JSON model path")
+    parser.add_argument("--session-gap", type=float, default=300, help="Idle time that ends a session in seconds")
+    arguments = parser.parse_args()
+
+    session_model = learn_session_model(read_records(arguments.log), arguments.session_gap)
+    with open(arguments.output, "w+", encoding="utf-8") as file:
+        file.write(json.dumps(session_model.model_dump(exclude_none=True, exclude_defaults=True), indent=2))
+
+    logger.info(f"Session model saved to file: {arguments.output}\n{format_session_model(session_model)}")
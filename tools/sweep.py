@@ -0,0 +1,302 @@
+import argparse
+import csv
+import html
+import itertools
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+
+from tools.capacity import fit_usl
+from tools.charts import ChartSeries, render_line_chart
+from tools.logger import get_logger
+
+logger = get_logger("SWEEP")
+
+
+@dataclass
+class SweepCell:
+    """
+    Одна ячейка матрицы: конфиг сценария с заданными количеством пользователей и скоростью их запуска.
+    """
+    label: str
+    config: str
+    users: int
+    spawn_rate: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.label}_u{self.users}_r{self.spawn_rate:g}"
+
+
+@dataclass
+class SweepResult:
+    """
+    Итоги одной ячейки — строка сводной таблицы (одна строка на запуск, tidy-формат).
+    """
+    label: str
+    users: int
+    spawn_rate: float
+    requests: int
+    failures: int
+    error_rate: float
+    rps: float
+    avg: float
+    p50: float
+    p95: float
+    p99: float
+    p999: float
+    exit_code: int
+
+
+def get_label(config: str, configs: list[str]) -> str:
+    """
+    Возвращает метку конфига для таблицы и графиков: протокол (http/grpc) из пути
+    scenarios/<protocol>/..., а если протоколы совпадают — протокол и имя сценария.
+
+    :param config: Путь к v1.0.conf.
+    :param configs: Все конфиги серии.
+    :return: Метка.
+    """
+    def get_protocol(path: str) -> str:
+        parts = Path(path).parts
+        return parts[parts.index("scenarios") + 1] if "scenarios" in parts[:-2] else Path(path).parent.name
+
+    protocol = get_protocol(config)
+    if [get_protocol(item) for item in configs].count(protocol) > 1:
+        return f"{protocol}_{Path(config).parent.name}"
+
+    return protocol
+
+
+def read_aggregated(path: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        return next((row for row in csv.DictReader(file) if row["Name"] == "Aggregated"), None)
+
+
+def collect_result(cell: SweepCell, prefix: str, exit_code: int) -> SweepResult:
+    """
+    Собирает итоги ячейки из CSV-отчётов Locust.
+
+    Перцентили берутся из точных гистограмм ({csv}_percentiles.csv), а при их отсутствии —
+    из округлённой статистики Locust ({csv}_stats.csv).
+
+    :param cell: Ячейка матрицы.
+    :param prefix: Префикс CSV-отчётов ячейки.
+    :param exit_code: Код завершения Locust.
+    :return: Строка сводной таблицы.
+    """
+    stats = read_aggregated(f"{prefix}_stats.csv") or {}
+    percentiles = read_aggregated(f"{prefix}_percentiles.csv") or stats
+    requests, failures = int(stats.get("Request Count", 0)), int(stats.get("Failure Count", 0))
+    return SweepResult(
+        label=cell.label,
+        users=cell.users,
+        spawn_rate=cell.spawn_rate,
+        requests=requests,
+        failures=failures,
+        error_rate=failures / requests if requests else 0.0,
+        rps=float(stats.get("Requests/s", 0)),
+        avg=float(stats.get("Average Response Time", 0)),
+        p50=float(percentiles.get("50%", 0)),
+        p95=float(percentiles.get("95%", 0)),
+        p99=float(percentiles.get("99%", 0)),
+        p999=float(percentiles.get("99.9%", 0)),
+        exit_code=exit_code,
+    )
+
+
+def run_locust(config: str, prefix: str, options: list[str], reuse_seeds: bool) -> int:
+    """
+    Запускает Locust в отдельном процессе (headless) с отчётами по префиксу.
+
+    Параметры из options передаются аргументами командной строки и перекрывают значения из v1.0.conf.
+
+    :param config: Путь к v1.0.conf сценария.
+    :param prefix: Префикс CSV-отчётов и HTML-отчёта.
+    :param options: Дополнительные аргументы Locust (например, ["--users=100"]).
+    :param reuse_seeds: Переиспользовать дамп сидинга вместо генерации новых данных.
+    :return: Код завершения Locust.
+    """
+    command = [
+        sys.executable, "-m", "locust",
+        f"--config={config}",
+        "--headless",
+        *options,
+        f"--csv={prefix}",
+        f"--html={prefix}.html",
+    ]
+    environ = {**os.environ, "SEEDS.REUSE_DUMP": str(reuse_seeds).lower()}
+
+    logger.info(f"Running: {' '.join(command[1:])}")
+    return subprocess.run(command, env=environ).returncode
+
+
+def run_cell(cell: SweepCell, output: str, run_time: str, reuse_seeds: bool) -> SweepResult:
+    """
+    Запускает Locust для одной ячейки и собирает итоги.
+
+    :param cell: Ячейка матрицы.
+    :param output: Папка с отчётами серии.
+    :param run_time: Длительность запуска (как --run-time Locust, например 2m).
+    :param reuse_seeds: Переиспользовать дамп сидинга вместо генерации новых данных.
+    :return: Строка сводной таблицы.
+    """
+    prefix = os.path.join(output, cell.name)
+    options = [f"--users={cell.users}", f"--spawn-rate={cell.spawn_rate:g}", f"--run-time={run_time}"]
+    exit_code = run_locust(cell.config, prefix, options, reuse_seeds)
+    result = collect_result(cell, prefix, exit_code)
+    logger.info(
+        f"{cell.name}: {result.rps:.1f} RPS, p95 {result.p95:g} ms, p99 {result.p99:g} ms, "
+        f"errors {result.error_rate:.2%}, exit code {exit_code}"
+    )
+    return result
+
+
+def save_results(results: list[SweepResult], path: str) -> None:
+    with open(path, "w+", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=[field.name for field in fields(SweepResult)])
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+
+def render_report(results: list[SweepResult]) -> str:
+    """
+    Формирует HTML-отчёт серии: графики пропускной способности, задержки и доли ошибок
+    от количества пользователей (серия на каждую пару метка × скорость запуска) и модели USL.
+
+    :param results: Итоги ячеек.
+    :return: HTML-страница.
+    """
+    groups: dict[str, list[SweepResult]] = {}
+    for result in sorted(results, key=lambda item: (item.label, item.spawn_rate, item.users)):
+        groups.setdefault(f"{result.label} r={result.spawn_rate:g}", []).append(result)
+
+    charts = "\n".join(
+        f"<h3>{title}</h3>\n" + render_line_chart(
+            [ChartSeries(name=name, points=[(item.users, getter(item)) for item in items]) for name, items in
+             groups.items()],
+            x_label="Users",
+            y_label=title
+        )
+        for title, getter in (
+            ("Throughput (RPS)", lambda item: item.rps),
+            ("p95 latency (ms)", lambda item: item.p95),
+            ("p99 latency (ms)", lambda item: item.p99),
+            ("Error rate (%)", lambda item: item.error_rate * 100),
+        )
+    )
+
+    models = []
+    for name, items in groups.items():
+        model = fit_usl([(item.users, item.rps) for item in items])
+        if model is not None:
+            models.append(
+                f"<tr><td>{html.escape(name)}</td><td>{model.sigma:.5f}</td><td>{model.kappa:.6f}</td>"
+                f"<td>{model.peak_concurrency:.0f}</td><td>{model.peak_throughput:.1f}</td><td>{model.r2:.3f}</td></tr>"
+            )
+
+    rows = "\n".join(
+        f"<tr><td>{html.escape(item.label)}</td><td>{item.users}</td><td>{item.spawn_rate:g}</td>"
+        f"<td>{item.requests}</td><td>{item.rps:.1f}</td><td>{item.p50:g}</td><td>{item.p95:g}</td>"
+        f"<td>{item.p99:g}</td><td>{item.p999:g}</td><td>{item.error_rate:.2%}</td></tr>"
+        for item in results
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Sweep report</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 4px 12px; text-align: right; }}</style>
+</head>
+<body>
+<h2>Scaling curves</h2>
+{charts}
+<h3>USL models</h3>
+<table>
+<tr><th>Series</th><th>σ (contention)</th><th>κ (coherency)</th><th>Peak users</th><th>Peak RPS</th><th>R²</th></tr>
+{"".join(models)}
+</table>
+<h3>Results</h3>
+<table>
+<tr><th>Label</th><th>Users</th><th>Spawn rate</th><th>Requests</th><th>RPS</th><th>p50</th><th>p95</th>
+<th>p99</th><th>p99.9</th><th>Errors</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def run_sweep(
+        configs: list[str],
+        users: list[int],
+        spawn_rates: list[float],
+        run_time: str,
+        cool_down: float,
+        output: str,
+        reuse_seeds: bool = False
+) -> list[SweepResult]:
+    """
+    Последовательно прогоняет матрицу конфиги × пользователи × скорости запуска.
+
+    Сидинг выполняется только в первой ячейке, остальные переиспользуют его дамп
+    (или все ячейки, если reuse_seeds). Между ячейками выдерживается пауза, чтобы система
+    успела «остыть» (очереди, пулы соединений, GC) и ячейки не влияли друг на друга.
+    После каждой ячейки сводная таблица и отчёт перезаписываются — прерванная серия не теряется.
+
+    :param configs: Пути к v1.0.conf сценариев (например, http- и grpc-версия одного сценария).
+    :param users: Количество пользователей.
+    :param spawn_rates: Скорости запуска пользователей.
+    :param run_time: Длительность одной ячейки (как --run-time Locust).
+    :param cool_down: Пауза между ячейками в секундах.
+    :param output: Папка для отчётов ячеек, results.csv и results.html.
+    :param reuse_seeds: Переиспользовать существующий дамп сидинга уже в первой ячейке.
+    :return: Итоги ячеек.
+    """
+    os.makedirs(output, exist_ok=True)
+    cells = [
+        SweepCell(label=get_label(config, configs), config=config, users=count, spawn_rate=spawn_rate)
+        for config, count, spawn_rate in itertools.product(configs, users, spawn_rates)
+    ]
+
+    results: list[SweepResult] = []
+    for index, cell in enumerate(cells):
+        if index:
+            logger.info(f"Cooling down for {cool_down:g}s")
+            time.sleep(cool_down)
+
+        logger.info(f"Cell {index + 1}/{len(cells)}")
+        results.append(run_cell(cell, output, run_time, reuse_seeds=reuse_seeds or index > 0))
+
+        save_results(results, os.path.join(output, "results.csv"))
+        with open(os.path.join(output, "results.html"), "w+", encoding="utf-8") as file:
+            file.write(render_report(results))
+
+    logger.info(f"Sweep results saved to directory: {output} (results.csv, results.html)")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run a scenario across a matrix of users × spawn rates")
+    parser.add_argument("--config", nargs="+", required=True, help="Scenario v1.0.conf files (e.g. http and grpc)")
+    parser.add_argument("--users", nargs="+", type=int, required=True, help="User counts")
+    parser.add_argument("--spawn-rates", nargs="+", type=float, required=True, help="Spawn rates (users per second)")
+    parser.add_argument("--run-time", default="2m", help="Run time of each cell")
+    parser.add_argument("--cool-down", type=float, default=30, help="Pause between cells in seconds")
+    parser.add_argument("--output", default="./reports/sweep", help="Output directory")
+    parser.add_argument("--reuse-seeds", action="store_true", help="Reuse existing seeds dump in the first cell too")
+    arguments = parser.parse_args()
+
+    run_sweep(
+        configs=arguments.config,
+        users=arguments.users,
+        spawn_rates=arguments.spawn_rates,
+        run_time=arguments.run_time,
+        cool_down=arguments.cool_down,
+        output=arguments.output,
+        reuse_seeds=arguments.reuse_seeds
+    )
@@ -0,0 +1,45 @@
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner
+
+# Тип сообщения, которым мастер (или локальный процесс) меняет интенсивность открытой модели на воркерах
+ARRIVAL_RATE_SCALE_MESSAGE = "arrival_rate_scale"
+
+# Множитель интенсивности всех классов LocustArrivalRateUser. None — интенсивность по их профилям
+_arrival_rate_scale: float | None = None
+
+
+def get_arrival_rate_scale() -> float | None:
+    return _arrival_rate_scale
+
+
+def set_arrival_rate_scale(environment: Environment, scale: float | None) -> None:
+    """
+    Задаёт множитель интенсивности открытой модели во всех процессах-генераторах.
+
+    Пока множитель задан, планировщики запускают итерации с интенсивностью rate * scale,
+    не учитывая этапы профиля. Используется драйверами, которые сами управляют нагрузкой
+    (например, поиском точки насыщения).
+
+    :param environment: Окружение Locust мастера или локального процесса.
+    :param scale: Множитель интенсивности или None, чтобы вернуться к профилю.
+    """
+    environment.runner.send_message(ARRIVAL_RATE_SCALE_MESSAGE, {"scale": scale})
+
+
+def on_arrival_rate_scale_message(environment: Environment, msg, **kwargs):
+    global _arrival_rate_scale
+    _arrival_rate_scale = msg.data["scale"]
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    # Сообщение обрабатывают процессы, в которых работают пользователи: воркеры или локальный процесс
+    if environment.runner is not None and not isinstance(environment.runner, MasterRunner):
+        environment.runner.register_message(ARRIVAL_RATE_SCALE_MESSAGE, on_arrival_rate_scale_message)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment: Environment, **kwargs):
+    global _arrival_rate_scale
+    _arrival_rate_scale = None
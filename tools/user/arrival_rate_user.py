@@ -0,0 +1,305 @@
+import time
+from dataclasses import dataclass
+
+import gevent
+from gevent.queue import Queue
+from locust import TaskSet, SequentialTaskSet, events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from config import settings
+from tools.config.locust import ArrivalRateConfig
+from tools.logger import get_logger
+from tools.metrics.context import set_request_context, reset_request_context
+from tools.metrics.counters import get_counters
+from tools.metrics.histograms import record_latency
+from tools.user.arrival_rate_control import get_arrival_rate_scale
+from tools.user.user import LocustBaseUser
+
+logger = get_logger("LOCUST_ARRIVAL_RATE_USER")
+
+# Типы записей статистики Locust для итераций открытой модели.
+# "Iteration" — длительность итерации от запланированного момента старта (с учётом опоздания),
+# "Iteration delay" — само опоздание старта. Записи ведутся напрямую в environment.stats
+# и не попадают в Aggregated, чтобы не искажать RPS запросов
+ITERATION_TYPE = "Iteration"
+ITERATION_DELAY_TYPE = "Iteration delay"
+
+# Запланированные, запущенные, запоздавшие и отброшенные итерации, добавленные в пул пользователи
+counters = get_counters("arrival_rate")
+
+
+@dataclass
+class Iteration:
+    """
+    Одна итерация открытой модели: запланированный и фактический момент старта.
+    """
+    intended_start: float
+    start: float
+    failed: bool = False
+
+
+class ArrivalRateScheduler:
+    """
+    Планировщик итераций открытой модели нагрузки для одного класса пользователей.
+
+    Выдаёт «разрешения» на запуск итераций с заданной интенсивностью независимо от того,
+    как быстро отвечает система: если пользователи заняты, итерации ждут в очереди,
+    а пул пользователей расширяется до max_users. Так замедление системы не снижает
+    подаваемую нагрузку, и опоздания становятся видны (нет coordinated omission).
+    """
+
+    def __init__(self, environment: Environment, user_class: type["LocustArrivalRateUser"]):
+        """
+        :param environment: Окружение Locust.
+        :param user_class: Класс пользователей, итерации которых планируются.
+        """
+        self.environment = environment
+        self.user_class = user_class
+        self.name = user_class.__name__
+        self.config: ArrivalRateConfig = user_class.arrival_rate
+        self.queue: Queue = Queue()
+        self.users = 0
+        self.preparing = 0  # Созданные пользователи, ещё не дошедшие до ожидания первой итерации
+        self.idle = 0  # Пользователи, ожидающие итерацию
+        self.greenlet = gevent.spawn(self.run)
+
+    def get_rate(self, elapsed: float) -> float:
+        """
+        Возвращает интенсивность по профилю.
+
+        :param elapsed: Время от начала работы планировщика в секундах.
+        :return: Итераций в секунду.
+        """
+        scale = get_arrival_rate_scale()
+        if scale is not None:
+            return self.config.rate * scale
+
+        rate = self.config.rate
+        for stage in self.config.stages:
+            if elapsed < stage.duration:
+                return rate + (stage.target - rate) * elapsed / stage.duration
+
+            elapsed -= stage.duration
+            rate = stage.target
+
+        return rate
+
+    def run(self) -> None:
+        # Моменты старта считаются от начала работы, а не от фактического пробуждения гринлета:
+        # если генератор не успевает, опоздание попадает в метрики, а не теряется
+        start = time.perf_counter()
+        next_time = start
+        while True:
+            rate = self.get_rate(next_time - start)
+            if rate <= 0:
+                next_time += 0.1
+                gevent.sleep(max(0.0, next_time - time.perf_counter()))
+                continue
+
+            gevent.sleep(max(0.0, next_time - time.perf_counter()))
+            self.dispatch(next_time)
+            next_time += 1 / rate
+
+    def dispatch(self, intended_start: float) -> None:
+        """
+        Ставит итерацию в очередь, при необходимости добавляя пользователя в пул.
+
+        :param intended_start: Запланированный момент старта (time.perf_counter()).
+        """
+        counters.inc(self.name, "scheduled")
+        if self.idle + self.preparing <= len(self.queue):
+            if self.users >= self.config.max_users:
+                counters.inc(self.name, "dropped")
+                return
+
+            counters.inc(self.name, "users_added")
+            self.environment.runner.spawn_users({self.name: 1})
+
+        self.queue.put(intended_start)
+
+    def register(self) -> None:
+        self.users += 1
+        self.preparing += 1
+
+    def unregister(self, prepared: bool) -> None:
+        self.users -= 1
+        if not prepared:
+            self.preparing -= 1
+
+    def acquire(self, first: bool) -> float:
+        """
+        Ожидает очередную итерацию.
+
+        :param first: Первое ожидание пользователя (он перестаёт считаться подготавливающимся).
+        :return: Запланированный момент старта итерации.
+        """
+        if first:
+            self.preparing -= 1
+
+        self.idle += 1
+        try:
+            return self.queue.get()
+        finally:
+            self.idle -= 1
+
+    def stop(self) -> None:
+        self.greenlet.kill(block=False)
+
+
+# Планировщики по классам пользователей текущего запуска
+_schedulers: dict[type, ArrivalRateScheduler] = {}
+
+
+def get_scheduler(environment: Environment, user_class: type["LocustArrivalRateUser"]) -> ArrivalRateScheduler:
+    if user_class not in _schedulers:
+        _schedulers[user_class] = ArrivalRateScheduler(environment, user_class)
+
+    return _schedulers[user_class]
+
+
+class ArrivalRateTaskSetMixin:
+    """
+    Примесь к TaskSet для открытой модели: каждая итерация начинается по разрешению планировщика.
+
+    Итерация обычного TaskSet — одна задача, итерация SequentialTaskSet — полный проход по задачам
+    (шаги одного пользовательского сценария выполняются подряд, без ожидания очереди).
+    LocustArrivalRateUser добавляет примесь к своим TaskSet автоматически.
+    """
+
+    arrival_tasks_executed = 0
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.user.start_iteration()
+
+    def get_next_task(self):
+        self.arrival_tasks_executed += 1
+        return super().get_next_task()
+
+    def wait_time(self) -> float:
+        if isinstance(self, SequentialTaskSet) and self.arrival_tasks_executed % len(self.tasks):
+            return 0
+
+        return super().wait_time()
+
+
+def build_arrival_rate_task_set(task_set: type[TaskSet]) -> type[TaskSet]:
+    """
+    Создаёт подкласс TaskSet с примесью ArrivalRateTaskSetMixin.
+
+    :param task_set: Исходный TaskSet сценария.
+    :return: TaskSet для открытой модели с тем же именем.
+    """
+    if issubclass(task_set, ArrivalRateTaskSetMixin):
+        return task_set
+
+    return type(task_set.__name__, (ArrivalRateTaskSetMixin, task_set), {})
+
+
+class LocustArrivalRateUser(LocustBaseUser):
+    """
+    Виртуальный пользователь открытой модели нагрузки (constant/ramping arrival rate).
+
+    Вместо паузы wait_time между задачами пользователь ждёт очередную итерацию от планировщика
+    класса (ArrivalRateScheduler), который запускает итерации с интенсивностью из
+    settings.locust_user.arrival_rate (или из атрибута arrival_rate класса сценария).
+    Количество пользователей из v1.0.conf — предварительно созданный пул, при нехватке
+    он расширяется автоматически.
+
+    Каждая итерация пишется в запись "Iteration" (имя — класс пользователя) со временем
+    от запланированного старта, опоздание старта — в "Iteration delay".
+    Итерация считается неуспешной, если неуспешен любой запрос внутри неё.
+
+    Работает с существующими TaskSet без изменений:
+        class GetOperationsScenarioUser(LocustArrivalRateUser):
+            tasks = [GetOperationsTaskSet]
+    """
+    abstract = True
+    arrival_rate: ArrivalRateConfig = settings.locust_user.arrival_rate
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        wrapped: dict[type, type] = {}
+        cls.tasks = [
+            wrapped.setdefault(task, build_arrival_rate_task_set(task))
+            if isinstance(task, type) and issubclass(task, TaskSet) else task
+            for task in cls.tasks
+        ]
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        self.scheduler = get_scheduler(environment, type(self))
+        self.scheduler.register()
+        self.iteration: Iteration | None = None
+        self.iteration_token = None
+        self.prepared = False
+
+    def run(self):
+        try:
+            super().run()
+        finally:
+            self.scheduler.unregister(self.prepared)
+
+    def wait_time(self) -> float:
+        self.start_iteration()
+        return 0
+
+    def start_iteration(self) -> None:
+        """
+        Завершает текущую итерацию и блокирует пользователя до старта следующей.
+        """
+        self.finish_iteration()
+
+        intended_start = self.scheduler.acquire(first=not self.prepared)
+        self.prepared = True
+
+        self.iteration = Iteration(intended_start=intended_start, start=time.perf_counter())
+        delay = self.iteration.start - intended_start
+        counters.inc(self.scheduler.name, "started")
+        counters.inc(self.scheduler.name, "late", int(delay >= self.arrival_rate.late_threshold))
+        self.environment.stats.get(self.scheduler.name, ITERATION_DELAY_TYPE).log(delay * 1000, 0)
+
+        # Запросы итерации помечаются ею, чтобы ошибки запросов отражались на итерации
+        self.iteration_token = set_request_context(iteration=self.iteration)
+
+    def finish_iteration(self) -> None:
+        if self.iteration is None:
+            return
+
+        reset_request_context(self.iteration_token)
+        response_time = (time.perf_counter() - self.iteration.intended_start) * 1000
+        entry = self.environment.stats.get(self.scheduler.name, ITERATION_TYPE)
+        entry.log(response_time, 0)
+        record_latency(ITERATION_TYPE, self.scheduler.name, response_time)
+        if self.iteration.failed:
+            entry.log_error(None)
+
+        self.iteration, self.iteration_token = None, None
+
+
+@events.request.add_listener
+def on_request(exception: Exception | None, context: dict | None, **kwargs):
+    if exception is not None and context and "iteration" in context:
+        context["iteration"].failed = True
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment: Environment, **kwargs):
+    for scheduler in _schedulers.values():
+        scheduler.stop()
+    _schedulers.clear()
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    for name, values in sorted(counters.counters.items()):
+        if values["scheduled"]:
+            logger.info(
+                f"{name}: {values['scheduled']:g} iterations scheduled, {values['started']:g} started, "
+                f"{values['late'] / max(values['started'], 1):.1%} late, {values['dropped']:g} dropped, "
+                f"{values['users_added']:g} users added to the pool"
+            )
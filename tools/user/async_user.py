@@ -0,0 +1,167 @@
+import asyncio
+import random
+from typing import Any, Callable, Coroutine
+
+import gevent
+from locust import task
+from locust.user.users import LOCUST_STATE_STOPPING
+
+from config import settings
+from tools.logger import get_logger
+from tools.user.user import LocustBaseUser
+
+logger = get_logger("LOCUST_ASYNC_USER")
+
+AsyncTask = Callable[[Any], Coroutine[Any, Any, None]]
+
+# Общий для процесса event loop. Создаётся при первом обращении
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Возвращает общий для процесса asyncio event loop, запущенный в отдельном гринлете.
+
+    Locust работает поверх gevent, поэтому loop не может занять поток целиком.
+    После monkey-патчинга стандартный селектор asyncio — это gevent-селектор,
+    и ожидание событий loop кооперативно передаёт управление остальным гринлетам
+    (пользователям Locust, отправке статистики и т.д.).
+
+    :return: Запущенный event loop.
+    """
+    global _event_loop
+    if _event_loop is None:
+        _event_loop = asyncio.new_event_loop()
+        gevent.spawn(_event_loop.run_forever)
+
+    return _event_loop
+
+
+def async_task(weight: int = 1) -> Callable[[AsyncTask], AsyncTask]:
+    """
+    Декоратор для асинхронных задач сессии — аналог locust.task.
+
+    :param weight: Вес задачи при случайном выборе (в AsyncSequentialSession не используется).
+    :return: Декоратор, помечающий корутинную функцию как задачу.
+    """
+
+    def decorator(func: AsyncTask) -> AsyncTask:
+        func.async_task_weight = weight
+        return func
+
+    return decorator
+
+
+class AsyncSession:
+    """
+    Асинхронная сессия — аналог TaskSet для LocustAsyncBaseUser.
+
+    Один пользователь Locust запускает несколько сессий конкурентно в общем event loop.
+    Каждая сессия выполняет задачи, помеченные @async_task, в случайном порядке с учётом весов,
+    а между задачами ждёт wait_time пользователя, не блокируя остальные сессии.
+    """
+
+    def __init__(self, user: "LocustAsyncBaseUser"):
+        """
+        :param user: Пользователь Locust, запустивший сессию.
+        """
+        self.user = user
+
+    @classmethod
+    def get_tasks(cls) -> list[AsyncTask]:
+        """
+        Собирает задачи сессии в порядке их объявления (с учётом родительских классов).
+
+        :return: Список корутинных функций, помеченных @async_task.
+        """
+        tasks: dict[str, AsyncTask] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if hasattr(value, "async_task_weight"):
+                    tasks[name] = value
+
+        return list(tasks.values())
+
+    async def on_start(self) -> None:
+        pass
+
+    async def on_stop(self) -> None:
+        pass
+
+    def get_next_task(self) -> AsyncTask:
+        tasks = self.get_tasks()
+        return random.choices(tasks, weights=[func.async_task_weight for func in tasks])[0]
+
+    async def execute_task(self, func: AsyncTask) -> None:
+        try:
+            await func(self)
+        except Exception as error:
+            # Ошибка одной задачи не должна останавливать сессию — как и в TaskSet Locust
+            logger.error(f"Async task {func.__name__} failed: {error!r}")
+            self.user.environment.events.user_error.fire(
+                user_instance=self.user, exception=error, tb=error.__traceback__
+            )
+
+    async def run(self) -> None:
+        """
+        Основной цикл сессии: on_start, задачи с паузами до остановки пользователя, on_stop.
+        """
+        await self.on_start()
+        try:
+            while self.user.is_running:
+                await self.execute_task(self.get_next_task())
+                await asyncio.sleep(self.user.wait_time())
+        finally:
+            await self.on_stop()
+
+
+class AsyncSequentialSession(AsyncSession):
+    """
+    Асинхронная сессия, выполняющая задачи строго по очереди — аналог SequentialTaskSet.
+    """
+
+    def __init__(self, user: "LocustAsyncBaseUser"):
+        super().__init__(user)
+        self.task_index = 0
+
+    def get_next_task(self) -> AsyncTask:
+        tasks = self.get_tasks()
+        func = tasks[self.task_index % len(tasks)]
+        self.task_index += 1
+        return func
+
+
+class LocustAsyncBaseUser(LocustBaseUser):
+    """
+    Базовый асинхронный пользователь Locust.
+
+    Вместо одного гринлета на виртуального пользователя запускает `sessions` конкурентных сессий
+    (корутин) в общем event loop процесса. Так один пользователь Locust моделирует множество
+    клиентов, а накладные расходы на каждого клиента ограничиваются корутиной и её сокетами.
+    """
+    abstract = True
+
+    # Количество конкурентных сессий на одного пользователя Locust
+    sessions: int = settings.locust_user.async_sessions
+
+    # Класс сессии, задаётся в сценарии
+    session_class: type[AsyncSession]
+
+    @property
+    def is_running(self) -> bool:
+        # При мягкой остановке (--stop-timeout) Locust помечает пользователя, и сессии завершаются сами
+        return self._state != LOCUST_STATE_STOPPING
+
+    async def run_sessions(self) -> None:
+        await asyncio.gather(*(self.session_class(self).run() for _ in range(self.sessions)))
+
+    @task
+    def run_async_sessions(self) -> None:
+        future = asyncio.run_coroutine_threadsafe(self.run_sessions(), get_event_loop())
+        try:
+            # Ожидание future кооперативно (threading пропатчен gevent) и не блокирует loop
+            future.result()
+        except BaseException:
+            # Пользователь остановлен принудительно — отменяем его сессии в event loop
+            future.cancel()
+            raise
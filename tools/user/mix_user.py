@@ -0,0 +1,227 @@
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from locust import User, events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from tools.config.locust import ArrivalRateConfig
+from tools.logger import get_logger
+from tools.metrics.context import set_request_context, reset_request_context
+from tools.metrics.histograms import record_latency
+from tools.user.arrival_rate_user import LocustArrivalRateUser
+
+logger = get_logger("LOCUST_MIX_USER")
+
+# Тип записей статистики Locust с итогами по классам пользователей смеси (имя записи — класс).
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+MIX_CLASS_TYPE = "Mix class"
+
+
+@dataclass
+class MixEntry:
+    """
+    Класс пользователей в составе смеси.
+
+    :param user: Класс пользователей сценария (*ScenarioUser).
+    :param weight: Вес класса при распределении пользователей (--users) между классами.
+    :param arrival_rate: Открытая модель нагрузки для класса (итераций в секунду или конфиг);
+                         None — класс работает в закрытой модели, как в своём сценарии.
+    :param name: Имя класса в смеси и статистике (по умолчанию — имя исходного класса).
+    """
+    user: type[User]
+    weight: int = 1
+    arrival_rate: ArrivalRateConfig | float | None = None
+    name: str | None = None
+
+
+class ScenarioEnvironment:
+    """
+    Окружение Locust с собственными данными сценария.
+
+    Сценарии сохраняют результат сидинга в environment.seeds, поэтому в смеси каждый класс
+    получает своё представление окружения: seeds (и другие атрибуты, заданные подготовкой сценария)
+    хранятся в нём, всё остальное берётся из общего окружения.
+    """
+
+    def __init__(self, environment: Environment):
+        self.environment = environment
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.environment, name)
+
+
+class MixUserMixin:
+    """
+    Примесь к классам пользователей смеси: подставляет окружение класса
+    и помечает запросы пользователя именем класса для статистики по классам.
+    """
+
+    mix_environments: dict[str, ScenarioEnvironment] = {}
+
+    def __init__(self, environment: Environment):
+        super().__init__(self.mix_environments.get(type(self).__name__, environment))
+
+    def run(self):
+        token = set_request_context(mix_class=type(self).__name__)
+        try:
+            super().run()
+        finally:
+            reset_request_context(token)
+
+
+# Классы смеси, снятые с events.init подготовки сценариев (по модулям) и подготовки каждого класса
+_mix_users: dict[str, type[User]] = {}
+_scenario_inits: dict[str, Callable] = {}
+_mix_inits: dict[str, tuple[Callable, ...]] = {}
+
+# Окружение запуска (для статистики по классам в обработчике events.request)
+_environment: Environment | None = None
+
+
+def get_scenario_modules(user: type[User]) -> set[str]:
+    """
+    Возвращает модули сценариев (пакет scenarios), в которых определены класс пользователей и его TaskSet.
+
+    :param user: Класс пользователей сценария.
+    :return: Имена модулей.
+    """
+    classes = [*user.__mro__, *(klass for task in user.tasks if isinstance(task, type) for klass in task.__mro__)]
+    return {klass.__module__ for klass in classes if klass.__module__.startswith("scenarios.")}
+
+
+def build_mix_users(entries: list[MixEntry]) -> dict[str, type[User]]:
+    """
+    Создаёт классы пользователей смеси из классов существующих сценариев.
+
+    Подготовка данных сценариев (функции init их модулей, подписанные на events.init) снимается
+    с общего события и выполняется для каждого сценария отдельно, со своим ScenarioEnvironment —
+    так сиды всех сценариев загружаются одновременно и не перезаписывают друг друга.
+
+    Результат нужно поместить в глобальное пространство locustfile:
+        globals().update(build_mix_users([...]))
+
+    :param entries: Классы смеси.
+    :return: Словарь {имя класса: класс}.
+    """
+    for entry in entries:
+        name = entry.name or entry.user.__name__
+        modules = get_scenario_modules(entry.user)
+        for module in modules:
+            init = getattr(sys.modules[module], "init", None)
+            if module in _scenario_inits or not callable(init):
+                continue
+
+            try:
+                events.init.remove_listener(init)
+            except ValueError:
+                # Функция init модуля не подписана на events.init
+                continue
+            _scenario_inits[module] = init
+
+        if entry.arrival_rate is None:
+            base, attributes = entry.user, {"weight": entry.weight}
+        else:
+            arrival_rate = entry.arrival_rate
+            if not isinstance(arrival_rate, ArrivalRateConfig):
+                arrival_rate = ArrivalRateConfig(rate=arrival_rate)
+            base = LocustArrivalRateUser
+            attributes = {"weight": entry.weight, "tasks": entry.user.tasks, "arrival_rate": arrival_rate}
+
+        _mix_users[name] = type(name, (MixUserMixin, base), attributes)
+        _mix_inits[name] = tuple(_scenario_inits[module] for module in sorted(modules) if module in _scenario_inits)
+
+    return dict(_mix_users)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--mix-weights",
+        default="{}",
+        env_var="LOCUST_MIX_WEIGHTS",
+        help="Веса классов смеси в виде JSON, например {\"GetOperationsScenarioUser\": 3}",
+    )
+    parser.add_argument(
+        "--mix-arrival-rates",
+        default="{}",
+        env_var="LOCUST_MIX_ARRIVAL_RATES",
+        help="Интенсивность (итераций в секунду) классов смеси с открытой моделью в виде JSON",
+    )
+
+
+@events.init.add_listener
+def on_init(environment: Environment, **kwargs):
+    global _environment
+    if not _mix_users:
+        return
+
+    _environment = environment
+    options = environment.parsed_options
+    for name, weight in json.loads(getattr(options, "mix_weights", "{}")).items():
+        _mix_users[name].weight = weight
+    for name, rate in json.loads(getattr(options, "mix_arrival_rates", "{}")).items():
+        if not issubclass(_mix_users[name], LocustArrivalRateUser):
+            logger.warning(f"{name} runs in the closed model, arrival rate ignored")
+            continue
+        _mix_users[name].arrival_rate = _mix_users[name].arrival_rate.model_copy(update={"rate": rate})
+
+    # Каждая подготовка сценария выполняется один раз; классы с общей подготовкой делят окружение
+    prepared: dict[tuple[Callable, ...], ScenarioEnvironment] = {}
+    for name, inits in _mix_inits.items():
+        if inits not in prepared:
+            prepared[inits] = ScenarioEnvironment(environment)
+            for handler in inits:
+                handler(environment=prepared[inits], **kwargs)
+
+        MixUserMixin.mix_environments[name] = prepared[inits]
+
+    logger.info(
+        "Mix: " + ", ".join(
+            f"{name} (weight {user.weight}"
+            + (f", {user.arrival_rate.rate:g} it/s)" if issubclass(user, LocustArrivalRateUser) else ")")
+            for name, user in _mix_users.items()
+        )
+    )
+
+
+@events.request.add_listener
+def on_request(
+        response_time: float,
+        response_length: int,
+        exception: Exception | None,
+        context: dict | None,
+        **kwargs
+):
+    if _environment is None or not context or "mix_class" not in context:
+        return
+
+    entry = _environment.stats.get(context["mix_class"], MIX_CLASS_TYPE)
+    entry.log(response_time, response_length)
+    record_latency(MIX_CLASS_TYPE, context["mix_class"], response_time)
+    if exception is not None:
+        entry.log_error(exception)
+
+
+@events.quitting.add_listener
+def on_quitting(environment: Environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or not _mix_users:
+        return
+
+    total = environment.stats.total.num_requests or 1
+    lines = []
+    for name in _mix_users:
+        entry = environment.stats.entries.get((name, MIX_CLASS_TYPE))
+        if entry is None:
+            continue
+
+        lines.append(
+            f"{name}: {entry.num_requests} requests ({entry.num_requests / total:.1%}), "
+            f"{entry.total_rps:.1f} RPS, p95 {entry.get_response_time_percentile(0.95):g} ms, "
+            f"p99 {entry.get_response_time_percentile(0.99):g} ms, failures {entry.fail_ratio:.2%}"
+        )
+
+    if lines:
+        logger.info("Mix summary by class:\n" + "\n".join(lines))
@@ -1,6 +1,17 @@
 from locust import User, between
 
 from config import settings  # ← импорт глобального объекта настроек
+# Подключает гистограммы задержек (точные высокие перцентили) ко всем сценариям
+import tools.metrics.histograms  # noqa: F401
+# Подключает учёт процессорного времени генератора нагрузки ко всем сценариям
+import tools.metrics.generator  # noqa: F401
+# Подключает профили нагрузки и поиск точки насыщения (load-shape в v1.0.conf) ко всем сценариям
+import tools.load_shapes  # noqa: F401
+import tools.saturation  # noqa: F401
+# Подключает подбор моделей USL/Амдала по плато нагрузки (отчёт рядом с HTML-отчётом Locust)
+import tools.capacity  # noqa: F401
+# Подключает локальный mock gateway (--mock-gateway) ко всем сценариям
+import tools.mock.locust  # noqa: F401
 
 
 class LocustBaseUser(User):
@@ -0,0 +1,138 @@
+import time
+from typing import Callable, Iterator
+
+import gevent
+from locust import events
+from locust.env import Environment
+from locust.stats import StatsError
+
+from clients.gateway.locust import PROTOCOLS
+from config import settings
+from tools.config.visibility import VisibilityProbeConfig
+from tools.logger import get_logger
+from tools.metrics.counters import get_counters
+from tools.metrics.histograms import record_latency
+
+logger = get_logger("VISIBILITY")
+
+# Пробы, ставшие видимыми и потерянные записи, опросы и ошибки чтения по именам проб
+counters = get_counters("visibility")
+
+# Тип записей статистики Locust с задержкой видимости записи для чтения (мс).
+# Записи ведутся напрямую в environment.stats и не попадают в Aggregated
+VISIBILITY_LAG_TYPE = "Visibility lag"
+
+
+class VisibilityTimeoutError(Exception):
+    """
+    Запись не стала видимой для чтения за VISIBILITY_PROBE.TIMEOUT.
+    """
+
+
+class VisibilityProbe:
+    """
+    Проба согласованности «запись → чтение».
+
+    После записи (например, операции покупки) проба опрашивает чтение, пока запись не станет видимой,
+    и пишет задержку в записи статистики "Visibility lag" и точные гистограммы. Задержка считается
+    от завершения записи до завершения первого успешного чтения, поэтому это оценка сверху:
+    погрешность не больше последней паузы между опросами и времени одного чтения.
+
+    Паузы растут экспоненциально от delay до max_delay. Первый опрос откладывается
+    на adaptive_start от скользящего среднего задержки: под нагрузкой, когда задержка растёт,
+    проба не засыпает чтение заведомо пустыми опросами.
+    """
+
+    def __init__(self, environment: Environment, config: VisibilityProbeConfig | None = None):
+        """
+        :param environment: Окружение Locust.
+        :param config: Настройки пробы (по умолчанию — settings.visibility_probe).
+        """
+        self.environment = environment
+        self.config = config or settings.visibility_probe
+        self.average_lag: float | None = None
+
+    def get_delays(self) -> Iterator[float]:
+        """
+        Возвращает паузы перед очередными опросами, в секундах.
+        """
+        delay = self.config.delay
+        if self.average_lag is not None:
+            yield max(delay, self.average_lag * self.config.adaptive_start)
+        else:
+            yield delay
+
+        while True:
+            delay = min(delay * self.config.multiplier, self.config.max_delay)
+            yield delay
+
+    def update_average(self, lag: float) -> None:
+        if self.average_lag is None:
+            self.average_lag = lag
+        else:
+            self.average_lag += self.config.smoothing * (lag - self.average_lag)
+
+    def wait(self, name: str, check: Callable[[], bool]) -> float | None:
+        """
+        Опрашивает чтение, пока запись не станет видимой. Вызывается сразу после завершения записи.
+
+        Ошибки чтения не прерывают пробу: сами запросы уже учтены в статистике клиентом,
+        а проба продолжает опрос до видимости или таймаута.
+
+        :param name: Имя пробы в статистике (например, "make_purchase_operation (http → grpc)").
+        :param check: Чтение: возвращает True, когда запись видна.
+        :return: Задержка видимости в секундах или None, если запись не стала видимой за timeout.
+        """
+        written_at = time.monotonic()
+        deadline = written_at + self.config.timeout
+        entry = self.environment.stats.get(name, VISIBILITY_LAG_TYPE)
+        counters.inc(name, "probes")
+
+        for delay in self.get_delays():
+            gevent.sleep(max(min(delay, deadline - time.monotonic()), 0))
+
+            counters.inc(name, "polls")
+            try:
+                visible = check()
+            except Exception as error:
+                counters.inc(name, "read_errors")
+                logger.debug(f"{name}: read failed: {error!r}")
+                visible = False
+
+            now = time.monotonic()
+            if visible:
+                lag = now - written_at
+                entry.log(lag * 1000, 0)
+                record_latency(VISIBILITY_LAG_TYPE, name, lag * 1000)
+                counters.inc(name, "visible")
+                self.update_average(lag)
+                return lag
+
+            if now >= deadline:
+                break
+
+        # Потерянная запись учитывается как неуспешный замер с задержкой до таймаута
+        # и попадает в таблицу ошибок отчёта (как и сама запись — без учёта в Aggregated)
+        lag = time.monotonic() - written_at
+        error = VisibilityTimeoutError(f"Not visible after {self.config.timeout:g}s")
+        entry.log(lag * 1000, 0)
+        record_latency(VISIBILITY_LAG_TYPE, name, lag * 1000)
+        entry.log_error(error)
+        key = StatsError.create_key(VISIBILITY_LAG_TYPE, name, error)
+        if key not in self.environment.stats.errors:
+            self.environment.stats.errors[key] = StatsError(VISIBILITY_LAG_TYPE, name, error)
+        self.environment.stats.errors[key].occurred()
+
+        counters.inc(name, "timeouts")
+        return None
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--read-protocol",
+        choices=PROTOCOLS,
+        default=None,
+        env_var="LOCUST_READ_PROTOCOL",
+        help="Протокол чтения в пробе видимости (по умолчанию — --protocol), например запись по HTTP, чтение по gRPC",
+    )